@@ -7,9 +7,11 @@ Hybrid approach:
 3. Diminishing returns formula prevents scores from exceeding 100
 """
 
+import asyncio
 import logging
 import json
-from typing import List, Dict, Any
+from collections import Counter
+from typing import List, Dict, Any, Optional
 from openai import AsyncOpenAI
 
 from ..config import settings
@@ -41,6 +43,9 @@ class MessagePrioritizer:
         """
         self.cache = CacheService()
         
+        # Running count of categories assigned by this prioritizer
+        self.category_counts: Counter = Counter()
+        
         # Load preferences: passed in > database > env file fallback
         if user_preferences:
             self.user_preferences = user_preferences
@@ -60,10 +65,13 @@ class MessagePrioritizer:
         
         logger.info(f"📋 Loaded preferences: VIPs={self.vip_people}, Priority={self.priority_channels}, Muted={self.muted_channels}")
     
-    async def prioritize_new_messages(self) -> Dict[str, Any]:
+    async def prioritize_new_messages(self, message_ids: Optional[List[str]] = None) -> Dict[str, Any]:
         """
         Prioritize all unprocessed messages in the database.
         
+        Args:
+            message_ids: Only prioritize these Slack message IDs (None = all unprocessed)
+        
         Returns:
             Dict with prioritization stats
         """
@@ -71,7 +79,8 @@ class MessagePrioritizer:
         
         # Get unprocessed messages
         messages = self.cache.get_unprocessed_messages(
-            limit=settings.MAX_MESSAGES_PER_SYNC
+            limit=settings.MAX_MESSAGES_PER_SYNC,
+            message_ids=message_ids
         )
         
         if not messages:
@@ -104,6 +113,7 @@ class MessagePrioritizer:
                     model_name=settings.PRIORITIZATION_MODEL
                 )
                 saved_count += 1
+                self.category_counts[msg['category']] += 1
             except Exception as e:
                 logger.error(f"❌ Error saving insight for message {msg['db_id']}: {e}")
                 errors.append({
@@ -119,6 +129,39 @@ class MessagePrioritizer:
             "errors": errors
         }
     
+    async def consume(self, queue: asyncio.Queue) -> Dict[str, Any]:
+        """
+        Prioritize messages as a producer (e.g. SlackIngester) saves them.
+        
+        Each item on the queue is a list of newly saved messages; None means
+        the producer is done. Items that pile up while an AI call is running
+        are coalesced into the next prioritization pass.
+        
+        Args:
+            queue: Queue fed by the producer
+            
+        Returns:
+            Dict with prioritization stats (same shape as prioritize_new_messages)
+        """
+        totals = {"total_messages": 0, "prioritized": 0, "errors": []}
+        done = False
+        
+        while not done:
+            item = await queue.get()
+            done = item is None
+            
+            # Drain anything else that's already waiting
+            while not queue.empty():
+                if await queue.get() is None:
+                    done = True
+            
+            result = await self.prioritize_new_messages()
+            totals["total_messages"] += result["total_messages"]
+            totals["prioritized"] += result["prioritized"]
+            totals["errors"].extend(result["errors"])
+        
+        return totals
+    
     async def prioritize_batch(
         self,
         messages: List[Dict[str, Any]],
@@ -498,7 +541,7 @@ Return exactly {message_count} priorities.
             if adjustments:
                 adjustment_str = ", ".join(adjustments)
                 reason = f"{reason} [Adjusted: {adjustment_str}, base={base_score}→{final_score}]"
-                logger.debug(f"   📊 {user_name} in #{channel_name}: {base_score} → {final_score} ({adjustment_str})")
+                logger.debug("   📊 %s in #%s: %s → %s (%s)", user_name, channel_name, base_score, final_score, adjustment_str)
             
             # Update category based on final score
             category = self._score_to_category(final_score)
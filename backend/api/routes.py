@@ -2,8 +2,12 @@
 FastAPI routes for Slack Intelligence API.
 """
 
+import asyncio
+import json
 import logging
-from fastapi import APIRouter, HTTPException, Query, Form
+import time
+from fastapi import APIRouter, HTTPException, Query, Form, Request
+from fastapi.responses import StreamingResponse
 from typing import List, Optional
 
 logger = logging.getLogger(__name__)
@@ -12,6 +16,8 @@ from .schemas import (
     SmartInboxResponse,
     MessageDetail,
     SyncResponse,
+    PrioritizeBatchRequest,
+    PrioritizeBatchResponse,
     SearchResponse,
     StatsResponse
 )
@@ -94,6 +100,57 @@ async def get_smart_inbox(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/inbox/stream")
+async def stream_inbox(
+    request: Request,
+    view: str = Query(
+        "needs_response",
+        description="Inbox view",
+        enum=["needs_response", "high_priority", "fyi", "low_priority"]
+    ),
+    hours_ago: int = Query(24, ge=1, le=168, description="Time window in hours"),
+    limit: int = Query(10, ge=1, le=200, description="Max messages per check"),
+    poll_seconds: int = Query(5, ge=1, le=60, description="How often the database is checked")
+):
+    """
+    Stream newly prioritized messages as Server-Sent Events.
+    
+    Each `messages` event carries a JSON list of messages that appeared in
+    the view since the previous event (the first event has everything
+    currently in the view). Clients keep one connection open instead of
+    polling `/inbox`.
+    
+    **Example:**
+    ```
+    curl -N 'http://localhost:8000/api/slack/inbox/stream?view=needs_response'
+    ```
+    """
+    async def events():
+        seen = set()
+        while not await request.is_disconnected():
+            messages = await asyncio.to_thread(
+                cache_service.get_messages_by_category,
+                category=view,
+                hours_ago=hours_ago,
+                limit=limit
+            )
+            new = [m for m in messages if m['id'] not in seen]
+            seen = {m['id'] for m in messages}
+            
+            if new:
+                yield f"event: messages\ndata: {json.dumps(new, default=str)}\n\n"
+            else:
+                yield ": keep-alive\n\n"
+            
+            await asyncio.sleep(poll_seconds)
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"}
+    )
+
+
 @router.post("/sync", response_model=SyncResponse)
 async def sync_messages(
     channel_ids: Optional[List[str]] = Query(None, description="Specific channels to sync"),
@@ -123,6 +180,50 @@ async def sync_messages(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/prioritize_batch", response_model=PrioritizeBatchResponse)
+async def prioritize_batch(request: PrioritizeBatchRequest):
+    """
+    Save the given messages, prioritize them, and return them scored.
+    
+    For callers that already have the messages (e.g. the simulation runner),
+    so there's no separate insert followed by a full /sync that re-fetches
+    every channel from Slack, and no follow-up /inbox query for the results.
+    Only the posted messages are prioritized; other unprocessed messages in
+    the database are left for the next /sync.
+    
+    **Example:**
+    ```
+    POST /api/slack/prioritize_batch
+    {"messages": [{"message_id": "sim_1", "channel_id": "C_SIM", "text": "...", "timestamp": "2025-01-01T09:00:00"}]}
+    ```
+    """
+    try:
+        start_time = time.time()
+        rows = [m.model_dump() for m in request.messages]
+        saved = await asyncio.to_thread(cache_service.save_batch_messages, rows)
+        # Only the posted batch - other unprocessed rows are left for /sync
+        result = await sync_service.prioritizer.prioritize_new_messages(
+            message_ids=[row["message_id"] for row in rows]
+        )
+        
+        # Hand back the scored messages so callers don't need a follow-up /inbox query
+        messages = await asyncio.to_thread(
+            cache_service.get_messages_by_slack_ids,
+            [row["message_id"] for row in rows]
+        )
+        
+        return {
+            "status": "partial" if result["errors"] else "success",
+            "duration_seconds": time.time() - start_time,
+            "saved": saved,
+            "prioritization": result,
+            "messages": messages
+        }
+        
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get("/stats", response_model=StatsResponse)
 async def get_stats():
     """
@@ -148,6 +249,7 @@ async def root():
         "endpoints": {
             "inbox": "/api/slack/inbox",
             "sync": "/api/slack/sync",
+            "prioritize_batch": "/api/slack/prioritize_batch",
             "stats": "/api/slack/stats",
             "exa_detect": "/api/slack/integrations/exa/detect",
             "exa_research": "/api/slack/integrations/exa/research",
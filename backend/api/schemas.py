@@ -13,7 +13,7 @@ class MessageDetail(BaseModel):
     message_id: str
     channel_id: str
     channel_name: Optional[str]
-    user_id: str
+    user_id: Optional[str]
     user_name: Optional[str]
     text: str
     timestamp: Optional[str]
@@ -66,6 +66,33 @@ class SyncResponse(BaseModel):
     timestamp: str
 
 
+class BatchMessage(BaseModel):
+    """A message supplied directly by the caller instead of fetched from Slack"""
+    message_id: str
+    channel_id: str
+    channel_name: Optional[str] = None
+    user_id: Optional[str] = None
+    user_name: Optional[str] = None
+    text: str
+    timestamp: datetime
+    thread_ts: Optional[str] = None
+    is_thread_parent: bool = False
+
+
+class PrioritizeBatchRequest(BaseModel):
+    """Request body for the batch prioritization endpoint"""
+    messages: List[BatchMessage]
+
+
+class PrioritizeBatchResponse(BaseModel):
+    """Response for the batch prioritization endpoint"""
+    status: str
+    duration_seconds: float
+    saved: int
+    prioritization: PrioritizationStats
+    messages: List[MessageDetail]
+
+
 class SearchResponse(BaseModel):
     """Response for search endpoint"""
     query: str
@@ -60,7 +60,7 @@ class CacheService:
             ).first()
             
             if existing:
-                logger.debug(f"Message {message_data['message_id']} already exists")
+                logger.debug("Message %s already exists", message_data['message_id'])
                 return existing.id
             
             # Create new message
@@ -69,7 +69,7 @@ class CacheService:
             db.commit()
             db.refresh(message)
             
-            logger.debug(f"💾 Saved message {message.message_id}")
+            logger.debug("💾 Saved message %s", message.message_id)
             return message.id
             
         except Exception as e:
@@ -168,7 +168,7 @@ class CacheService:
             db.commit()
             db.refresh(insight)
             
-            logger.debug(f"💡 Saved insight for message {message_id}: score={priority_score}")
+            logger.debug("💡 Saved insight for message %s: score=%s", message_id, priority_score)
             return insight.id
             
         except Exception as e:
@@ -179,21 +179,29 @@ class CacheService:
             db.close()
     
     @staticmethod
-    def get_unprocessed_messages(limit: int = 100) -> List[SlackMessage]:
+    def get_unprocessed_messages(
+        limit: int = 100,
+        message_ids: Optional[List[str]] = None
+    ) -> List[SlackMessage]:
         """
         Get messages that haven't been prioritized yet.
         
         Args:
             limit: Maximum messages to return
+            message_ids: Only consider these Slack message IDs (None = all)
             
         Returns:
             List of SlackMessage objects
         """
         db = SessionLocal()
         try:
-            messages = db.query(SlackMessage).filter(
+            query = db.query(SlackMessage).filter(
                 SlackMessage.processed_at.is_(None)
-            ).order_by(
+            )
+            if message_ids is not None:
+                query = query.filter(SlackMessage.message_id.in_(message_ids))
+            
+            messages = query.order_by(
                 SlackMessage.timestamp.desc()
             ).limit(limit).all()
             
@@ -222,6 +230,30 @@ class CacheService:
         finally:
             db.close()
     
+    @staticmethod
+    def get_messages_by_slack_ids(message_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Get messages by their Slack message IDs, highest priority first.
+        
+        Args:
+            message_ids: Slack message IDs (message_id column)
+            
+        Returns:
+            List of message dictionaries
+        """
+        db = SessionLocal()
+        try:
+            messages = db.query(SlackMessage).filter(
+                SlackMessage.message_id.in_(message_ids)
+            ).order_by(
+                SlackMessage.priority_score.desc(),
+                SlackMessage.timestamp.desc()
+            ).all()
+            
+            return [CacheService._message_to_dict(msg) for msg in messages]
+        finally:
+            db.close()
+    
     @staticmethod
     def archive_message(message_id: int) -> bool:
         """
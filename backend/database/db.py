@@ -3,7 +3,7 @@ Database connection and session management.
 """
 
 import logging
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
@@ -18,6 +18,16 @@ engine = create_engine(
     echo=settings.DEBUG
 )
 
+
+if engine.dialect.name == "sqlite":
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_conn, _connection_record):
+        # Lets prefix filters like message_id LIKE 'demo_%' use the message_id
+        # index instead of scanning the table (all our LIKEs are on IDs)
+        cursor = dbapi_conn.cursor()
+        cursor.execute("PRAGMA case_sensitive_like = ON")
+        cursor.close()
+
 # Create SessionLocal class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
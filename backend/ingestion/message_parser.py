@@ -4,14 +4,49 @@ Converts raw Slack JSON into our database format.
 """
 
 import logging
+import time
+from collections import OrderedDict
 from datetime import datetime, timezone
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
 
 logger = logging.getLogger(__name__)
 
 
+class _TTLCache:
+    """Small LRU cache whose entries expire, so renamed users/channels get picked up"""
+    
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+    
+    def get(self, key: str) -> Optional[str]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        stored_at, value = entry
+        if time.monotonic() - stored_at > self.ttl:
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+    
+    def set(self, key: str, value: str):
+        self._data[key] = (time.monotonic(), value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+
+# Lookup caches shared by every parser instance, so a fresh SyncService (per
+# event, per scheduled job, per demo run) starts warm. Bounded, and entries
+# expire after an hour so the long-running server sees renames.
+_user_name_cache = _TTLCache(maxsize=4096, ttl=3600)
+_channel_name_cache = _TTLCache(maxsize=4096, ttl=3600)
+
+
 class MessageParser:
     """Parses Slack API responses into structured message data"""
     
@@ -23,8 +58,8 @@ class MessageParser:
             slack_client: Slack WebClient for enriching data
         """
         self.client = slack_client
-        self._user_cache = {}  # Cache user info
-        self._channel_cache = {}  # Cache channel info
+        self._user_cache = _user_name_cache  # Cache user info
+        self._channel_cache = _channel_name_cache  # Cache channel info
     
     async def parse_message(
         self,
@@ -170,8 +205,9 @@ class MessageParser:
         Returns:
             User's display name or user ID if lookup fails
         """
-        if user_id in self._user_cache:
-            return self._user_cache[user_id]
+        cached = self._user_cache.get(user_id)
+        if cached is not None:
+            return cached
         
         try:
             result = self.client.users_info(user=user_id)
@@ -185,7 +221,7 @@ class MessageParser:
                 user_id
             )
             
-            self._user_cache[user_id] = name
+            self._user_cache.set(user_id, name)
             return name
             
         except SlackApiError as e:
@@ -203,8 +239,9 @@ class MessageParser:
         Returns:
             Channel name or channel ID if lookup fails
         """
-        if channel_id in self._channel_cache:
-            return self._channel_cache[channel_id]
+        cached = self._channel_cache.get(channel_id)
+        if cached is not None:
+            return cached
         
         try:
             result = self.client.conversations_info(channel=channel_id)
@@ -212,7 +249,7 @@ class MessageParser:
             
             name = channel.get('name') or channel.get('id') or channel_id
             
-            self._channel_cache[channel_id] = name
+            self._channel_cache.set(channel_id, name)
             return name
             
         except SlackApiError as e:
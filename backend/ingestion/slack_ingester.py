@@ -3,6 +3,7 @@ Slack message ingestion module.
 Fetches messages from Slack API and stores in database.
 """
 
+import asyncio
 import logging
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
@@ -29,7 +30,8 @@ class SlackIngester:
     async def sync_channels(
         self,
         channel_ids: Optional[List[str]] = None,
-        hours_ago: int = None
+        hours_ago: int = None,
+        queue: Optional[asyncio.Queue] = None
     ) -> Dict[str, Any]:
         """
         Sync messages from specified channels.
@@ -37,6 +39,9 @@ class SlackIngester:
         Args:
             channel_ids: List of channel IDs (None = all joined channels)
             hours_ago: How far back to fetch (None = use config default)
+            queue: If given, each channel's new messages are saved as soon as
+                they're fetched and put on the queue (None is put when done),
+                so a consumer can process them while other channels fetch
             
         Returns:
             Dict with sync stats
@@ -45,13 +50,6 @@ class SlackIngester:
         
         logger.info(f"🔄 Starting Slack sync (past {hours_ago}h)...")
         
-        # Get channel list if not specified
-        if not channel_ids:
-            channel_ids = await self._get_joined_channels()
-        
-        # Calculate time threshold
-        oldest_ts = (datetime.now() - timedelta(hours=hours_ago)).timestamp()
-        
         all_messages = []
         stats = {
             "channels_synced": 0,
@@ -61,44 +59,59 @@ class SlackIngester:
             "errors": []
         }
         
-        # Fetch from each channel
-        for channel_id in channel_ids:
-            try:
-                logger.info(f"   📥 Fetching from {channel_id}...")
-                
-                messages = await self._fetch_channel_messages(
-                    channel_id,
-                    oldest_ts
-                )
-                
-                # Check cache and filter new messages
-                new_messages = []
-                for msg in messages:
-                    if not self.cache.message_exists(msg['message_id'], msg['channel_id']):
-                        new_messages.append(msg)
+        # Everything runs inside the try so the consumer always gets its sentinel,
+        # even if listing channels fails with a non-Slack error (timeout, etc.)
+        try:
+            # Get channel list if not specified
+            if not channel_ids:
+                channel_ids = await self._get_joined_channels()
+            
+            # Calculate time threshold
+            oldest_ts = (datetime.now() - timedelta(hours=hours_ago)).timestamp()
+            
+            # Fetch from each channel
+            for channel_id in channel_ids:
+                try:
+                    logger.info(f"   📥 Fetching from {channel_id}...")
+                    
+                    messages = await self._fetch_channel_messages(
+                        channel_id,
+                        oldest_ts
+                    )
+                    
+                    # Check cache and filter new messages (DB lookups off the event loop)
+                    new_messages = await asyncio.to_thread(self._filter_new_messages, messages)
+                    stats["skipped_cached"] += len(messages) - len(new_messages)
+                    
+                    if queue is not None and new_messages:
+                        # Save now so the consumer can pick these up immediately
+                        await asyncio.to_thread(self.cache.save_batch_messages, new_messages)
+                        await queue.put(new_messages)
+                    
+                    all_messages.extend(new_messages)
+                    stats["channels_synced"] += 1
+                    stats["messages_fetched"] += len(messages)
+                    stats["new_messages"] += len(new_messages)
+                    
+                    if new_messages:
+                        logger.info(f"   ✅ {channel_id}: {len(new_messages)} new messages")
                     else:
-                        stats["skipped_cached"] += 1
-                
-                all_messages.extend(new_messages)
-                stats["channels_synced"] += 1
-                stats["messages_fetched"] += len(messages)
-                stats["new_messages"] += len(new_messages)
-                
-                if new_messages:
-                    logger.info(f"   ✅ {channel_id}: {len(new_messages)} new messages")
-                else:
-                    logger.info(f"   ℹ️  {channel_id}: No new messages")
-                
-            except SlackApiError as e:
-                logger.error(f"   ❌ Error fetching {channel_id}: {e}")
-                stats["errors"].append({
-                    "channel": channel_id,
-                    "error": str(e)
-                })
+                        logger.info(f"   ℹ️  {channel_id}: No new messages")
+                    
+                except SlackApiError as e:
+                    logger.error(f"   ❌ Error fetching {channel_id}: {e}")
+                    stats["errors"].append({
+                        "channel": channel_id,
+                        "error": str(e)
+                    })
         
-        # Save new messages to database
-        if all_messages:
-            saved_count = self.cache.save_batch_messages(all_messages)
+        finally:
+            if queue is not None:
+                await queue.put(None)  # Tell the consumer we're done
+        
+        # Save new messages to database (already saved per channel when streaming)
+        if all_messages and queue is None:
+            saved_count = await asyncio.to_thread(self.cache.save_batch_messages, all_messages)
             logger.info(f"💾 Saved {saved_count} messages to database")
         
         logger.info(f"✅ Sync complete: {stats['new_messages']} new messages from {stats['channels_synced']} channels")
@@ -107,6 +120,13 @@ class SlackIngester:
             "stats": stats
         }
     
+    def _filter_new_messages(self, messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Messages not already in the database (blocking - run in a thread)"""
+        return [
+            msg for msg in messages
+            if not self.cache.message_exists(msg['message_id'], msg['channel_id'])
+        ]
+    
     async def _fetch_channel_messages(
         self,
         channel_id: str,
@@ -129,7 +149,9 @@ class SlackIngester:
         
         while page_count < max_pages:
             try:
-                result = self.bot_client.conversations_history(
+                # Run the blocking HTTP call in a thread so it doesn't stall the event loop
+                result = await asyncio.to_thread(
+                    self.bot_client.conversations_history,
                     channel=channel_id,
                     oldest=str(oldest_ts),
                     limit=200,  # Max per page
@@ -140,7 +162,7 @@ class SlackIngester:
                 messages.extend(batch)
                 page_count += 1
                 
-                logger.debug(f"      Fetched page {page_count}: {len(batch)} messages")
+                logger.debug("      Fetched page %d: %d messages", page_count, len(batch))
                 
                 # Check if more pages
                 if not result.get('has_more'):
@@ -8,6 +8,8 @@ from typing import Optional, List, Dict, Any
 import httpx
 from datetime import datetime
 
+from ..rate_limiter import AsyncTokenBucket
+
 logger = logging.getLogger(__name__)
 
 
@@ -83,12 +85,17 @@ class NotionClient:
             "Content-Type": "application/json"
         }
     
-    async def create_task(self, task: Dict[str, str]) -> Optional[str]:
+    async def create_task(
+        self,
+        task: Dict[str, str],
+        http: Optional[httpx.AsyncClient] = None
+    ) -> Optional[str]:
         """
         Create a task in Notion database.
         
         Args:
             task: Task dict with title and description
+            http: Shared HTTP client to reuse (a new one is opened if None)
             
         Returns:
             Task ID if successful, None otherwise
@@ -154,13 +161,21 @@ class NotionClient:
                 }
             }
             
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
+            if http is not None:
+                response = await http.post(
                     f"{self.base_url}/pages",
                     json=payload,
                     headers=self.headers,
                     timeout=10.0
                 )
+            else:
+                async with httpx.AsyncClient() as client:
+                    response = await client.post(
+                        f"{self.base_url}/pages",
+                        json=payload,
+                        headers=self.headers,
+                        timeout=10.0
+                    )
             
             if response.status_code == 200:
                 result = response.json()
@@ -333,6 +348,8 @@ class NotionClient:
 class NotionSyncService:
     """Service to sync Slack message insights to Notion"""
     
+    MAX_CONCURRENT_CREATES = 8
+    
     def __init__(self, api_key: Optional[str] = None, database_id: Optional[str] = None):
         """
         Initialize Notion sync service.
@@ -351,12 +368,17 @@ class NotionSyncService:
             self.extractor = None
             logger.info("ℹ️  Notion integration disabled (no API key configured)")
     
-    async def sync_messages_to_notion(self, messages: List[Dict[str, Any]]) -> Dict[str, Any]:
+    async def sync_messages_to_notion(
+        self,
+        messages: List[Dict[str, Any]],
+        http: Optional[httpx.AsyncClient] = None
+    ) -> Dict[str, Any]:
         """
         Sync high-priority messages to Notion as tasks.
         
         Args:
             messages: List of message dicts to process
+            http: Shared HTTP client to reuse (a pooled one is opened if None)
             
         Returns:
             Sync results dict
@@ -369,35 +391,41 @@ class NotionSyncService:
                 'errors': 0
             }
         
-        created = 0
-        skipped = 0
-        errors = 0
-        
         logger.info(f"🔄 Syncing {len(messages)} messages to Notion...")
         
-        for message in messages:
+        # Up to MAX_CONCURRENT_CREATES requests in flight, paced to Notion's ~3 req/s
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_CREATES)
+        bucket = AsyncTokenBucket(capacity=3, rate=3.0)
+        
+        async def sync_one(message: Dict[str, Any], http: httpx.AsyncClient) -> str:
             try:
                 # Extract task from message
                 task = self.extractor.extract_task_from_message(message)
                 
                 if task is None:
-                    skipped += 1
-                    continue
+                    return 'skipped'
                 
                 # Create task in Notion
-                task_id = await self.client.create_task(task)
-                
-                if task_id:
-                    created += 1
-                else:
-                    errors += 1
+                async with semaphore:
+                    await bucket.acquire()
+                    task_id = await self.client.create_task(task, http=http)
                 
-                # Rate limit: 3 requests per second for Notion
-                await asyncio.sleep(0.4)
+                return 'created' if task_id else 'error'
                 
             except Exception as e:
                 logger.error(f"❌ Error syncing message: {e}")
-                errors += 1
+                return 'error'
+        
+        # One connection pool shared by every page create in this batch
+        if http is not None:
+            outcomes = await asyncio.gather(*(sync_one(m, http) for m in messages))
+        else:
+            async with httpx.AsyncClient(limits=httpx.Limits(max_connections=16)) as client:
+                outcomes = await asyncio.gather(*(sync_one(m, client) for m in messages))
+        
+        created = outcomes.count('created')
+        skipped = outcomes.count('skipped')
+        errors = outcomes.count('error')
         
         result = {
             'status': 'success' if errors == 0 else 'partial',
@@ -0,0 +1,89 @@
+"""
+Rate limiting helpers for outbound API calls (Slack, Notion, OpenAI).
+"""
+
+import asyncio
+from typing import Any, Optional
+
+from slack_sdk.errors import SlackApiError
+
+
+class AsyncTokenBucket:
+    """
+    Async token bucket limiter.
+
+    Bursts up to `capacity` calls go through immediately, then calls are
+    paced at `rate` per second. Call `on_rate_limited()` when the API
+    returns a 429 to halve the rate, and `on_success()` to let it drift
+    back toward the configured rate.
+    """
+
+    DECREASE_FACTOR = 0.5   # Multiply rate by this on a 429
+    INCREASE_FACTOR = 1.1   # Multiply rate by this on success (capped at default)
+    MIN_RATE = 0.1          # Never slow below one call per 10 seconds
+
+    def __init__(self, capacity: float = 1, rate: float = 1.0):
+        self.capacity = capacity
+        self.rate = rate
+        self.default_rate = rate
+        self.tokens = capacity
+        self.last_refill: Optional[float] = None
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float):
+        if self.last_refill is not None:
+            self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
+
+    async def acquire(self, n: float = 1):
+        """Wait until `n` tokens are available, then consume them"""
+        # Lock so concurrent callers queue up instead of all sleeping the same gap
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            self._refill(loop.time())
+
+            if self.tokens < n:
+                await asyncio.sleep((n - self.tokens) / self.rate)
+                self._refill(loop.time())
+
+            self.tokens -= n
+
+    def on_rate_limited(self):
+        """Back off after the API reports we're rate limited"""
+        self.rate = max(self.MIN_RATE, self.rate * self.DECREASE_FACTOR)
+
+    def on_success(self):
+        """Recover toward the default rate after a successful call"""
+        self.rate = min(self.default_rate, self.rate * self.INCREASE_FACTOR)
+
+
+async def post_message_with_backoff(
+    client,
+    bucket: AsyncTokenBucket,
+    in_flight: Optional[asyncio.Semaphore] = None,
+    max_retries: int = 3,
+    **kwargs: Any
+):
+    """
+    Slack chat.postMessage paced by `bucket`.
+
+    If Slack still answers `ratelimited`, the bucket backs off and the post
+    is retried after the response's Retry-After (up to `max_retries` times).
+    `in_flight`, if given, bounds concurrent requests without being held
+    while waiting for a token.
+    """
+    for attempt in range(max_retries + 1):
+        await bucket.acquire()
+        try:
+            if in_flight is None:
+                result = await client.chat_postMessage(**kwargs)
+            else:
+                async with in_flight:
+                    result = await client.chat_postMessage(**kwargs)
+            bucket.on_success()
+            return result
+        except SlackApiError as e:
+            if e.response.get("error") != "ratelimited" or attempt == max_retries:
+                raise
+            bucket.on_rate_limited()
+            await asyncio.sleep(int(e.response.headers.get("Retry-After", 1)))
@@ -2,10 +2,12 @@
 Sync service - orchestrates message fetching and prioritization.
 """
 
+import asyncio
 import logging
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timezone
 import time
+import httpx
 
 from ..config import settings
 from ..ingestion.slack_ingester import SlackIngester
@@ -21,7 +23,12 @@ logger = logging.getLogger(__name__)
 class SyncService:
     """Orchestrates message sync and prioritization"""
     
-    def __init__(self):
+    def __init__(self, http: Optional[httpx.AsyncClient] = None):
+        """
+        Args:
+            http: Shared HTTP client for Notion calls (None = open one per sync)
+        """
+        self.http = http
         self.ingester = SlackIngester()
         self.prioritizer = MessagePrioritizer()
         self.cache = CacheService()
@@ -57,19 +64,29 @@ class SyncService:
         logger.info(f"   Lookback: {hours_ago} hours")
         
         try:
-            # Step 1: Fetch messages from Slack
+            # Steps 1 + 2: Fetch messages from Slack and prioritize them with AI.
+            # The ingester queues each channel's new messages as they're saved,
+            # so prioritization overlaps with fetching the remaining channels.
             logger.info("📥 Step 1: Fetching messages from Slack...")
-            fetch_result = await self.ingester.sync_channels(
+            logger.info("🤖 Step 2: AI prioritization (as channels arrive)...")
+            queue = asyncio.Queue()
+            fetch_task = asyncio.create_task(self.ingester.sync_channels(
                 channel_ids=channel_ids,
-                hours_ago=hours_ago
-            )
+                hours_ago=hours_ago,
+                queue=queue
+            ))
+            consume_task = asyncio.create_task(self.prioritizer.consume(queue))
+            try:
+                fetch_result, priority_result = await asyncio.gather(fetch_task, consume_task)
+            except BaseException:
+                # If either side fails, don't leave the other one running (or
+                # blocked on the queue) after this sync has given up
+                fetch_task.cancel()
+                consume_task.cancel()
+                raise
             
             fetch_stats = fetch_result['stats']
             
-            # Step 2: Prioritize new messages with AI
-            logger.info("🤖 Step 2: AI prioritization...")
-            priority_result = await self.prioritizer.prioritize_new_messages()
-            
             # Step 2.5: Send instant alerts for critical messages (90+)
             alerts_result = {"status": "disabled", "alerts_sent": 0}
             if priority_result['prioritized'] > 0:
@@ -103,7 +120,8 @@ class SyncService:
                 # Sync to Notion (existing service handles this)
                 if action_items:
                     notion_result = await self.notion.sync_messages_to_notion(
-                        [item['source_message'] for item in action_items]
+                        [item['source_message'] for item in action_items],
+                        http=self.http
                     )
                     logger.info(f"✅ Synced {len(action_items)} action items to Notion")
                 else:
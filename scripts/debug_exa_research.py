@@ -25,6 +25,35 @@ from backend.services.inbox_service import InboxService
 from backend.config import settings
 
 
+# Summary prompts passed to Exa, keyed by research type
+SUMMARY_PROMPTS = {
+    "technical_comparison": "Summarize the key technical differences and tradeoffs.",
+    "best_practices": "Summarize the recommended best practices.",
+    "competitive_analysis": "Summarize the competitive positioning.",
+    "market_research": "Summarize the market trends."
+}
+
+# How many of the listed messages to research ahead of selection (--speculative)
+SPECULATIVE_TOP_N = 3
+
+
+async def prefetch_research(exa, message):
+    """
+    Run detection → query → Exa search for a message before it's selected.
+    
+    Used by --speculative to hide API latency behind the user's think-time.
+    """
+    detection = await exa.detect_ticket_type(message)
+    research_type = detection.get('research_type', 'technical_comparison')
+    query = await exa.build_search_query(message, research_type)
+    sources = await exa.search_with_contents(
+        query=query,
+        num_results=5,
+        summary_prompt=SUMMARY_PROMPTS.get(research_type, SUMMARY_PROMPTS["technical_comparison"])
+    )
+    return {"detection": detection, "query": query, "sources": sources}
+
+
 async def main():
     print("\n" + "="*80)
     print("🔬 EXA RESEARCH DEBUGGER - Step-by-Step Visibility")
@@ -41,12 +70,15 @@ async def main():
     
     # Check for command line argument
     message_index = None
+    speculative = False
     for arg in sys.argv[1:]:
         if arg.startswith("--message="):
             try:
                 message_index = int(arg.split("=")[1]) - 1
             except:
                 pass
+        elif arg == "--speculative":
+            speculative = True
     
     # Get messages
     inbox = InboxService()
@@ -66,6 +98,9 @@ async def main():
         marker = "👉" if message_index is not None and i-1 == message_index else "  "
         print(f"{marker} {i:2d}. [{score:3d}] {user:15s} - {text}...")
     
+    exa = ExaSearchService()
+    prefetched = None
+    
     # Let user pick or use command line arg
     if message_index is not None:
         if message_index >= len(messages):
@@ -74,16 +109,41 @@ async def main():
         selected = messages[message_index]
         print(f"\n👉 Using message #{message_index + 1} (from command line)")
     else:
+        # Speculatively research the top candidates while the user decides
+        pretasks = {}
+        if speculative:
+            pretasks = {
+                i: asyncio.create_task(prefetch_research(exa, messages[i]))
+                for i in range(min(SPECULATIVE_TOP_N, len(messages)))
+            }
+            print(f"\n⚡ Prefetching research for top {len(pretasks)} messages...")
+        
         try:
-            choice = input("\n👉 Select message number (1-15) or press Enter for #1: ")
+            # Read input off the event loop so prefetch tasks keep running
+            choice = await asyncio.to_thread(
+                input, "\n👉 Select message number (1-15) or press Enter for #1: "
+            )
             if choice.strip():
                 message_index = int(choice) - 1
                 selected = messages[message_index]
             else:
+                message_index = 0
                 selected = messages[0]
         except:
             print("Invalid choice, using first message")
+            message_index = 0
             selected = messages[0]
+        
+        for i, task in pretasks.items():
+            if i != message_index:
+                task.cancel()
+        
+        if message_index in pretasks:
+            try:
+                prefetched = await pretasks[message_index]
+                print("⚡ Using prefetched research results")
+            except Exception as e:
+                print(f"⚠️  Prefetch failed ({e}), running pipeline normally")
     
     print("\n" + "="*80)
     print("📝 SELECTED MESSAGE")
@@ -93,9 +153,6 @@ async def main():
     print(f"Priority: {selected['priority_score']}/100")
     print(f"\n{selected['text']}\n")
     
-    # Initialize Exa
-    exa = ExaSearchService()
-    
     # STEP 1: Ticket Type Detection
     print("="*80)
     print("🤖 STEP 1: TICKET TYPE DETECTION")
@@ -103,7 +160,10 @@ async def main():
     print("Asking OpenAI to classify this message...")
     start = datetime.now()
     
-    detection = await exa.detect_ticket_type(selected)
+    if prefetched:
+        detection = prefetched["detection"]
+    else:
+        detection = await exa.detect_ticket_type(selected)
     
     elapsed = (datetime.now() - start).total_seconds()
     print(f"\n✅ Result ({elapsed:.1f}s):")
@@ -149,10 +209,13 @@ async def main():
     print("Converting message to a searchable question...")
     start = datetime.now()
     
-    query = await exa.build_search_query(
-        selected,
-        detection.get('research_type', 'technical_comparison')
-    )
+    if prefetched:
+        query = prefetched["query"]
+    else:
+        query = await exa.build_search_query(
+            selected,
+            detection.get('research_type', 'technical_comparison')
+        )
     
     elapsed = (datetime.now() - start).total_seconds()
     print(f"\n✅ Generated Query ({elapsed:.1f}s):")
@@ -168,21 +231,18 @@ async def main():
     
     # Build summary prompt based on research type
     research_type = detection.get('research_type', 'technical_comparison')
-    summary_prompts = {
-        "technical_comparison": "Summarize the key technical differences and tradeoffs.",
-        "best_practices": "Summarize the recommended best practices.",
-        "competitive_analysis": "Summarize the competitive positioning.",
-        "market_research": "Summarize the market trends."
-    }
-    summary_prompt = summary_prompts.get(research_type, summary_prompts["technical_comparison"])
+    summary_prompt = SUMMARY_PROMPTS.get(research_type, SUMMARY_PROMPTS["technical_comparison"])
     print(f"Summary prompt: \"{summary_prompt}\"")
     
     try:
-        sources = await exa.search_with_contents(
-            query=query, 
-            num_results=5,
-            summary_prompt=summary_prompt
-        )
+        if prefetched:
+            sources = prefetched["sources"]
+        else:
+            sources = await exa.search_with_contents(
+                query=query, 
+                num_results=5,
+                summary_prompt=summary_prompt
+            )
         elapsed = (datetime.now() - start).total_seconds()
         
         print(f"\n✅ Found {len(sources)} sources ({elapsed:.1f}s):")
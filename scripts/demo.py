@@ -16,15 +16,26 @@ import asyncio
 import argparse
 import logging
 import json
+import re
 import time
 import os
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Any, Optional
-from openai import OpenAI
-from slack_sdk import WebClient
+from collections import Counter
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Union, AsyncIterator
+import httpx
+from slack_sdk.web.async_client import AsyncWebClient
+from slack_sdk.errors import SlackApiError
 from dotenv import load_dotenv
 
+# orjson parses the generated message array faster; stdlib json works too
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 # Rich for beautiful terminal output
 try:
     from rich.console import Console
@@ -45,11 +56,11 @@ load_dotenv()
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from backend.database.db import init_db
-from backend.ai.prioritizer import MessagePrioritizer
+from backend.ai.prioritizer import MessagePrioritizer, openai_client
 from backend.database.cache_service import CacheService
-from backend.integrations.notion_service import NotionSyncService
 from backend.services.sync_service import SyncService
 from backend.config import settings
+from backend.rate_limiter import AsyncTokenBucket
 
 # Setup logging
 logging.basicConfig(
@@ -62,39 +73,46 @@ logger = logging.getLogger(__name__)
 console = Console() if RICH_AVAILABLE else None
 
 # Hardcoded demo messages (fallback when not using AI generation)
-DEMO_MESSAGES = [
-    {
-        'message_id': f'demo_{i}',
-        'channel_id': 'C123DEMO',
-        'channel_name': 'product-strategy',
-        'user_id': 'U123',
-        'user_name': user,
-        'text': text,
-        'timestamp': datetime.utcnow(),
-        'thread_ts': None,
-        'is_thread_parent': False,
-        'reply_count': 0,
-        'reactions': [],
-        'mentioned_users': [],
-        'has_files': False
-    }
-    for i, (user, text) in enumerate([
-        ('Sarah Chen (Manager)', '@you URGENT: Production API latency spiked to 5 seconds. Customers complaining. Need immediate plan.'),
-        ('Engineering Lead', '@you The intent detection model is showing 15% accuracy drop. Can you prioritize investigation?'),
-        ('Sales VP', 'Latest customer feedback: "The chatbot doesn\'t understand complex questions." Need product roadmap update.'),
-        ('Data Scientist', 'A/B test results are in: New response model improved conversation quality by 23%. Ready to discuss rollout?'),
-        ('Customer Success', 'Escalation: Enterprise client threatening to churn due to response quality issues. Need PM input ASAP.'),
-        ('Engineer', 'PR ready for review: Latency optimization changes. Reduces response time by 40%.'),
-        ('Product Designer', 'Updated wireframes for the new conversation flow. Would love your feedback when you have time.'),
-        ('Weekly Bot', '📊 Weekly Metrics Report\nConversations: 10,234\nSatisfaction: 4.2/5\nIntent Accuracy: 87%'),
-        ('Team Lead', 'Reminder: Sprint planning tomorrow at 10am. Please review the backlog.'),
-        ('Office Manager', 'Happy Friday team! 🎉 Don\'t forget about the team lunch today at noon.'),
-        ('Metrics Bot', '[Automated] Daily dashboard updated. No action required.'),
-        ('Random Colleague', 'Anyone want to grab coffee? ☕'),
-    ])
+_DEMO_PAYLOADS = [
+    ('Sarah Chen (Manager)', '@you URGENT: Production API latency spiked to 5 seconds. Customers complaining. Need immediate plan.'),
+    ('Engineering Lead', '@you The intent detection model is showing 15% accuracy drop. Can you prioritize investigation?'),
+    ('Sales VP', 'Latest customer feedback: "The chatbot doesn\'t understand complex questions." Need product roadmap update.'),
+    ('Data Scientist', 'A/B test results are in: New response model improved conversation quality by 23%. Ready to discuss rollout?'),
+    ('Customer Success', 'Escalation: Enterprise client threatening to churn due to response quality issues. Need PM input ASAP.'),
+    ('Engineer', 'PR ready for review: Latency optimization changes. Reduces response time by 40%.'),
+    ('Product Designer', 'Updated wireframes for the new conversation flow. Would love your feedback when you have time.'),
+    ('Weekly Bot', '📊 Weekly Metrics Report\nConversations: 10,234\nSatisfaction: 4.2/5\nIntent Accuracy: 87%'),
+    ('Team Lead', 'Reminder: Sprint planning tomorrow at 10am. Please review the backlog.'),
+    ('Office Manager', 'Happy Friday team! 🎉 Don\'t forget about the team lunch today at noon.'),
+    ('Metrics Bot', '[Automated] Daily dashboard updated. No action required.'),
+    ('Random Colleague', 'Anyone want to grab coffee? ☕'),
 ]
 
 
+@lru_cache(maxsize=1)
+def _demo_messages() -> tuple:
+    """Build the hardcoded demo messages on first use (not at import time)"""
+    now = datetime.utcnow()
+    return tuple(
+        {
+            'message_id': f'demo_{i}',
+            'channel_id': 'C123DEMO',
+            'channel_name': 'product-strategy',
+            'user_id': 'U123',
+            'user_name': user,
+            'text': text,
+            'timestamp': now,
+            'thread_ts': None,
+            'is_thread_parent': False,
+            'reply_count': 0,
+            'reactions': [],
+            'mentioned_users': [],
+            'has_files': False
+        }
+        for i, (user, text) in enumerate(_DEMO_PAYLOADS)
+    )
+
+
 def print_header(title: str, subtitle: str = ""):
     """Print a formatted header"""
     if console:
@@ -121,40 +139,105 @@ def print_step(step_num: int, title: str):
         print("-" * 70)
 
 
-def print_success(message: str):
-    """Print success message"""
+def print_success(*parts):
+    """Print success message (parts are joined by the printer, not pre-formatted)"""
     if console:
-        console.print(f"[green]✅[/green] {message}")
+        console.print("[green]✅[/green]", *parts)
     else:
-        print(f"✅ {message}")
+        print("✅", *parts)
 
 
-def print_error(message: str):
+def print_error(*parts):
     """Print error message"""
     if console:
-        console.print(f"[red]❌[/red] {message}")
+        console.print("[red]❌[/red]", *parts)
     else:
-        print(f"❌ {message}")
+        print("❌", *parts)
 
 
-def print_warning(message: str):
+def print_warning(*parts):
     """Print warning message"""
     if console:
-        console.print(f"[yellow]⚠️[/yellow]  {message}")
+        console.print("[yellow]⚠️[/yellow] ", *parts)
     else:
-        print(f"⚠️  {message}")
+        print("⚠️ ", *parts)
+
+
+def _format_ai_message(i: int, msg: Dict[str, Any], now: datetime) -> Dict[str, Any]:
+    """Convert a generated {text, sender_name} item to our message format"""
+    return {
+        'message_id': f'ai_demo_{i}',
+        'channel_id': 'C123DEMO',
+        'channel_name': 'product-strategy',
+        'user_id': f'U{i}',
+        'user_name': msg.get('sender_name', f'User {i}'),
+        'text': msg.get('text', ''),
+        'timestamp': now,
+        'thread_ts': None,
+        'is_thread_parent': False,
+        'reply_count': 0,
+        'reactions': [],
+        'mentioned_users': [],
+        'has_files': False
+    }
+
 
+# Body of a ```json ... ``` (or bare ```) fence
+_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)```", re.S)
 
-async def generate_ai_messages(count: int = 12) -> Optional[List[Dict[str, Any]]]:
-    """Generate realistic messages using OpenAI"""
+
+class _JsonArrayStream:
+    """Parses objects out of a JSON array as its text streams in"""
+    
+    def __init__(self):
+        self.buffer = ""
+        self.pos = None  # Index just past the opening '[' once found
+        self.decoder = json.JSONDecoder()
+    
+    def feed(self, text: str) -> List[Dict[str, Any]]:
+        """Add streamed text, return any objects that are now complete"""
+        self.buffer += text
+        
+        if self.pos is None:
+            start = self.buffer.find('[')
+            if start == -1:
+                return []
+            self.pos = start + 1
+        
+        items = []
+        while True:
+            # Skip separators between array items
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in ' \t\r\n,':
+                self.pos += 1
+            if self.pos >= len(self.buffer) or self.buffer[self.pos] == ']':
+                break
+            try:
+                item, self.pos = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                break  # Object not closed yet - wait for more text
+            items.append(item)
+        
+        return items
+    
+    @property
+    def text(self) -> str:
+        return self.buffer
+
+
+async def generate_ai_messages(count: int = 12) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Generate realistic messages using OpenAI.
+    
+    Streams the completion and yields each message as soon as its JSON
+    object closes, so callers can start posting before generation ends.
+    Yields nothing if generation fails.
+    """
     if not settings.OPENAI_API_KEY:
         print_error("OPENAI_API_KEY not set - cannot generate AI messages")
-        return None
+        return
     
     print_success(f"Generating {count} realistic messages with AI...")
     
-    openai_client = OpenAI(api_key=settings.OPENAI_API_KEY)
-    
     prompt = f"""Generate {count} realistic Slack messages that an AI Product Manager would receive.
     
 You're an AI PM building a conversational virtual sales assistant. Generate a mix of:
@@ -170,55 +253,68 @@ Return as JSON array with format:
 
 Make each message unique and realistic for an AI PM role."""
 
+    yielded = 0
+    now = datetime.utcnow()  # One timestamp for the whole generated batch
     try:
-        response = openai_client.chat.completions.create(
+        stream = await openai_client.chat.completions.create(
             model="gpt-4o-mini",
             messages=[
                 {"role": "system", "content": "You are helping create realistic Slack message simulations for an AI PM demo."},
                 {"role": "user", "content": prompt}
             ],
             temperature=0.9,
-            max_tokens=2000
+            max_tokens=2000,
+            stream=True
         )
         
-        content = response.choices[0].message.content
-        # Extract JSON from markdown code blocks if present
-        if "```json" in content:
-            content = content.split("```json")[1].split("```")[0]
-        elif "```" in content:
-            content = content.split("```")[1].split("```")[0]
+        parser = _JsonArrayStream()
+        async for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if not delta:
+                continue
+            for msg in parser.feed(delta):
+                yield _format_ai_message(yielded, msg, now)
+                yielded += 1
         
-        messages = json.loads(content.strip())
+        if yielded:
+            return
         
-        # Convert to our format
-        formatted_messages = []
-        for i, msg in enumerate(messages):
-            formatted_messages.append({
-                'message_id': f'ai_demo_{i}',
-                'channel_id': 'C123DEMO',
-                'channel_name': 'product-strategy',
-                'user_id': f'U{i}',
-                'user_name': msg.get('sender_name', f'User {i}'),
-                'text': msg.get('text', ''),
-                'timestamp': datetime.utcnow(),
-                'thread_ts': None,
-                'is_thread_parent': False,
-                'reply_count': 0,
-                'reactions': [],
-                'mentioned_users': [],
-                'has_files': False
-            })
+        # Nothing parsed incrementally - fall back to parsing the whole response
+        content = parser.text
+        # Extract JSON from markdown code blocks if present
+        fence = _FENCE_RE.search(content)
+        payload = (fence.group(1) if fence else content).strip()
         
-        return formatted_messages
+        messages = _json_loads(payload)
         
     except Exception as e:
         print_error(f"Error generating messages: {e}")
-        return None
+        return
+    
+    for msg in messages:
+        yield _format_ai_message(yielded, msg, now)
+        yielded += 1
 
 
-async def post_to_slack(messages: List[Dict[str, Any]], channel_id: str, mode: str = 'personal') -> List[Any]:
-    """Post messages to Slack channel"""
-    print_success(f"Posting {len(messages)} messages to Slack...")
+async def post_to_slack(
+    messages: Union[List[Dict[str, Any]], AsyncIterator[Dict[str, Any]]],
+    channel_id: str,
+    mode: str = 'personal',
+    expected_count: Optional[int] = None,
+    verbose: bool = False
+) -> List[Any]:
+    """
+    Post messages to Slack channel.
+    
+    Accepts a list or an async iterator (e.g. generate_ai_messages); with an
+    iterator each post starts as soon as its message arrives. Per-message
+    lines are only printed with verbose (rich shows a progress bar instead).
+    """
+    if expected_count is None:
+        expected_count = len(messages)
+    print_success(f"Posting {expected_count} messages to Slack...")
     
     # Choose the right bot based on mode
     if mode == 'personal':
@@ -227,12 +323,53 @@ async def post_to_slack(messages: List[Dict[str, Any]], channel_id: str, mode: s
         if not slack_token:
             print_error("BOT_COWORKER_TOKEN not set - cannot post to Slack")
             return []
-        slack_client = WebClient(token=slack_token)
+        slack_client = AsyncWebClient(token=slack_token)
     else:
         # Use production bot for work Slack
-        slack_client = WebClient(token=settings.SLACK_BOT_TOKEN)
-    
-    posted = []
+        slack_client = AsyncWebClient(token=settings.SLACK_BOT_TOKEN)
+    
+    # chat.postMessage allows ~1 message/second per channel
+    bucket = AsyncTokenBucket(capacity=1, rate=1.0)
+    
+    async def post_one(msg: Dict[str, Any]):
+        try:
+            await bucket.acquire()
+            result = await slack_client.chat_postMessage(
+                channel=channel_id,
+                text=msg['text'],
+                username=msg.get('user_name', 'Demo User'),
+                icon_emoji=":robot_face:"
+            )
+            bucket.on_success()
+            if verbose and not console:
+                print("  ✅ Posted:", msg['text'][:50] + "...")
+            return result
+        except SlackApiError as e:
+            if e.response.get('error') == 'ratelimited':
+                bucket.on_rate_limited()
+            print_error(f"Error posting message: {e}")
+            return None
+        except Exception as e:
+            print_error(f"Error posting message: {e}")
+            return None
+    
+    async def start_posts(on_done=None) -> List[asyncio.Task]:
+        # Kick off each post as its message becomes available
+        tasks = []
+        
+        def start(msg: Dict[str, Any]):
+            t = asyncio.create_task(post_one(msg))
+            if on_done:
+                t.add_done_callback(on_done)
+            tasks.append(t)
+        
+        if hasattr(messages, '__aiter__'):
+            async for msg in messages:
+                start(msg)
+        else:
+            for msg in messages:
+                start(msg)
+        return tasks
     
     if console:
         with Progress(
@@ -243,50 +380,97 @@ async def post_to_slack(messages: List[Dict[str, Any]], channel_id: str, mode: s
             TimeElapsedColumn(),
             console=console
         ) as progress:
-            task = progress.add_task("Posting messages...", total=len(messages))
-            for msg in messages:
-                try:
-                    result = slack_client.chat_postMessage(
-                        channel=channel_id,
-                        text=msg['text'],
-                        username=msg.get('user_name', 'Demo User'),
-                        icon_emoji=":robot_face:"
-                    )
-                    posted.append(result)
-                    progress.update(task, advance=1)
-                    time.sleep(0.5)  # Rate limiting
-                except Exception as e:
-                    print_error(f"Error posting message: {e}")
-                    progress.update(task, advance=1)
+            task = progress.add_task("Posting messages...", total=expected_count)
+            tasks = await start_posts(lambda _: progress.update(task, advance=1))
+            results = await asyncio.gather(*tasks)
+            progress.update(task, total=len(tasks))
     else:
-        for i, msg in enumerate(messages):
-            try:
-                result = slack_client.chat_postMessage(
-                    channel=channel_id,
-                    text=msg['text'],
-                    username=msg.get('user_name', 'Demo User'),
-                    icon_emoji=":robot_face:"
-                )
-                posted.append(result)
-                print(f"  ✅ Posted: {msg['text'][:50]}...")
-                time.sleep(0.5)
-            except Exception as e:
-                print_error(f"Error posting message: {e}")
-    
-    return posted
-
-
-def display_results(cache: CacheService, notion_result: Optional[Dict] = None):
+        tasks = await start_posts()
+        results = await asyncio.gather(*tasks)
+    
+    return [r for r in results if r is not None]
+
+
+async def wait_for_indexing(
+    channel_id: str,
+    oldest: float,
+    expected_count: int,
+    token: str,
+    timeout: float = 5.0
+) -> float:
+    """
+    Poll conversations.history until the posted messages are visible.
+    
+    Backs off 0.1s -> 0.2s -> 0.4s ... (capped at 2s) and gives up after
+    `timeout` seconds, so the common case costs a fraction of a second.
+    
+    Returns:
+        Seconds spent waiting
+    """
+    slack_client = AsyncWebClient(token=token)
+    start = time.time()
+    deadline = start + timeout
+    delay = 0.1
+    
+    while time.time() < deadline:
+        try:
+            resp = await slack_client.conversations_history(
+                channel=channel_id,
+                oldest=str(oldest),
+                limit=expected_count
+            )
+            if len(resp.get('messages', [])) >= expected_count:
+                break
+        except SlackApiError as e:
+            print_warning(f"Could not check Slack indexing: {e}")
+            break
+        await asyncio.sleep(min(delay, max(deadline - time.time(), 0)))
+        delay = min(delay * 2, 2.0)
+    
+    return time.time() - start
+
+
+# Table formats, built once instead of per render
+_PCT_FMT = "%.1f%%"
+_BEFORE_LABEL = "[bold]Before:[/bold]"
+_AFTER_LABEL = "[bold]After:[/bold]"
+_BEFORE_FMT = "Scan %d messages (~%.1f min)"
+_AFTER_FMT = "Review %d critical messages (~%.1f min)"
+
+
+def _fmt_row(label: str, count: int, scale: float) -> tuple:
+    """Summary table row; scale is 100/total (0 when there are no messages)"""
+    return (label, str(count), _PCT_FMT % (count * scale))
+
+
+async def display_results(
+    cache: CacheService,
+    notion_result: Optional[Dict] = None,
+    counts: Optional[Counter] = None
+):
     """Display prioritization results in a beautiful format"""
     print_step(4, "Prioritization Results")
     
-    # Get messages by category
-    critical = cache.get_messages_by_category('needs_response', hours_ago=24, limit=10)
-    high = cache.get_messages_by_category('high_priority', hours_ago=24, limit=10)
-    medium = cache.get_messages_by_category('fyi', hours_ago=24, limit=10)
-    low = cache.get_messages_by_category('low_priority', hours_ago=24, limit=10)
+    if counts:
+        # Counts were aggregated by the prioritizer as it labelled each message,
+        # so only the lists shown below need to hit the database
+        critical, high = await asyncio.gather(*(
+            asyncio.to_thread(cache.get_messages_by_category, category, hours_ago=24, limit=limit)
+            for category, limit in (('needs_response', 3), ('high_priority', 2))
+        ))
+        n_critical = counts['needs_response']
+        n_high = counts['high_priority']
+        n_medium = counts['fyi']
+        n_low = counts['low_priority']
+    else:
+        # Get messages by category - each query runs in its own thread/session
+        critical, high, medium, low = await asyncio.gather(*(
+            asyncio.to_thread(cache.get_messages_by_category, category, hours_ago=24, limit=10)
+            for category in ('needs_response', 'high_priority', 'fyi', 'low_priority')
+        ))
+        n_critical, n_high, n_medium, n_low = len(critical), len(high), len(medium), len(low)
     
-    total = len(critical) + len(high) + len(medium) + len(low)
+    total = n_critical + n_high + n_medium + n_low
     
     if console:
         # Create summary table
@@ -295,12 +479,13 @@ def display_results(cache: CacheService, notion_result: Optional[Dict] = None):
         summary_table.add_column("Count", justify="right")
         summary_table.add_column("Percentage", justify="right")
         
-        summary_table.add_row("🔴 Needs Response", str(len(critical)), f"{len(critical)/total*100:.1f}%")
-        summary_table.add_row("🟡 High Priority", str(len(high)), f"{len(high)/total*100:.1f}%")
-        summary_table.add_row("🟢 FYI", str(len(medium)), f"{len(medium)/total*100:.1f}%")
-        summary_table.add_row("⚪ Low Priority", str(len(low)), f"{len(low)/total*100:.1f}%")
+        scale = 100.0 / total if total else 0.0
+        summary_table.add_row(*_fmt_row("🔴 Needs Response", n_critical, scale))
+        summary_table.add_row(*_fmt_row("🟡 High Priority", n_high, scale))
+        summary_table.add_row(*_fmt_row("🟢 FYI", n_medium, scale))
+        summary_table.add_row(*_fmt_row("⚪ Low Priority", n_low, scale))
         summary_table.add_row("", "", "")
-        summary_table.add_row("[bold]Total[/bold]", f"[bold]{total}[/bold]", "100%")
+        summary_table.add_row("[bold]Total[/bold]", f"[bold]{total}[/bold]", "100%" if total else "0%")
         
         console.print(summary_table)
         
@@ -320,13 +505,13 @@ def display_results(cache: CacheService, notion_result: Optional[Dict] = None):
         if notion_result:
             console.print(f"\n[bold cyan]📝 Notion Sync:[/bold cyan] {notion_result['tasks_created']} tasks created")
     else:
-        print(f"🔴 NEEDS RESPONSE ({len(critical)} messages)")
+        print(f"🔴 NEEDS RESPONSE ({n_critical} messages)")
         for msg in critical[:3]:
             print(f"   [{msg['priority_score']}] {msg['user_name']}")
             print(f"   {msg['text'][:70]}...")
             print(f"   → {msg['priority_reason']}\n")
         
-        print(f"🟡 HIGH PRIORITY ({len(high)} messages)")
+        print(f"🟡 HIGH PRIORITY ({n_high} messages)")
         for msg in high[:2]:
             print(f"   [{msg['priority_score']}] {msg['user_name']}: {msg['text'][:60]}...")
         
@@ -334,45 +519,62 @@ def display_results(cache: CacheService, notion_result: Optional[Dict] = None):
             print(f"\n📝 Notion Sync: {notion_result['tasks_created']} tasks created")
 
 
+def _plain_metrics(
+    total_messages: int,
+    needs_response: int,
+    total_time_saved: float,
+    total_cost: float,
+    before: str,
+    after: str
+):
+    """Plain-text metrics when rich isn't installed"""
+    print(f"Messages Processed: {total_messages}")
+    print(f"Critical Messages: {needs_response}")
+    print(f"Time Saved: {total_time_saved:.1f} minutes")
+    print(f"Cost: ${total_cost:.3f}")
+    print(f"\nBefore: {before}")
+    print(f"After: {after}")
+
+
 def display_metrics(total_messages: int, needs_response: int, duration: float):
     """Display demo metrics and ROI"""
     print_step(5, "Demo Metrics & ROI")
     
-    # Calculate metrics
+    # Calculate metrics once
     time_saved_per_message = 0.05  # 3 seconds per message (500 messages = 25 min)
-    total_time_saved = total_messages * time_saved_per_message
+    before_min = total_messages * time_saved_per_message
+    after_min = needs_response * time_saved_per_message
+    total_time_saved = before_min
     cost_per_message = 0.001  # ~$0.50/day for 500 messages
     total_cost = total_messages * cost_per_message
+    before = _BEFORE_FMT % (total_messages, before_min)
+    after = _AFTER_FMT % (needs_response, after_min)
     
-    if console:
-        metrics_table = Table(title="Value Proposition", box=box.ROUNDED)
-        metrics_table.add_column("Metric", style="bold")
-        metrics_table.add_column("Value", justify="right")
-        
-        metrics_table.add_row("Messages Processed", str(total_messages))
-        metrics_table.add_row("Critical Messages", f"[red]{needs_response}[/red]")
-        metrics_table.add_row("Time Saved", f"{total_time_saved:.1f} minutes")
-        metrics_table.add_row("Cost", f"${total_cost:.3f}")
-        metrics_table.add_row("Demo Duration", f"{duration:.1f} seconds")
-        metrics_table.add_row("", "")
-        metrics_table.add_row("[bold]Before:[/bold]", f"Scan {total_messages} messages (~{total_messages * 0.05:.1f} min)")
-        metrics_table.add_row("[bold]After:[/bold]", f"Review {needs_response} critical messages (~{needs_response * 0.05:.1f} min)")
-        
-        console.print(metrics_table)
-    else:
-        print(f"Messages Processed: {total_messages}")
-        print(f"Critical Messages: {needs_response}")
-        print(f"Time Saved: {total_time_saved:.1f} minutes")
-        print(f"Cost: ${total_cost:.3f}")
-        print(f"\nBefore: Scan {total_messages} messages (~{total_messages * 0.05:.1f} min)")
-        print(f"After: Review {needs_response} critical messages (~{needs_response * 0.05:.1f} min)")
+    if not console:
+        return _plain_metrics(total_messages, needs_response, total_time_saved, total_cost, before, after)
+    
+    metrics_table = Table(title="Value Proposition", box=box.ROUNDED)
+    metrics_table.add_column("Metric", style="bold")
+    metrics_table.add_column("Value", justify="right")
+    
+    metrics_table.add_row("Messages Processed", str(total_messages))
+    metrics_table.add_row("Critical Messages", f"[red]{needs_response}[/red]")
+    metrics_table.add_row("Time Saved", f"{total_time_saved:.1f} minutes")
+    metrics_table.add_row("Cost", f"${total_cost:.3f}")
+    metrics_table.add_row("Demo Duration", f"{duration:.1f} seconds")
+    metrics_table.add_row("", "")
+    metrics_table.add_row(_BEFORE_LABEL, before)
+    metrics_table.add_row(_AFTER_LABEL, after)
+    
+    console.print(metrics_table)
 
 
 async def run_demo(
     mode: str = 'quick',
     ai_generated: bool = False,
     channel_id: str = None,
-    verbose: bool = False
+    verbose: bool = False,
+    http: Optional[httpx.AsyncClient] = None
 ):
     """Run the unified demo - Full end-to-end workflow
     
@@ -381,12 +583,19 @@ async def run_demo(
         ai_generated: Use AI to generate messages instead of hardcoded ones
         channel_id: Slack channel ID (REQUIRED)
         verbose: Show verbose logging
+        http: Shared HTTP client for Notion calls across all steps
     
     Note: Slack and Notion are REQUIRED for this demo.
     """
     
     start_time = time.time()
     
+    if verbose:
+        # Only our own loggers - the root stays at WARNING so httpx, openai
+        # and slack_sdk don't flood the output
+        for name in ("backend", logger.name):
+            logging.getLogger(name).setLevel(logging.DEBUG)
+    
     # Determine message count based on mode
     message_count = 5 if mode == 'quick' else 12
     
@@ -401,35 +610,49 @@ async def run_demo(
     init_db()
     print_success("Database initialized")
     
-    # Step 2: Generate/Get Messages
-    print_step(2, "Prepare Messages")
-    if ai_generated:
-        messages = await generate_ai_messages(message_count)
-        if not messages:
-            print_warning("AI generation failed, using hardcoded messages")
-            messages = DEMO_MESSAGES[:message_count]
-    else:
-        messages = DEMO_MESSAGES[:message_count]
-        print_success(f"Using {len(messages)} demo messages")
-    
-    # Step 2b: Post to Slack (always required)
     if not channel_id:
         print_error("Channel ID is required")
         print("Usage: python scripts/demo.py --channel C123ABC")
         return
     
     slack_mode = 'personal'  # Default to personal Slack
-    posted = await post_to_slack(messages, channel_id, slack_mode)
+    
+    # Step 2: Generate/Get Messages, posting to Slack (always required) as they arrive
+    print_step(2, "Prepare Messages")
+    post_start_ts = time.time()
+    if ai_generated:
+        generated = 0
+        
+        async def counted_messages() -> AsyncIterator[Dict[str, Any]]:
+            nonlocal generated
+            async for msg in generate_ai_messages(message_count):
+                generated += 1
+                yield msg
+        
+        posted = await post_to_slack(
+            counted_messages(), channel_id, slack_mode, expected_count=message_count, verbose=verbose
+        )
+        if not generated:
+            # Only fall back when generation itself came up empty; a Slack
+            # failure would just fail again with the hardcoded set
+            print_warning("AI generation failed, using hardcoded messages")
+            messages = list(_demo_messages()[:message_count])
+            posted = await post_to_slack(messages, channel_id, slack_mode, verbose=verbose)
+        elif not posted:
+            print_error(
+                f"Generated {generated} messages but none could be posted - "
+                "check BOT_COWORKER_TOKEN and that the bot is in the channel"
+            )
+    else:
+        messages = list(_demo_messages()[:message_count])
+        print_success(f"Using {len(messages)} demo messages")
+        posted = await post_to_slack(messages, channel_id, slack_mode, verbose=verbose)
+    
     if not posted:
         print_error("Failed to post messages to Slack. Cannot continue.")
         return
     
     print_success(f"Posted {len(posted)} messages to Slack")
-    print("⏳ Waiting 5 seconds for Slack to index messages...")
-    await asyncio.sleep(5)  # Increased wait time for Slack indexing
-    
-    # Step 3: Fetch messages back from Slack and save to database
-    print_step(3, "Fetch Messages from Slack")
     
     # Temporarily override token for personal Slack BEFORE creating service
     original_token = settings.SLACK_BOT_TOKEN
@@ -438,10 +661,24 @@ async def run_demo(
         if personal_token:
             settings.SLACK_BOT_TOKEN = personal_token
     
+    # Wait until the reading bot can see the posts (was a fixed 5s sleep)
+    print("⏳ Waiting for Slack to index messages...")
+    waited = await wait_for_indexing(
+        channel_id,
+        post_start_ts,
+        len(posted),
+        token=settings.SLACK_BOT_TOKEN
+    )
+    print_success(f"Messages indexed after {waited:.1f}s")
+    
+    # Step 3: Fetch messages back from Slack and save to database
+    print_step(3, "Fetch Messages from Slack")
+    
     # Create sync service with the correct token
-    sync_service = SyncService()
+    sync_service = SyncService(http=http)
     
-    # Sync will fetch and save the messages
+    # Sync fetches, saves and prioritizes - the prioritizer consumes each
+    # channel's messages from a queue while the fetch is still running
     result = await sync_service.sync(channel_ids=[channel_id], hours_ago=1)
     settings.SLACK_BOT_TOKEN = original_token
     
@@ -466,7 +703,9 @@ async def run_demo(
     else:
         priority_result = await prioritizer.prioritize_new_messages()
     
-    print_success(f"Prioritized {priority_result['prioritized']} messages")
+    # Most messages were already prioritized during the sync; this sweeps up the rest
+    prioritized_count = result['prioritization']['prioritized'] + priority_result['prioritized']
+    print_success(f"Prioritized {prioritized_count} messages")
     
     # Step 5: Notion Sync (always required)
     if not settings.NOTION_SYNC_ENABLED:
@@ -488,20 +727,17 @@ async def run_demo(
         limit=100
     )
     
-    notion = NotionSyncService(
-        api_key=settings.NOTION_API_KEY,
-        database_id=settings.NOTION_DATABASE_ID
-    )
-    
-    notion_result = await notion.sync_messages_to_notion(high_priority_msgs)
+    # Reuse the sync service's Notion client and the shared connection pool
+    notion_result = await sync_service.notion.sync_messages_to_notion(high_priority_msgs, http=http)
     
     print_success(f"Notion Sync Complete: {notion_result['tasks_created']} tasks created")
     
-    # Display Results
-    display_results(cache, notion_result)
+    # Display Results from the category counts aggregated during prioritization
+    counts = sync_service.prioritizer.category_counts + prioritizer.category_counts
+    await display_results(cache, notion_result, counts=counts)
     
     # Display Metrics
-    critical_count = len(cache.get_messages_by_category('needs_response', hours_ago=24, limit=100))
+    critical_count = counts['needs_response']
     duration = time.time() - start_time
     display_metrics(fetched_count, critical_count, duration)
     
@@ -590,14 +826,20 @@ Note: Slack and Notion are REQUIRED for this demo. Make sure:
     # Map mode argument
     mode = args.mode
     
+    async def run_with_shared_http():
+        # One pooled client (and TLS session) for every Notion call in the run
+        async with httpx.AsyncClient(limits=httpx.Limits(max_connections=32), timeout=30) as http:
+            await run_demo(
+                mode=mode,
+                ai_generated=args.ai_generated,
+                channel_id=args.channel,
+                verbose=args.verbose,
+                http=http
+            )
+    
     # Run demo (Slack and Notion are always enabled)
     try:
-        asyncio.run(run_demo(
-            mode=mode,
-            ai_generated=args.ai_generated,
-            channel_id=args.channel,
-            verbose=args.verbose
-        ))
+        asyncio.run(run_with_shared_http())
     except KeyboardInterrupt:
         print("\n\n⚠️  Demo interrupted by user")
         sys.exit(1)
@@ -6,6 +6,7 @@ Resets the database and clears demo data for clean demo runs.
 Usage:
     python scripts/demo_cleanup.py          # Clean demo messages only
     python scripts/demo_cleanup.py --all    # Clean everything (full reset)
+    python scripts/demo_cleanup.py --all --vacuum  # ...and shrink the SQLite file
 """
 
 import sys
@@ -13,11 +14,12 @@ import argparse
 from pathlib import Path
 import sqlite3
 import os
+from sqlalchemy import delete, or_, select
 
 # Add backend to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from backend.database.db import init_db, get_db_session
+from backend.database.db import init_db, engine, SessionLocal
 from backend.database.models import SlackMessage, MessageInsight, SyncLog
 
 try:
@@ -57,34 +59,25 @@ def cleanup_demo_messages():
     """Remove demo messages from database"""
     print("Cleaning demo messages...")
     
-    with get_db_session() as session:
-        # Find demo messages
-        demo_msgs = session.query(SlackMessage).filter(
-            SlackMessage.message_id.like('demo_%')
-        ).all()
-        
-        ai_demo_msgs = session.query(SlackMessage).filter(
+    with SessionLocal() as session:
+        demo_filter = or_(
+            SlackMessage.message_id.like('demo_%'),
             SlackMessage.message_id.like('ai_demo_%')
-        ).all()
-        
-        all_demo_msgs = demo_msgs + ai_demo_msgs
+        )
+        demo_ids_subq = session.query(SlackMessage.id).filter(demo_filter).subquery()
         
         # Delete associated insights first (due to foreign key)
-        for msg in all_demo_msgs:
-            session.query(MessageInsight).filter(
-                MessageInsight.message_id == msg.id
-            ).delete()
+        session.query(MessageInsight).filter(
+            MessageInsight.message_id.in_(select(demo_ids_subq))
+        ).delete(synchronize_session=False)
         
         # Delete demo messages
-        deleted_messages = len(demo_msgs)
-        deleted_ai = len(ai_demo_msgs)
-        
-        for msg in all_demo_msgs:
-            session.delete(msg)
+        total_deleted = session.query(SlackMessage).filter(
+            demo_filter
+        ).delete(synchronize_session=False)
         
         session.commit()
         
-        total_deleted = deleted_messages + deleted_ai
         print_success(f"Deleted {total_deleted} demo messages")
         return total_deleted
 
@@ -93,23 +86,43 @@ def cleanup_all():
     """Clean everything - full reset"""
     print("Performing full cleanup...")
     
-    with get_db_session() as session:
+    # All deletes run in one transaction, so there's a single commit to sync
+    with SessionLocal() as session, session.begin():
+        # Core DELETEs - nothing is loaded, so skip identity-map syncing
+        no_sync = {"synchronize_session": False}
+        
         # Delete all messages
-        deleted_messages = session.query(SlackMessage).delete()
+        deleted_messages = session.execute(
+            delete(SlackMessage).execution_options(**no_sync)
+        ).rowcount
         
         # Delete all insights
-        deleted_insights = session.query(MessageInsight).delete()
+        deleted_insights = session.execute(
+            delete(MessageInsight).execution_options(**no_sync)
+        ).rowcount
         
         # Delete all sync logs
-        deleted_logs = session.query(SyncLog).delete()
-        
-        session.commit()
-        
-        print_success(f"Deleted {deleted_messages} messages")
-        print_success(f"Deleted {deleted_insights} insights")
-        print_success(f"Deleted {deleted_logs} sync logs")
-        
-        return deleted_messages + deleted_insights + deleted_logs
+        deleted_logs = session.execute(
+            delete(SyncLog).execution_options(**no_sync)
+        ).rowcount
+    
+    print_success(f"Deleted {deleted_messages} messages")
+    print_success(f"Deleted {deleted_insights} insights")
+    print_success(f"Deleted {deleted_logs} sync logs")
+    
+    return deleted_messages + deleted_insights + deleted_logs
+
+
+def vacuum_database():
+    """VACUUM the SQLite file to reclaim space freed by deletes (slow)"""
+    if engine.dialect.name != "sqlite":
+        print("⚠️  VACUUM is only supported for SQLite")
+        return
+    
+    # VACUUM can't run inside a transaction
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.exec_driver_sql("VACUUM")
+    print_success("Vacuumed database file")
 
 
 def reset_database():
@@ -124,9 +137,15 @@ def reset_database():
         db_path = db_url.replace('sqlite:///', '')
         
         if os.path.exists(db_path):
+            engine.dispose()  # Release pooled connections before removing the file
             os.remove(db_path)
             print_success(f"Removed database file: {db_path}")
         
+        # A file left in WAL mode has side files that must not outlive it
+        for suffix in ('-wal', '-shm'):
+            if os.path.exists(db_path + suffix):
+                os.remove(db_path + suffix)
+        
         # Reinitialize
         init_db()
         print_success("Database reinitialized")
@@ -152,6 +171,12 @@ def main():
         help='Drop and recreate database (destructive!)'
     )
     
+    parser.add_argument(
+        '--vacuum',
+        action='store_true',
+        help='VACUUM the SQLite file after cleaning to reclaim disk space (slow)'
+    )
+    
     args = parser.parse_args()
     
     print_header("Demo Cleanup")
@@ -178,6 +203,9 @@ def main():
         else:
             print_success(f"Cleanup complete! Deleted {deleted} demo messages.")
     
+    if args.vacuum:
+        vacuum_database()
+    
     print("\n✅ Demo cleanup complete! Ready for a fresh demo run.")
 
 
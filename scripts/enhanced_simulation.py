@@ -1,12 +1,22 @@
 #!/usr/bin/env python3
 """
 Enhanced realistic conversation generator with Slack notifications.
-Posts conversations and sends you a DM summary in Slack!
+Schedules conversations and sends you a DM summary in Slack!
 """
 
 import os
+import json
 import time
-from slack_sdk import WebClient
+import asyncio
+from pathlib import Path
+from datetime import datetime
+from typing import List, NamedTuple
+from slack_sdk.web.async_client import AsyncWebClient
+from slack_sdk.errors import SlackApiError
+from slack_sdk.http_retry.builtin_async_handlers import (
+    AsyncConnectionErrorRetryHandler,
+    AsyncRateLimitErrorRetryHandler,
+)
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -16,86 +26,135 @@ API_PORT = int(os.getenv("API_PORT", "8000"))
 
 # Bot clients
 bots = {
-    "manager": WebClient(token=os.getenv("BOT_MANAGER_TOKEN")),
-    "engineer": WebClient(token=os.getenv("BOT_COWORKER_TOKEN")),
-    "metrics": WebClient(token=os.getenv("BOT_METRICS_TOKEN")),
+    "manager": AsyncWebClient(token=os.getenv("BOT_MANAGER_TOKEN")),
+    "engineer": AsyncWebClient(token=os.getenv("BOT_COWORKER_TOKEN")),
+    "metrics": AsyncWebClient(token=os.getenv("BOT_METRICS_TOKEN")),
 }
 
 # Main intelligence bot for sending DMs
-main_bot = WebClient(token=os.getenv("SLACK_BOT_TOKEN"))
+main_bot = AsyncWebClient(token=os.getenv("SLACK_BOT_TOKEN"))
+
+# On a 429 wait for Slack's Retry-After, and on a dropped connection back off,
+# then retry instead of losing the message
+for _client in [*bots.values(), main_bot]:
+    _client.retry_handlers.extend([
+        AsyncRateLimitErrorRetryHandler(max_retry_count=3),
+        AsyncConnectionErrorRetryHandler(max_retry_count=3),
+    ])
+
+
+# Slack needs post_at to be a little in the future
+SCHEDULE_LEAD_SECONDS = 10
+
+
+class Msg(NamedTuple):
+    """One scripted message: which bot posts it, what it says, seconds after the previous one"""
+    bot: str
+    text: str
+    delay: int
+
+
+class Thread(NamedTuple):
+    """A titled conversation thread"""
+    title: str
+    messages: List[Msg]
+
+
+def coalesce_messages(messages):
+    """
+    Merge back-to-back messages from the same bot into one newline-joined post.
+    
+    The merged message carries the summed delay so the rest of the thread
+    keeps its timing.
+    """
+    merged = []
+    for msg in messages:
+        if merged and merged[-1].bot == msg.bot:
+            prev = merged[-1]
+            merged[-1] = Msg(msg.bot, prev.text + "\n" + msg.text, prev.delay + msg.delay)
+        else:
+            merged.append(msg)
+    return merged
+
+
+def schedule_offsets(work):
+    """
+    Seconds-from-start for every message, per thread.
+    
+    Each message follows the previous one in its thread by that message's
+    delay; threads get back-to-back, non-overlapping windows so no two
+    messages share a second (Slack's ~1 msg/sec per channel).
+    """
+    offsets = []
+    start = 0
+    for _, thread in work:
+        t = start
+        thread_offsets = []
+        for msg in thread.messages:
+            thread_offsets.append(t)
+            t += max(1, msg.delay)
+        offsets.append(thread_offsets)
+        start = t + 1  # Pause between threads
+    return offsets
 
 YOUR_USER_ID = os.getenv("YOUR_USER_ID", "U09NR3RQZQU")
 CHANNEL_ID = "C09P1KU5WMP"
 
-# Fresh realistic conversations with clear categories
-CONVERSATIONS = {
-    "🔴 CRITICAL": [
-        {
-            "title": "Production Outage",
-            "messages": [
-                {"bot": "engineer", "text": "🚨 Production alert: Sales bot API returning 503s", "delay": 1},
-                {"bot": "engineer", "text": "Error rate jumped from 0.1% to 45% in last 5 minutes. Database connections timing out", "delay": 2},
-                {"bot": "manager", "text": f"<@{YOUR_USER_ID}> We have 8 enterprise customers affected. Need your call NOW - do we failover to backup or investigate?", "delay": 2},
-            ]
-        },
-        {
-            "title": "Customer Emergency",
-            "messages": [
-                {"bot": "manager", "text": "Just got escalated by our biggest client (Acme - $2M/yr)", "delay": 1},
-                {"bot": "manager", "text": f"<@{YOUR_USER_ID}> Their CEO is asking why our bot recommended wrong products to 10+ leads. Need you on a call in 15 minutes", "delay": 2},
-            ]
-        },
-    ],
-    
-    "🟡 HIGH PRIORITY": [
-        {
-            "title": "Performance Degradation",
-            "messages": [
-                {"bot": "engineer", "text": "Intent detection latency increased to 3.2s (was 800ms yesterday)", "delay": 1},
-                {"bot": "metrics", "text": "Seeing 23% drop in conversation completion rate as a result", "delay": 2},
-                {"bot": "manager", "text": f"<@{YOUR_USER_ID}> Sales team is complaining. Thoughts on quick wins vs long-term fix?", "delay": 2},
-            ]
-        },
-        {
-            "title": "Feature Request from Key Customer",
-            "messages": [
-                {"bot": "manager", "text": "Salesforce integration request from TechCorp (they're considering enterprise plan)", "delay": 1},
-                {"bot": "engineer", "text": "We have the API built, just need to expose it in the bot conversation flow", "delay": 2},
-                {"bot": "manager", "text": "Estimated 2 days of work. Could close $500K deal if we ship by Friday", "delay": 2},
-            ]
-        },
-    ],
-    
-    "🟢 MEDIUM PRIORITY": [
-        {
-            "title": "Weekly Metrics Review",
-            "messages": [
-                {"bot": "metrics", "text": "Week 43 metrics: 12,300 conversations (+8%), 92% satisfaction (+3%), 1.1s avg response time", "delay": 1},
-                {"bot": "engineer", "text": "Nice improvement on satisfaction! The new context handling is working", "delay": 2},
-                {"bot": "manager", "text": "Great work team. Let's discuss optimization priorities in Friday's standup", "delay": 2},
-            ]
-        },
-    ],
-    
-    "⚪ LOW PRIORITY": [
-        {
-            "title": "Team Social",
-            "messages": [
-                {"bot": "engineer", "text": "Anyone up for coffee? There's a new place on 2nd Ave", "delay": 1},
-                {"bot": "metrics", "text": "I'm in! 3pm work for everyone?", "delay": 2},
-            ]
-        },
-        {
-            "title": "Automated Report",
-            "messages": [
-                {"bot": "metrics", "text": "🤖 Automated Daily Report: 847 conversations, 88% satisfaction, 1.2s avg response", "delay": 1},
-            ]
-        },
-    ],
-}
+# Conversation threads by category, kept in data/conversations.json.
+# "{YOUR_USER_ID}" in message text is filled in at load time.
+CONVERSATIONS_PATH = Path(__file__).parent / "data" / "conversations.json"
+
+
+def load_conversations():
+    """Load the conversation threads (only when a run needs them) as Thread/Msg tuples"""
+    raw = CONVERSATIONS_PATH.read_text(encoding="utf-8").replace("{YOUR_USER_ID}", YOUR_USER_ID)
+    return {
+        category: [
+            Thread(thread["title"], [Msg(**msg) for msg in thread["messages"]])
+            for thread in threads
+        ]
+        for category, threads in json.loads(raw).items()
+    }
 
-def post_conversations():
-    """Post all conversation threads"""
+
+async def run_thread(category, thread, base_time, offsets):
+    """
+    Schedule one thread's messages.
+    
+    Returns (category, title, scheduled texts, lines, complete). A Slack error
+    that survives the SDK retries stops the thread, since later messages
+    wouldn't make sense without it; other errors propagate.
+    """
+    thread_title = thread.title
+    thread_messages = []
+    lines = []
+    complete = True
+    
+    for msg, offset in zip(thread.messages, offsets):
+        bot_name = msg.bot
+        text = msg.text
+        
+        try:
+            bot = bots[bot_name]
+            # Slack posts it at post_at, so there's nothing to sleep for here
+            result = await bot.chat_scheduleMessage(
+                channel=CHANNEL_ID,
+                text=text,
+                post_at=base_time + offset
+            )
+            
+            lines.append(f"     {bot_name} (+{offset}s): {text[:60]}...")
+            thread_messages.append(text)
+            
+        except SlackApiError as e:
+            lines.append(f"     ❌ Error: {e.response.get('error', e)} - skipping rest of thread")
+            complete = False
+            break
+    
+    return category, thread_title, thread_messages, lines, complete
+
+async def post_conversations():
+    """Schedule all conversation threads (requests run concurrently, post times keep each thread in order)"""
     
     print("🎭 Enhanced Realistic Conversation Generator")
     print("=" * 60)
@@ -111,49 +170,46 @@ def post_conversations():
     
     all_threads = []
     
-    for category, threads in CONVERSATIONS.items():
-        print(f"\n{category}")
-        print("-" * 60)
+    # Queue every message up-front with chat.scheduleMessage; Slack does the pacing
+    work = [
+        (category, thread._replace(messages=coalesce_messages(thread.messages)))
+        for category, threads in load_conversations().items()
+        for thread in threads
+    ]
+    base_time = int(time.time()) + SCHEDULE_LEAD_SECONDS
+    offsets = schedule_offsets(work)
+    results = await asyncio.gather(*(
+        run_thread(category, thread, base_time, thread_offsets)
+        for (category, thread), thread_offsets in zip(work, offsets)
+    ))
+    
+    last_post_at = base_time + max((o[-1] for o in offsets if o), default=0)
+    print(f"⏰ Messages will appear over the next {last_post_at - int(time.time())}s")
+    
+    # Report in the original order
+    current_category = None
+    for category, thread_title, thread_messages, lines, complete in results:
+        if category != current_category:
+            print(f"\n{category}")
+            print("-" * 60)
+            current_category = category
         
-        for thread in threads:
-            thread_title = thread["title"]
-            messages = thread["messages"]
-            
-            print(f"  📝 {thread_title}")
-            
-            thread_messages = []
-            
-            for msg in messages:
-                bot_name = msg["bot"]
-                text = msg["text"]
-                delay = msg["delay"]
-                
-                try:
-                    bot = bots[bot_name]
-                    result = bot.chat_postMessage(
-                        channel=CHANNEL_ID,
-                        text=text
-                    )
-                    
-                    print(f"     {bot_name}: {text[:60]}...")
-                    thread_messages.append(text)
-                    time.sleep(delay)
-                    
-                except Exception as e:
-                    print(f"     ❌ Error: {e}")
-            
-            stats[category] += 1
-            all_threads.append({
-                "category": category,
-                "title": thread_title,
-                "messages": thread_messages
-            })
-            
-            time.sleep(1)  # Pause between threads
+        print(f"  📝 {thread_title}")
+        for line in lines:
+            print(line)
+        
+        if not complete:
+            continue
+        stats[category] += 1
+        all_threads.append({
+            "category": category,
+            "title": thread_title,
+            "messages": thread_messages
+        })
     
-    return stats, all_threads
+    return stats, all_threads, last_post_at
 
-def send_slack_dm_notification(stats, threads):
+async def send_slack_dm_notification(stats, threads, last_due):
     """Send a DM to the user in Slack with the simulation summary"""
     
     print("\n" + "=" * 60)
@@ -163,7 +219,7 @@ def send_slack_dm_notification(stats, threads):
     message_lines = [
         "🤖 *Slack Intelligence Test Simulation*",
         "",
-        "I just generated realistic AI PM conversations for testing. Here's what was posted:",
+        f"I just scheduled realistic AI PM conversations for testing (last message due at {last_due}). Here's what was scheduled:",
         "",
         "*Summary by Category:*",
     ]
@@ -184,7 +240,7 @@ def send_slack_dm_notification(stats, threads):
     message = "\n".join(message_lines)
     
     try:
-        result = main_bot.chat_postMessage(
+        result = await main_bot.chat_postMessage(
             channel=YOUR_USER_ID,  # DM to you
             text=message
         )
@@ -195,19 +251,21 @@ def send_slack_dm_notification(stats, threads):
         print(f"   (Your Slack Intelligence bot might need 'chat:write' and 'im:write' permissions)")
         return False
 
-def main():
+async def main():
     """Main function"""
     
-    # Post conversations
-    stats, threads = post_conversations()
+    # Schedule conversations
+    stats, threads, last_post_at = await post_conversations()
+    last_due = datetime.fromtimestamp(last_post_at).strftime("%H:%M:%S")
     
     # Send Slack DM
     print("\n" + "=" * 60)
-    send_slack_dm_notification(stats, threads)
+    await send_slack_dm_notification(stats, threads, last_due)
     
     # Summary
     print("\n" + "=" * 60)
-    print("🎉 Fresh realistic conversations posted!")
+    print("🎉 Fresh realistic conversations scheduled!")
+    print(f"   Last message due at {last_due}")
     print()
     print("📊 Summary:")
     for category, count in stats.items():
@@ -218,11 +276,11 @@ def main():
     print()
     print("⏰ Next Steps:")
     print("1. Check your Slack DMs for the notification")
-    print("2. Wait ~1 minute for audio notifications on critical messages")
-    print(f"3. Run: curl -X POST 'http://localhost:{API_PORT}/api/slack/sync?hours_ago=1'")
+    print("2. Expect audio notifications ~1 minute after each critical message appears")
+    print(f"3. After {last_due}, run: curl -X POST 'http://localhost:{API_PORT}/api/slack/sync?hours_ago=1'")
     print(f"4. Check: curl -s 'http://localhost:{API_PORT}/api/slack/inbox?view=needs_response'")
     print()
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
 
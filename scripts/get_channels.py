@@ -1,31 +1,84 @@
 #!/usr/bin/env python3
 """
 Get channel IDs from your Slack workspace using the main bot.
+
+Usage:
+    python scripts/get_channels.py            # Uses a 10-minute local cache
+    python scripts/get_channels.py --refresh  # Always ask Slack
 """
 
 import os
+import sys
+import json
+import time
+import hashlib
+from pathlib import Path
 from slack_sdk import WebClient
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
-def get_channels():
+CACHE_DIR = Path.home() / ".cache" / "slack-intel"
+CACHE_TTL = 600  # seconds
+
+def _cache_path(token):
+    """One cache file per bot token, so switching workspaces doesn't mix lists"""
+    digest = hashlib.sha1((token or "").encode()).hexdigest()[:8]
+    return CACHE_DIR / f"channels-{digest}.json"
+
+def _read_cache(path):
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+
+def _fetch_channels(client):
+    """Ask Slack for the full channel list, following pagination cursors"""
+    channels = []
+    cursor = None
+    
+    while True:
+        result = client.conversations_list(
+            types="public_channel,private_channel",
+            exclude_archived=True,
+            limit=1000,  # Max page size, so most workspaces need one request
+            cursor=cursor
+        )
+        channels.extend(result.get('channels', []))
+        
+        cursor = result.get('response_metadata', {}).get('next_cursor')
+        if not cursor:
+            return channels
+
+def get_channels(refresh=False):
     """Get list of channels the main bot can access"""
     
     # Use the main Slack Intelligence bot (has proper scopes)
     # Try personal token first, fallback to default
     token = os.getenv("SLACK_BOT_TOKEN_PERSONAL") or os.getenv("SLACK_BOT_TOKEN")
-    client = WebClient(token=token)
+    cache_path = _cache_path(token)
     
     try:
-        result = client.conversations_list(
-            types="public_channel,private_channel",
-            exclude_archived=True,
-            limit=100
-        )
+        channels = None
+        
+        # Serve from the local cache while it's fresh
+        if not refresh and cache_path.exists() and time.time() - cache_path.stat().st_mtime < CACHE_TTL:
+            channels = _read_cache(cache_path)
+            if channels is not None:
+                print(f"💾 Using cached channel list ({cache_path})")
         
-        channels = result.get('channels', [])
+        if channels is None:
+            try:
+                channels = _fetch_channels(WebClient(token=token))
+                CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                cache_path.write_text(json.dumps(channels))
+            except Exception as e:
+                # Fall back to a stale cache rather than failing outright
+                channels = _read_cache(cache_path)
+                if channels is None:
+                    raise
+                print(f"⚠️  Slack API error ({e}) - using stale cached channel list")
         
         print("📋 Available Channels:")
         print("=" * 50)
@@ -50,4 +103,4 @@ def get_channels():
         return []
 
 if __name__ == "__main__":
-    get_channels()
+    get_channels(refresh="--refresh" in sys.argv)
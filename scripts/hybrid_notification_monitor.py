@@ -5,9 +5,13 @@ Uses desktop notifications, audio alerts, and console output.
 """
 
 import os
+import json
 import time
-import subprocess
-import requests
+import shutil
+import asyncio
+import tempfile
+import httpx
+from collections import OrderedDict
 from datetime import datetime
 from dotenv import load_dotenv
 
@@ -19,47 +23,260 @@ API_PORT = int(os.getenv("API_PORT", "8000"))
 API_BASE = f"http://localhost:{API_PORT}"
 CHECK_INTERVAL = 600  # 10 minutes in seconds (production)
 
-# Track which messages we've already notified about
-notified_message_ids = set()
+# With an app-level token (xapp-..., connections:write) new messages are pushed
+# over Socket Mode and polling only runs as an hourly safety net.
+# Slack spreads events across every open connection on an app token, so only
+# one Socket Mode consumer should run. When socket_mode_bridge.py is running,
+# set MONITOR_SOCKET_MODE=0: the bridge syncs pushed messages into the API and
+# this monitor picks them up from the inbox stream instead.
+SLACK_APP_TOKEN = os.getenv("SLACK_APP_TOKEN")
+MONITOR_SOCKET_MODE = os.getenv("MONITOR_SOCKET_MODE", "1") != "0"
+SAFETY_NET_INTERVAL = 3600
 
-def check_server():
+# Optional Slack DM digest: one message per burst of urgent messages
+SLACK_BOT_TOKEN = os.getenv("SLACK_BOT_TOKEN")
+YOUR_USER_ID = os.getenv("YOUR_USER_ID")
+_digest_client = None  # AsyncWebClient, created on the first digest
+
+RETRY_STATUSES = {502, 503, 504}
+
+# Last good inbox response per (view, limit), served if the backend errors
+_last_inbox = {}
+
+
+def make_client():
+    """One keep-alive client for every poll (instead of a new connection per request)"""
+    return httpx.AsyncClient(
+        base_url=API_BASE,
+        timeout=5.0,
+        # With a custom transport the pool comes from the transport, not the client
+        transport=httpx.AsyncHTTPTransport(
+            retries=3,  # Retries failed connects
+            limits=httpx.Limits(max_connections=4, max_keepalive_connections=2)
+        )
+    )
+
+
+async def _get(client, url, **kwargs):
+    """GET with backoff on 502/503/504"""
+    for attempt in range(3):
+        response = await client.get(url, **kwargs)
+        if response.status_code not in RETRY_STATUSES:
+            break
+        await asyncio.sleep(0.5 * 2 ** attempt)
+    return response
+
+MAX_NOTIFIED_IDS = 100_000
+
+
+class LRUSet(OrderedDict):
+    """Set that forgets its least recently added items past `maxsize`"""
+    
+    def __init__(self, maxsize=MAX_NOTIFIED_IDS):
+        super().__init__()
+        self.maxsize = maxsize
+    
+    def add(self, key):
+        self[key] = None
+        self.move_to_end(key)
+        if len(self) > self.maxsize:
+            self.popitem(last=False)
+
+
+# Track which messages we've already notified about (bounded so a
+# long-running monitor doesn't grow forever)
+notified_message_ids = LRUSet()
+
+async def check_server(client):
     """Check if the API server is running"""
     try:
-        response = requests.get(f"{API_BASE}/health", timeout=5)
+        response = await _get(client, "/health")
         return response.status_code == 200
     except:
         return False
 
-def get_critical_messages():
+async def _fetch_inbox(client, view, limit):
+    """
+    Fetch an inbox view, falling back to the last good copy on errors.
+    
+    Every poll hits the backend: polls are CHECK_INTERVAL apart and the
+    backend sends no ETag/Last-Modified, so a TTL or revalidation cache
+    would never be hit.
+    """
+    key = (view, limit)
+    last = _last_inbox.get(key)
+    
+    try:
+        response = await _get(client, "/api/slack/inbox", params={"view": view, "limit": limit})
+    except Exception:
+        if last is not None:
+            return last  # Stale-if-error
+        raise
+    
+    if response.status_code != 200:
+        return last if last is not None else []
+    
+    messages = response.json().get('messages', [])
+    _last_inbox[key] = messages
+    return messages
+
+async def get_critical_messages(client):
     """Get messages that need immediate attention"""
     try:
-        response = requests.get(f"{API_BASE}/api/slack/inbox?view=needs_response&limit=10")
-        if response.status_code == 200:
-            data = response.json()
-            return data.get('messages', [])
-        return []
+        return await _fetch_inbox(client, "needs_response", 10)
     except Exception as e:
         print(f"❌ Error fetching messages: {e}")
         return []
 
-def send_hybrid_notification(title, message, count=1):
-    """Send notification using multiple methods"""
+async def sync_channels(client, channel_ids):
+    """Ask the backend to ingest + prioritize just these channels right now"""
+    try:
+        await client.post(
+            "/api/slack/sync",
+            params={"channel_ids": list(channel_ids), "hours_ago": 1},
+            timeout=120.0  # Runs the AI prioritizer
+        )
+    except Exception as e:
+        print(f"❌ Error syncing pushed messages: {e}")
+
+async def stream_inbox(client, state):
+    """
+    Follow /api/slack/inbox/stream (Server-Sent Events) and notify as
+    messages arrive. Reconnects with backoff on HTTP errors and bad
+    events; gives up if the backend doesn't have the endpoint, leaving
+    the polling loop in charge. Any other error ends the task.
+    """
+    delay = 1
+    while True:
+        try:
+            async with client.stream(
+                "GET",
+                "/api/slack/inbox/stream",
+                params={"view": "needs_response", "limit": 10},
+                timeout=httpx.Timeout(5.0, read=None)
+            ) as response:
+                if response.status_code == 404:
+                    return
+                response.raise_for_status()
+                state["streaming"] = True
+                delay = 1
+                
+                async for line in response.aiter_lines():
+                    if line.startswith("data:"):
+                        messages = json.loads(line[5:])
+                        notified = await notify_critical_messages(messages)
+                        if notified:
+                            timestamp = datetime.now().strftime("%H:%M:%S")
+                            print(f"[{timestamp}] 🔔 Sent hybrid notification for {notified} new critical message(s)")
+        except httpx.HTTPError as e:
+            print(f"❌ Inbox stream error: {e} (reconnecting in {delay}s)")
+        except json.JSONDecodeError as e:  # ValueError from a bad data: line only
+            print(f"❌ Bad inbox stream event: {e} (reconnecting in {delay}s)")
+        
+        state["streaming"] = False
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, 60)
+
+def start_socket_mode(loop, on_message):
+    """
+    Listen for Slack message events over Socket Mode.
+    
+    Calls on_message(channel_id) on the event loop for every new message.
+    Returns the client, or None when SLACK_APP_TOKEN isn't configured or
+    MONITOR_SOCKET_MODE=0 (socket_mode_bridge.py owns the connection).
+    """
+    if not SLACK_APP_TOKEN or not MONITOR_SOCKET_MODE:
+        return None
     
-    # Method 1: Desktop notification (osascript)
+    from slack_sdk.socket_mode import SocketModeClient
+    from slack_sdk.socket_mode.response import SocketModeResponse
+    
+    socket_client = SocketModeClient(app_token=SLACK_APP_TOKEN)
+    
+    def handle(client, req):
+        # Ack first so Slack doesn't redeliver
+        client.send_socket_mode_response(SocketModeResponse(envelope_id=req.envelope_id))
+        if req.type != "events_api":
+            return
+        event = req.payload.get("event", {})
+        # Bot posts count (simulations use bots); edits/deletes don't
+        if event.get("type") == "message" and event.get("subtype") in (None, "bot_message"):
+            loop.call_soon_threadsafe(on_message, event.get("channel"))
+    
+    socket_client.socket_mode_request_listeners.append(handle)
+    socket_client.connect()  # Runs on the SDK's own threads
+    return socket_client
+
+async def _run(*cmd):
+    """Run a command without blocking the event loop (ignores failures)"""
     try:
-        subprocess.run(['osascript', '-e', f'display notification "{message}" with title "{title}"'], 
-                      check=False)
+        proc = await asyncio.create_subprocess_exec(*cmd)
+        await proc.wait()
     except:
         pass
-    
-    # Method 2: Audio notification
+
+# AppleScript that takes title/message as arguments, so quotes in a message
+# can't break it; compiled once per process
+NOTIFY_APPLESCRIPT = [
+    'on run argv',
+    'display notification (item 2 of argv) with title (item 1 of argv)',
+    'end run',
+]
+_compiled_notify_script = None
+_last_spoken_at = 0.0
+_say_proc = None  # The running `say`, if any
+SAY_DEBOUNCE_SECONDS = 30
+
+async def _say(text):
+    """Speak text in the background; skipped while the last utterance is still playing"""
+    global _say_proc
+    if _say_proc is not None and _say_proc.returncode is None:
+        return
     try:
+        _say_proc = await asyncio.create_subprocess_exec('say', text)
+    except:
+        _say_proc = None
+
+async def _notify_command(title, message):
+    """Fastest available desktop-notification command for title/message"""
+    global _compiled_notify_script
+    
+    terminal_notifier = shutil.which('terminal-notifier')
+    if terminal_notifier:
+        return [terminal_notifier, '-title', title, '-message', message]
+    
+    if _compiled_notify_script is None:
+        path = os.path.join(tempfile.gettempdir(), 'slack_intel_notify.scpt')
+        args = ['osacompile', '-o', path]
+        for line in NOTIFY_APPLESCRIPT:
+            args += ['-e', line]
+        await _run(*args)
+        _compiled_notify_script = path if os.path.exists(path) else ''
+    
+    if _compiled_notify_script:
+        return ['osascript', _compiled_notify_script, title, message]
+    
+    # osacompile unavailable - run the same script uncompiled
+    args = ['osascript']
+    for line in NOTIFY_APPLESCRIPT:
+        args += ['-e', line]
+    return args + [title, message]
+
+async def send_hybrid_notification(title, message, count=1):
+    """Send notification using multiple methods"""
+    global _last_spoken_at
+    
+    # Method 1: Desktop notification
+    await _run(*await _notify_command(title, message))
+    
+    # Method 2: Audio notification (debounced, and never over a still-playing one)
+    now = time.monotonic()
+    if now - _last_spoken_at >= SAY_DEBOUNCE_SECONDS:
+        _last_spoken_at = now
         if count == 1:
-            subprocess.run(['say', f'Urgent Slack message: {message[:50]}'], check=False)
+            await _say(f'Urgent Slack message: {message[:50]}')
         else:
-            subprocess.run(['say', f'{count} urgent Slack messages need your attention'], check=False)
-    except:
-        pass
+            await _say(f'{count} urgent Slack messages need your attention')
     
     # Method 3: Console notification (always works)
     timestamp = datetime.now().strftime("%H:%M:%S")
@@ -68,7 +285,39 @@ def send_hybrid_notification(title, message, count=1):
     print(f"   Check your Slack for details!")
     print()
 
-def notify_critical_messages(messages):
+async def send_slack_digest(messages):
+    """DM one combined Block Kit message for a burst of urgent messages"""
+    if not (SLACK_BOT_TOKEN and YOUR_USER_ID):
+        return
+    
+    global _digest_client
+    if _digest_client is None:
+        from slack_sdk.web.async_client import AsyncWebClient
+        _digest_client = AsyncWebClient(token=SLACK_BOT_TOKEN)
+    
+    blocks = [{
+        "type": "header",
+        "text": {"type": "plain_text", "text": f"🔴 {len(messages)} urgent Slack messages"}
+    }]
+    for msg in messages[:49]:  # Slack allows 50 blocks per message
+        blocks.append({
+            "type": "section",
+            "text": {
+                "type": "mrkdwn",
+                "text": f"*[{msg['priority_score']}] {msg['user_name']}* in #{msg['channel_name']}\n{msg['text'][:200]}"
+            }
+        })
+    
+    try:
+        await _digest_client.chat_postMessage(
+            channel=YOUR_USER_ID,
+            text=f"{len(messages)} urgent Slack messages need your attention",
+            blocks=blocks
+        )
+    except Exception as e:
+        print(f"❌ Error sending Slack digest: {e}")
+
+async def notify_critical_messages(messages):
     """Send notifications for new critical messages"""
     
     # Filter out messages we've already notified about
@@ -77,6 +326,10 @@ def notify_critical_messages(messages):
     if not new_messages:
         return 0
     
+    # Mark as notified up-front so the stream and the poll can't both alert
+    for msg in new_messages:
+        notified_message_ids.add(msg['id'])
+    
     # Send hybrid notification
     count = len(new_messages)
     
@@ -84,24 +337,44 @@ def notify_critical_messages(messages):
         msg = new_messages[0]
         title = "🔴 URGENT Slack Message"
         body = f"[{msg['priority_score']}] {msg['user_name']} in #{msg['channel_name']}: {msg['text'][:60]}"
-        send_hybrid_notification(title, body, 1)
+        await send_hybrid_notification(title, body, 1)
     else:
         title = f"🔴 {count} URGENT Slack Messages"
         preview = f"{count} urgent messages need your attention"
-        send_hybrid_notification(title, preview, count)
-    
-    # Mark as notified
-    for msg in new_messages:
-        notified_message_ids.add(msg['id'])
+        await send_hybrid_notification(title, preview, count)
+        await send_slack_digest(new_messages)
     
     return count
 
-def monitor_loop():
+async def monitor_loop():
     """Main monitoring loop"""
     
+    # Messages pushed over Socket Mode wake the loop early
+    wake = asyncio.Event()
+    pushed_channels = set()
+    
+    def on_message(channel_id):
+        if channel_id:
+            pushed_channels.add(channel_id)
+        wake.set()
+    
+    socket_client = start_socket_mode(asyncio.get_running_loop(), on_message)
+    interval = SAFETY_NET_INTERVAL if socket_client else CHECK_INTERVAL
+    stream_state = {"streaming": False}
+    stream_task = None
+    
     print("🔔 Hybrid Slack Intelligence Notification Monitor")
     print("=" * 60)
-    print(f"✅ Checking for critical messages every {CHECK_INTERVAL//60} minutes")
+    if socket_client:
+        print("⚡ Socket Mode connected - checking as soon as new messages arrive")
+        print(f"✅ Safety-net poll every {interval//60} minutes")
+    else:
+        print(f"✅ Checking for critical messages every {interval//60} minutes")
+        if SLACK_APP_TOKEN:
+            print("   (Socket Mode off - run socket_mode_bridge.py for instant push)")
+        else:
+            print("   (set SLACK_APP_TOKEN for instant push via Socket Mode)")
+    print("📡 Following the backend's inbox stream when available")
     print(f"🎯 Notifying about messages with score ≥ 90")
     print(f"🔊 Using: Desktop notifications + Audio alerts + Console output")
     print()
@@ -111,44 +384,69 @@ def monitor_loop():
     iteration = 0
     
     try:
-        while True:
-            iteration += 1
-            timestamp = datetime.now().strftime("%H:%M:%S")
-            
-            # Check server health
-            if not check_server():
-                print(f"[{timestamp}] ⚠️  Server not running. Waiting...")
-                time.sleep(60)
-                continue
+        async with make_client() as client:
+            stream_task = asyncio.create_task(stream_inbox(client, stream_state))
+            stream_task.add_done_callback(lambda _: wake.set())
             
-            # Get critical messages
-            messages = get_critical_messages()
-            
-            if messages:
-                # Notify about new ones
-                notified = notify_critical_messages(messages)
+            while True:
+                iteration += 1
+                timestamp = datetime.now().strftime("%H:%M:%S")
+                
+                # Check server health
+                if not await check_server(client):
+                    print(f"[{timestamp}] ⚠️  Server not running. Waiting...")
+                    await asyncio.sleep(60)
+                    continue
+                
+                # Get critical messages
+                messages = await get_critical_messages(client)
                 
-                if notified > 0:
-                    print(f"[{timestamp}] 🔔 Sent hybrid notification for {notified} new critical message(s)")
+                if messages:
+                    # Notify about new ones
+                    notified = await notify_critical_messages(messages)
+                    
+                    if notified > 0:
+                        print(f"[{timestamp}] 🔔 Sent hybrid notification for {notified} new critical message(s)")
+                    else:
+                        print(f"[{timestamp}] ✓ {len(messages)} critical message(s) (already notified)")
                 else:
-                    print(f"[{timestamp}] ✓ {len(messages)} critical message(s) (already notified)")
-            else:
-                print(f"[{timestamp}] ✓ No critical messages")
-            
-            # Wait for next check
-            if iteration == 1:
-                print(f"\n⏰ Next check in {CHECK_INTERVAL//60} minutes...")
-            
-            time.sleep(CHECK_INTERVAL)
+                    print(f"[{timestamp}] ✓ No critical messages")
+                
+                # Wait for next check
+                if iteration == 1:
+                    print(f"\n⏰ Next check in {interval//60} minutes...")
+                
+                # While the SSE stream is up it delivers new messages; polling is a safety net
+                timeout = SAFETY_NET_INTERVAL if stream_state["streaming"] else interval
+                try:
+                    await asyncio.wait_for(wake.wait(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    pass
+                wake.clear()
+                
+                # Re-raise anything that crashed the stream (e.g. a notifier bug)
+                if stream_task.done() and not stream_task.cancelled():
+                    stream_task.result()
+                
+                # Pushed messages: have the backend score them, then re-read the inbox
+                if pushed_channels:
+                    channels = list(pushed_channels)
+                    pushed_channels.clear()
+                    await sync_channels(client, channels)
             
-    except KeyboardInterrupt:
+    except (KeyboardInterrupt, asyncio.CancelledError):
         print("\n\n👋 Stopped monitoring")
         print(f"📊 Sent notifications for {len(notified_message_ids)} unique messages")
+    finally:
+        if stream_task:
+            stream_task.cancel()
+        if socket_client:
+            socket_client.close()
 
-def test_notification():
+async def test_notification():
     """Test the hybrid notification system"""
     print("🧪 Testing hybrid notification system...")
-    send_hybrid_notification(
+    await send_hybrid_notification(
         "Slack Intelligence Test",
         "Hybrid notification system is working! You should see this message in multiple ways.",
         1
@@ -160,7 +458,10 @@ if __name__ == "__main__":
     
     if len(sys.argv) > 1 and sys.argv[1] == "test":
         # Test mode
-        test_notification()
+        asyncio.run(test_notification())
     else:
         # Normal monitoring mode
-        monitor_loop()
+        try:
+            asyncio.run(monitor_loop())
+        except KeyboardInterrupt:
+            pass  # monitor_loop already printed its summary
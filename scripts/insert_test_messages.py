@@ -7,13 +7,17 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from collections import Counter
 from datetime import datetime, timezone
+from sqlalchemy import delete, insert, select
 from backend.database.db import get_db
-from backend.database.models import SlackMessage
+from backend.database.models import SlackMessage, MessageInsight
 
 def insert_test_messages():
     """Insert diverse test messages for dashboard testing"""
     
+    now = datetime.now(timezone.utc)  # One clock read for every row
+    
     test_messages = [
         {
             "message_id": "test_msg_001",
@@ -22,7 +26,7 @@ def insert_test_messages():
             "user_id": "U123USER",
             "user_name": "PagerDuty Bot",
             "text": "🚨 ALERT: Slack API Rate Limit Exceeded (429). Ingestion worker #3 has crashed. We are missing the Retry-After header in the response. Queue backing up.",
-            "timestamp": datetime.now(timezone.utc),
+            "timestamp": now,
             "priority_score": 98,
             "category": "needs_response",
             "priority_reason": "Critical ingestion failure. Directly affects core value prop (real-time). Known issue with rate limits.",
@@ -34,7 +38,7 @@ def insert_test_messages():
             "user_id": "U124USER",
             "user_name": "Sarah Product",
             "text": "Enterprise customer 'TechCorp' is complaining that their Notion pages look broken when synced. The rich text blocks from Slack aren't converting properly - seeing raw JSON instead of formatting.",
-            "timestamp": datetime.now(timezone.utc),
+            "timestamp": now,
             "priority_score": 85,
             "category": "high_priority",
             "priority_reason": "Customer-facing quality issue with a core integration (Notion). Risk of churn for enterprise account.",
@@ -46,7 +50,7 @@ def insert_test_messages():
             "user_id": "U125USER",
             "user_name": "Alex Architect",
             "text": "We need to decide on a vector database for the new 'Similar Ticket' feature. Should we stick with pgvector since we're already on Postgres, or move to Pinecone for better scaling? Need a decision by Friday.",
-            "timestamp": datetime.now(timezone.utc),
+            "timestamp": now,
             "priority_score": 92,
             "category": "needs_response",
             "priority_reason": "Strategic architecture decision blocking a key roadmap feature. Time-sensitive (Friday deadline).",
@@ -58,7 +62,7 @@ def insert_test_messages():
             "user_id": "U126USER",
             "user_name": "Emma HR",
             "text": "Reminder: Open enrollment for health benefits ends this Friday. Please submit your forms via Rippling.",
-            "timestamp": datetime.now(timezone.utc),
+            "timestamp": now,
             "priority_score": 60,
             "category": "fyi",
             "priority_reason": "Important deadline for employees, but not product-critical. Informational.",
@@ -70,7 +74,7 @@ def insert_test_messages():
             "user_id": "U127USER",
             "user_name": "Chris Dev",
             "text": "Has anyone tried the new Cursor AI editor? The codebase context feature looks pretty similar to what we're building.",
-            "timestamp": datetime.now(timezone.utc),
+            "timestamp": now,
             "priority_score": 45,
             "category": "low_priority",
             "priority_reason": "Casual tech discussion. Relevant to industry but not actionable work.",
@@ -82,7 +86,7 @@ def insert_test_messages():
             "user_id": "U128USER",
             "user_name": "Jordan CTO",
             "text": "Can you review the PRD for the 'Context Engine' v2? I want to make sure we're capturing enough metadata for the RAG pipeline before we start engineering.",
-            "timestamp": datetime.now(timezone.utc),
+            "timestamp": now,
             "priority_score": 95,
             "category": "needs_response",
             "priority_reason": "Direct request from CTO about a core roadmap item. High urgency and strategic importance.",
@@ -95,29 +99,36 @@ def insert_test_messages():
     db = next(db_gen)
     
     try:
-        # Clear existing test messages
-        existing = db.query(SlackMessage).filter(
-            SlackMessage.message_id.like('test_msg_%')
-        ).all()
-        
-        if existing:
-            print(f"🗑️  Clearing {len(existing)} existing test messages...")
-            for msg in existing:
-                db.delete(msg)
-            db.commit()
-        
-        # Insert new test messages
-        for msg_data in test_messages:
-            message = SlackMessage(**msg_data)
-            db.add(message)
+        # Clear and re-insert in one transaction with set-based statements
+        with db.begin():
+            test_filter = SlackMessage.message_id.like('test_msg_%')
+            
+            # Insights first (the ORM cascade doesn't run for Core deletes)
+            db.execute(
+                delete(MessageInsight)
+                .where(MessageInsight.message_id.in_(select(SlackMessage.id).where(test_filter)))
+                .execution_options(synchronize_session=False)
+            )
+            cleared = db.execute(
+                delete(SlackMessage).where(test_filter).execution_options(synchronize_session=False)
+            ).rowcount
+            if cleared:
+                print(f"🗑️  Cleared {cleared} existing test messages...")
+            
+            # Bulk INSERT (one executemany instead of a flush per object)
+            db.execute(insert(SlackMessage), test_messages)
         
-        db.commit()
         print(f"✅ Successfully inserted {len(test_messages)} test messages!")
+        # Bucket scores in a single pass
+        buckets = Counter(
+            'crit' if s >= 90 else 'high' if s >= 70 else 'fyi' if s >= 50 else 'low'
+            for s in (m['priority_score'] for m in test_messages)
+        )
         print("\n📊 Messages by priority:")
-        print(f"   🔴 Needs Response: {sum(1 for m in test_messages if m['priority_score'] >= 90)}")
-        print(f"   🟡 High Priority: {sum(1 for m in test_messages if 70 <= m['priority_score'] < 90)}")
-        print(f"   🟢 FYI: {sum(1 for m in test_messages if 50 <= m['priority_score'] < 70)}")
-        print(f"   ⚪ Low Priority: {sum(1 for m in test_messages if m['priority_score'] < 50)}")
+        print(f"   🔴 Needs Response: {buckets['crit']}")
+        print(f"   🟡 High Priority: {buckets['high']}")
+        print(f"   🟢 FYI: {buckets['fyi']}")
+        print(f"   ⚪ Low Priority: {buckets['low']}")
         print("\n🌐 Dashboard: http://localhost:8501")
         print("📡 API Docs: http://localhost:8000/docs")
     finally:
@@ -10,6 +10,7 @@ Posts messages using persona bots to test the full prioritization pipeline:
 Usage:
     python scripts/live_simulation.py                    # Run all scenarios
     python scripts/live_simulation.py --scenario production-outage  # Run specific scenario
+    python scripts/live_simulation.py -s production-outage -s customer-escalation  # Run several
     python scripts/live_simulation.py --edge-cases       # Run edge case tests
     python scripts/live_simulation.py --variety          # Generate LLM variations
     python scripts/live_simulation.py --cleanup          # Remove simulation messages
@@ -19,21 +20,36 @@ Usage:
 import os
 import sys
 import json
-import time
+import hashlib
 import argparse
 import asyncio
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 
-from slack_sdk import WebClient
+from slack_sdk.web.async_client import AsyncWebClient
 from slack_sdk.errors import SlackApiError
 from dotenv import load_dotenv
-from openai import OpenAI
+
+# orjson parses/serializes faster; stdlib json works too
+try:
+    import orjson
+    _json_loads = orjson.loads
+    
+    def _json_dumps_pretty(data) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _json_loads = json.loads
+    
+    def _json_dumps_pretty(data) -> bytes:
+        return json.dumps(data, indent=2).encode()
 
 # Add parent to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from backend.rate_limiter import AsyncTokenBucket, post_message_with_backoff
+
 load_dotenv()
 
 # Configuration
@@ -45,10 +61,32 @@ YOUR_USER_ID = os.getenv("YOUR_USER_ID", "U09NR3RQZQU")
 BASE_DIR = Path(__file__).parent.parent
 CONFIG_DIR = BASE_DIR / "simulations" / "config"
 RUNS_DIR = BASE_DIR / "simulations" / "runs"
+LLM_CACHE_DIR = RUNS_DIR.parent / "llm_cache"
 
 # Ensure directories exist
 RUNS_DIR.mkdir(parents=True, exist_ok=True)
 
+# Prepended to every simulated post so cleanup can find them
+SIM_PREFIX = "[SIM] "
+_USER_MENTION = f"<@{YOUR_USER_ID}>"
+
+_PRIORITY_EMOJI = {"critical": "🔴", "high": "🟡", "medium": "🟢", "low": "⚪"}
+
+# Persona -> env var holding that persona bot's token
+_BOT_ENV_MAP = {
+    "Sarah Chen": "BOT_SARAH_TOKEN",
+    "Jordan Patel": "BOT_MANAGER_TOKEN",
+    "Marcus Johnson": "BOT_MARCUS_TOKEN",
+    "Alex Rivera": "BOT_COWORKER_TOKEN",
+    "Metrics": "BOT_METRICS_TOKEN",
+}
+
+
+@lru_cache(maxsize=None)
+def _load_config_cached(path: str) -> Dict:
+    """Parse a config file once per process (treat the result as read-only)."""
+    return _json_loads(Path(path).read_bytes())
+
 
 class LiveSimulation:
     """Posts realistic conversations to Slack for testing."""
@@ -58,30 +96,33 @@ class LiveSimulation:
         self.channels = self._init_channels()
         self.personas = self._load_config("personas.json")["personas"]
         self.channel_config = self._load_config("channels.json")["channels"]
-        self.scenarios_config = self._load_config("scenarios.json")
-        self.openai = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        self.scenarios_config = self._prepare_scenarios(self._load_config("scenarios.json"))
+        self._openai = None  # Created on first use (only --variety needs it)
         self.posted_messages: List[Dict] = []
-        
-    def _init_bots(self) -> Dict[str, WebClient]:
-        """Initialize Slack clients for each persona bot."""
+        # Shared by every concurrent post: ~54/min, under chat.postMessage's tier-3 limit
+        self.post_bucket = AsyncTokenBucket(capacity=5, rate=0.9)
+        
+    @property
+    def openai(self):
+        """OpenAI client, imported and created the first time it's needed."""
+        if self._openai is None:
+            from openai import OpenAI
+            self._openai = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        return self._openai
+    
+    def _init_bots(self) -> Dict[str, AsyncWebClient]:
+        """Initialize async Slack clients for each persona bot."""
         return {
-            "Sarah Chen": WebClient(token=os.getenv("BOT_SARAH_TOKEN")),
-            "Jordan Patel": WebClient(token=os.getenv("BOT_MANAGER_TOKEN")),  # Manager Bot renamed to Jordan Patel
-            "Marcus Johnson": WebClient(token=os.getenv("BOT_MARCUS_TOKEN")),
-            "Alex Rivera": WebClient(token=os.getenv("BOT_COWORKER_TOKEN")),  # Coworker Bot renamed to Alex Rivera
-            "Metrics": WebClient(token=os.getenv("BOT_METRICS_TOKEN")),
+            "Sarah Chen": AsyncWebClient(token=os.getenv("BOT_SARAH_TOKEN")),
+            "Jordan Patel": AsyncWebClient(token=os.getenv("BOT_MANAGER_TOKEN")),  # Manager Bot renamed to Jordan Patel
+            "Marcus Johnson": AsyncWebClient(token=os.getenv("BOT_MARCUS_TOKEN")),
+            "Alex Rivera": AsyncWebClient(token=os.getenv("BOT_COWORKER_TOKEN")),  # Coworker Bot renamed to Alex Rivera
+            "Metrics": AsyncWebClient(token=os.getenv("BOT_METRICS_TOKEN")),
         }
     
     def _get_bot_env_name(self, persona_name: str) -> str:
         """Get the expected env var name for a persona's bot token."""
-        name_map = {
-            "Sarah Chen": "BOT_SARAH_TOKEN",
-            "Jordan Patel": "BOT_MANAGER_TOKEN",
-            "Marcus Johnson": "BOT_MARCUS_TOKEN",
-            "Alex Rivera": "BOT_COWORKER_TOKEN",
-            "Metrics": "BOT_METRICS_TOKEN",
-        }
-        return name_map.get(persona_name, f"BOT_{persona_name.upper().replace(' ', '_')}_TOKEN")
+        return _BOT_ENV_MAP.get(persona_name, f"BOT_{persona_name.upper().replace(' ', '_')}_TOKEN")
     
     def _init_channels(self) -> Dict[str, str]:
         """Load channel IDs from environment."""
@@ -94,40 +135,29 @@ class LiveSimulation:
         }
     
     def _load_config(self, filename: str) -> Dict:
-        """Load a config file."""
-        with open(CONFIG_DIR / filename) as f:
-            return json.load(f)
+        """Load a config file (parsed once, shared across instances)."""
+        return _load_config_cached(str(CONFIG_DIR / filename))
     
     def check_configuration(self) -> bool:
         """Verify all required configuration is present."""
         print("\n🔍 Checking configuration...")
         
         # Check bot tokens
-        missing_bots = []
-        for name, client in self.bots.items():
-            if not client.token:
-                missing_bots.append(name)
+        missing_bots = [name for name, client in self.bots.items() if not client.token]
         
         if missing_bots:
             print(f"❌ Missing bot tokens for: {', '.join(missing_bots)}")
             print("   Add to .env:")
-            for name in missing_bots:
-                env_name = self._get_bot_env_name(name)
-                print(f"     {env_name}=xoxb-...")
+            print("".join(f"     {self._get_bot_env_name(name)}=xoxb-...\n" for name in missing_bots), end="")
             return False
         
         # Check channels
-        missing_channels = []
-        for name, channel_id in self.channels.items():
-            if not channel_id:
-                missing_channels.append(name)
+        missing_channels = [name for name, channel_id in self.channels.items() if not channel_id]
         
         if missing_channels:
             print(f"⚠️  Missing channel IDs for: {', '.join(missing_channels)}")
             print("   Add to .env (get IDs from Slack channel settings):")
-            for name in missing_channels:
-                env_name = f"CHANNEL_{name.upper().replace('-', '_')}"
-                print(f"     {env_name}=C...")
+            print("".join(f"     CHANNEL_{name.upper().replace('-', '_')}=C...\n" for name in missing_channels), end="")
         
         print("✅ Bot tokens configured")
         if not missing_channels:
@@ -136,34 +166,68 @@ class LiveSimulation:
         return len(missing_bots) == 0
     
     def list_scenarios(self):
-        """List all available scenarios."""
-        print("\n📋 Available Scenarios")
-        print("=" * 60)
+        """List all available scenarios (built up and written in one go)."""
+        parts = ["\n📋 Available Scenarios\n", "=" * 60, "\n"]
         
-        print("\n🎬 Main Scenarios:")
+        parts.append("\n🎬 Main Scenarios:\n")
         for scenario in self.scenarios_config["scenarios"]:
-            priority_emoji = {"critical": "🔴", "high": "🟡", "medium": "🟢", "low": "⚪"}.get(scenario["priority"], "⚪")
-            print(f"  {priority_emoji} {scenario['id']}: {scenario['title']}")
-            print(f"      Channel: #{scenario['channel']} | Messages: {len(scenario['messages'])}")
-            print(f"      {scenario['description']}")
-            print()
+            priority_emoji = _PRIORITY_EMOJI.get(scenario["priority"], "⚪")
+            parts.append(
+                f"  {priority_emoji} {scenario['id']}: {scenario['title']}\n"
+                f"      Channel: #{scenario['channel']} | Messages: {len(scenario['messages'])}\n"
+                f"      {scenario['description']}\n\n"
+            )
         
-        print("\n🧪 Edge Cases:")
+        parts.append("\n🧪 Edge Cases:\n")
         for edge in self.scenarios_config.get("edge_cases", []):
-            print(f"  🔬 {edge['id']}: {edge['title']}")
-            print(f"      {edge['description']}")
-            print()
+            parts.append(
+                f"  🔬 {edge['id']}: {edge['title']}\n"
+                f"      {edge['description']}\n\n"
+            )
+        
+        sys.stdout.write("".join(parts))
     
-    def _get_bot_for_persona(self, persona_name: str) -> Optional[WebClient]:
+    def _get_bot_for_persona(self, persona_name: str) -> Optional[AsyncWebClient]:
         """Get the Slack client for a persona."""
         return self.bots.get(persona_name)
     
+    def _prepare_scenario(self, scenario: Dict, unknown_personas: set) -> Dict:
+        """
+        Copy a scenario with each message's bot resolved up front.
+        
+        msg["_bot"] is the persona's client, or None when the persona has no
+        bot or its token isn't set; msg["_text"] is the text as it will be
+        posted. Copies keep the cached config untouched.
+        """
+        messages = []
+        for msg in scenario["messages"]:
+            bot = self._get_bot_for_persona(msg["persona"])
+            if bot is None:
+                unknown_personas.add(msg["persona"])
+            messages.append({
+                **msg,
+                "_bot": bot if bot is not None and bot.token else None,
+                "_text": self._format_message(msg["text"], msg.get("mention_user", False)),
+            })
+        return {**scenario, "messages": messages}
+    
+    def _prepare_scenarios(self, config: Dict) -> Dict:
+        """Resolve bots for every scenario and edge case, warning once per unknown persona."""
+        unknown_personas = set()
+        prepared = {
+            **config,
+            "scenarios": [self._prepare_scenario(s, unknown_personas) for s in config["scenarios"]],
+            "edge_cases": [self._prepare_scenario(s, unknown_personas) for s in config.get("edge_cases", [])],
+        }
+        for persona in sorted(unknown_personas):
+            print(f"⚠️  No bot configured for persona {persona}; their messages will be skipped")
+        return prepared
+    
     def _format_message(self, text: str, mention_user: bool = False) -> str:
         """Format message text, replacing @Kyle with actual user ID."""
-        if mention_user or "@Kyle" in text:
-            text = text.replace("@Kyle", f"<@{YOUR_USER_ID}>")
+        text = text.replace("@Kyle", _USER_MENTION)
         # Add simulation marker
-        return f"[SIM] {text}"
+        return SIM_PREFIX + text
     
     async def post_scenario(self, scenario: Dict) -> List[Dict]:
         """Post all messages in a scenario to Slack."""
@@ -176,7 +240,8 @@ class LiveSimulation:
             print(f"  ⚠️  No channel ID for #{channel_name}, skipping")
             return []
         
-        priority_emoji = {"critical": "🔴", "high": "🟡", "medium": "🟢", "low": "⚪"}.get(scenario.get("priority", "medium"), "⚪")
+        priority = scenario.get("priority") or "medium"
+        priority_emoji = _PRIORITY_EMOJI.get(priority, "⚪")
         
         print(f"\n{priority_emoji} {title}")
         print(f"   Channel: #{channel_name}")
@@ -185,18 +250,17 @@ class LiveSimulation:
         posted = []
         for msg in messages:
             persona = msg["persona"]
-            text = self._format_message(msg["text"], msg.get("mention_user", False))
+            text = msg["_text"]
             delay = msg.get("delay", 1)
             
-            bot = self._get_bot_for_persona(persona)
-            if not bot or not bot.token:
+            bot = msg["_bot"]
+            if bot is None:
                 print(f"  ⚠️  No bot for {persona}, skipping")
                 continue
             
             try:
-                result = bot.chat_postMessage(
-                    channel=channel_id,
-                    text=text
+                result = await post_message_with_backoff(
+                    bot, self.post_bucket, channel=channel_id, text=text
                 )
                 
                 ts = result["ts"]
@@ -212,7 +276,7 @@ class LiveSimulation:
                 })
                 
                 print(f"  ✓ [{persona}]: {msg['text'][:60]}...")
-                time.sleep(delay)
+                await asyncio.sleep(delay)
                 
             except SlackApiError as e:
                 print(f"  ❌ Slack error ({persona}): {e.response['error']}")
@@ -243,19 +307,37 @@ class LiveSimulation:
         print(f"\n🚀 Running {len(scenarios_to_run)} scenario(s)")
         print("=" * 60)
         
-        all_posted = []
+        # Scenarios in different channels run concurrently; within a channel
+        # they stay in order so conversations don't interleave
+        by_channel: Dict[str, List[Dict]] = {}
         for scenario in scenarios_to_run:
-            posted = await self.post_scenario(scenario)
-            all_posted.extend(posted)
-            time.sleep(2)  # Pause between scenarios
+            by_channel.setdefault(scenario["channel"], []).append(scenario)
+        
+        async def _run_channel(scenarios: List[Dict]) -> List[Dict]:
+            posted = []
+            for scenario in scenarios:
+                posted.extend(await self.post_scenario(scenario))
+                await asyncio.sleep(2)  # Pause between scenarios
+            return posted
+        
+        results = await asyncio.gather(*(
+            asyncio.create_task(_run_channel(scenarios))
+            for scenarios in by_channel.values()
+        ))
+        all_posted = [msg for posted in results for msg in posted]
         
         self.posted_messages = all_posted
         
         print(f"\n✅ Posted {len(all_posted)} messages across {len(scenarios_to_run)} scenarios")
         return all_posted
     
-    async def generate_variety_scenario(self) -> Dict:
-        """Use LLM to generate a new scenario variation."""
+    async def generate_variety_scenario(self, fresh: bool = False) -> Dict:
+        """
+        Use LLM to generate a new scenario variation.
+        
+        Responses are cached on disk by (model, temperature, prompt); pass
+        fresh=True to skip the cache and ask the LLM for a new one.
+        """
         print("\n🎲 Generating LLM scenario variation...")
         
         prompt = """Generate a realistic Slack conversation for a tech company's engineering team.
@@ -273,7 +355,7 @@ Use these personas:
 - Alex Rivera (DevOps Engineer)
 - Metrics (Monitoring Bot)
 
-Return JSON format:
+Return ONLY a JSON object in this format:
 {
   "id": "llm-generated-xxx",
   "title": "Scenario title",
@@ -285,22 +367,35 @@ Return JSON format:
   ]
 }"""
         
+        model = "gpt-4o-mini"
+        temperature = 0.9
+        key = hashlib.sha1(f"{model}|{temperature}|{prompt}".encode()).hexdigest()
+        cache_file = LLM_CACHE_DIR / f"{key}.json"
+        
+        if not fresh and cache_file.exists():
+            try:
+                scenario = _json_loads(cache_file.read_bytes())
+                scenario["id"] = f"llm-{datetime.now().strftime('%H%M%S')}"
+                print(f"✅ Using cached variation: {scenario['title']} (--fresh for a new one)")
+                return self._prepare_scenario(scenario, set())
+            except ValueError:
+                pass  # Corrupt cache entry - regenerate
+        
         try:
             response = self.openai.chat.completions.create(
-                model="gpt-4o-mini",
+                model=model,
                 messages=[{"role": "user", "content": prompt}],
-                temperature=0.9,
+                temperature=temperature,
+                response_format={"type": "json_object"},
             )
             
-            content = response.choices[0].message.content
-            # Extract JSON
-            start = content.find('{')
-            end = content.rfind('}') + 1
-            if start >= 0 and end > start:
-                scenario = json.loads(content[start:end])
-                scenario["id"] = f"llm-{datetime.now().strftime('%H%M%S')}"
-                print(f"✅ Generated: {scenario['title']}")
-                return scenario
+            # JSON mode guarantees the whole reply is one object
+            scenario = _json_loads(response.choices[0].message.content)
+            LLM_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            cache_file.write_bytes(_json_dumps_pretty(scenario))
+            scenario["id"] = f"llm-{datetime.now().strftime('%H%M%S')}"
+            print(f"✅ Generated: {scenario['title']}")
+            return self._prepare_scenario(scenario, set())
             
         except Exception as e:
             print(f"❌ LLM generation failed: {e}")
@@ -308,57 +403,90 @@ Return JSON format:
         return None
     
     async def cleanup_simulation_messages(self):
-        """Remove messages with [SIM] prefix from channels."""
+        """Delete messages with [SIM] prefix from channels."""
         print("\n🧹 Cleaning up simulation messages...")
         
         deleted = 0
         errors = 0
         
-        # Use the main Slack Intelligence bot for cleanup (needs channels:history)
+        # Use the main Slack Intelligence bot for reading (needs channels:history)
         token = os.getenv("SLACK_BOT_TOKEN_PERSONAL") or os.getenv("SLACK_BOT_TOKEN")
-        main_bot = WebClient(token=token)
+        main_bot = AsyncWebClient(token=token)
         
-        for channel_name, channel_id in self.channels.items():
-            if not channel_id:
-                continue
-            
+        async def _fetch_channel(channel_name: str, channel_id: str):
+            """Page through a channel's history and keep the [SIM] messages."""
+            sim_messages = []
+            cursor = None
+            try:
+                while True:
+                    result = await main_bot.conversations_history(
+                        channel=channel_id,
+                        limit=200,
+                        cursor=cursor
+                    )
+                    # We always prepend the marker, so a prefix check is enough
+                    sim_messages += [
+                        m for m in result.get("messages", [])
+                        if m.get("text", "").startswith(SIM_PREFIX)
+                    ]
+                    cursor = result.get("response_metadata", {}).get("next_cursor")
+                    if not cursor:
+                        break
+            except SlackApiError as e:
+                return channel_name, channel_id, sim_messages, e.response["error"]
+            return channel_name, channel_id, sim_messages, None
+        
+        # Read every channel at once, and find out which persona bot is which
+        # (a bot can only delete its own messages)
+        active_bots = [bot for bot in self.bots.values() if bot.token]
+        fetched, identities = await asyncio.gather(
+            asyncio.gather(*(
+                _fetch_channel(name, cid) for name, cid in self.channels.items() if cid
+            )),
+            asyncio.gather(*(bot.auth_test() for bot in active_bots), return_exceptions=True),
+        )
+        bots_by_id = {
+            identity["bot_id"]: bot
+            for bot, identity in zip(active_bots, identities)
+            if not isinstance(identity, Exception)
+        }
+        
+        to_delete = []
+        for channel_name, channel_id, sim_messages, error in fetched:
             print(f"\n  Checking #{channel_name}...")
+            if error:
+                print(f"    ❌ Error reading #{channel_name}: {error}")
+                errors += 1
+            if not sim_messages:
+                if not error:
+                    print(f"    No simulation messages found")
+                continue
             
+            print(f"    Found {len(sim_messages)} simulation messages")
+            to_delete += [(channel_id, msg) for msg in sim_messages]
+        
+        delete_bucket = AsyncTokenBucket(capacity=5, rate=0.9)
+        
+        async def _delete(channel_id: str, msg: Dict) -> bool:
+            bot = bots_by_id.get(msg.get("bot_id"), main_bot)
+            await delete_bucket.acquire()
             try:
-                # Get recent messages
-                result = main_bot.conversations_history(
-                    channel=channel_id,
-                    limit=100
-                )
-                
-                messages = result.get("messages", [])
-                sim_messages = [m for m in messages if "[SIM]" in m.get("text", "")]
-                
-                if not sim_messages:
-                    print(f"    No simulation messages found")
-                    continue
-                
-                print(f"    Found {len(sim_messages)} simulation messages")
-                
-                # Delete each simulation message
-                for msg in sim_messages:
-                    try:
-                        # Need to delete as the bot that posted it
-                        # For now, just report what would be deleted
-                        print(f"    - Would delete: {msg.get('text', '')[:50]}...")
-                        deleted += 1
-                    except Exception as e:
-                        errors += 1
-                        
+                await bot.chat_delete(channel=channel_id, ts=msg["ts"])
+                return True
             except SlackApiError as e:
-                print(f"    ❌ Error reading #{channel_name}: {e.response['error']}")
-                errors += 1
+                print(f"    ⚠️  Could not delete ({e.response['error']}): {msg.get('text', '')[:50]}...")
+                return False
+        
+        results = await asyncio.gather(*(_delete(cid, msg) for cid, msg in to_delete))
+        deleted = sum(results)
+        errors += len(results) - deleted
         
-        print(f"\n✅ Cleanup complete: {deleted} messages identified, {errors} errors")
-        print("   Note: Actual deletion requires chat:write scope on posting bot")
+        print(f"\n✅ Cleanup complete: {deleted} messages deleted, {errors} errors")
+        if errors:
+            print("   Note: Deletion requires chat:write on the bot that posted each message")
     
-    def save_run(self, posted_messages: List[Dict]) -> str:
-        """Save the simulation run to JSON."""
+    async def save_run(self, posted_messages: List[Dict]) -> str:
+        """Save the simulation run to JSON (serialized and written off the event loop)."""
         timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
         filename = f"live_sim_{timestamp}.json"
         filepath = RUNS_DIR / filename
@@ -369,8 +497,7 @@ Return JSON format:
             "messages": posted_messages,
         }
         
-        with open(filepath, "w") as f:
-            json.dump(run_data, f, indent=2)
+        await asyncio.to_thread(lambda: filepath.write_bytes(_json_dumps_pretty(run_data)))
         
         print(f"\n💾 Run saved to: {filepath}")
         return str(filepath)
@@ -378,9 +505,10 @@ Return JSON format:
 
 async def main():
     parser = argparse.ArgumentParser(description="Live Slack Simulation Runner")
-    parser.add_argument("--scenario", "-s", type=str, help="Run specific scenario by ID")
+    parser.add_argument("--scenario", "-s", type=str, action="append", help="Run specific scenario by ID (repeatable)")
     parser.add_argument("--edge-cases", "-e", action="store_true", help="Include edge case scenarios")
     parser.add_argument("--variety", "-v", action="store_true", help="Generate LLM scenario variation")
+    parser.add_argument("--fresh", action="store_true", help="With --variety, ignore the cached LLM variation")
     parser.add_argument("--cleanup", "-c", action="store_true", help="Cleanup simulation messages")
     parser.add_argument("--list", "-l", action="store_true", help="List available scenarios")
     parser.add_argument("--all", "-a", action="store_true", help="Run all scenarios including edge cases")
@@ -405,21 +533,21 @@ async def main():
     
     # Variety mode - generate LLM scenario
     if args.variety:
-        scenario = await sim.generate_variety_scenario()
+        scenario = await sim.generate_variety_scenario(fresh=args.fresh)
         if scenario:
             posted = await sim.run_scenarios([scenario["id"]])
             if posted:
-                sim.save_run(posted)
+                await sim.save_run(posted)
         return
     
     # Run scenarios
-    scenario_ids = [args.scenario] if args.scenario else None
+    scenario_ids = args.scenario  # None = all
     include_edge = args.edge_cases or args.all
     
     posted = await sim.run_scenarios(scenario_ids, include_edge_cases=include_edge)
     
     if posted:
-        sim.save_run(posted)
+        await sim.save_run(posted)
         
         print("\n" + "=" * 60)
         print("📋 NEXT STEPS")
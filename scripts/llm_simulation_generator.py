@@ -5,26 +5,28 @@ Generates realistic messages and validates prioritization accuracy.
 """
 
 import os
-import time
+import sys
 import asyncio
 import json
 from datetime import datetime
-from slack_sdk import WebClient
-from openai import OpenAI
+from slack_sdk.web.async_client import AsyncWebClient
 from dotenv import load_dotenv
 
+# Add parent to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.rate_limiter import AsyncTokenBucket, post_message_with_backoff
+
 # Load environment variables
 load_dotenv()
 
 # Initialize clients
 bots = {
-    "manager": WebClient(token=os.getenv("BOT_MANAGER_TOKEN")),
-    "coworker": WebClient(token=os.getenv("BOT_COWORKER_TOKEN")),
-    "metrics": WebClient(token=os.getenv("BOT_METRICS_TOKEN")),
+    "manager": AsyncWebClient(token=os.getenv("BOT_MANAGER_TOKEN")),
+    "coworker": AsyncWebClient(token=os.getenv("BOT_COWORKER_TOKEN")),
+    "metrics": AsyncWebClient(token=os.getenv("BOT_METRICS_TOKEN")),
 }
 
-openai_client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-
 # Your user ID
 YOUR_USER_ID = os.getenv("YOUR_USER_ID", "U09NR3RQZQU")
 
@@ -57,10 +59,20 @@ Channels you work in:
 
 class LLMSimulationGenerator:
     def __init__(self):
-        self.openai = openai_client
+        self._openai = None  # Created on first generation
         self.bots = bots
         self.your_user_id = YOUR_USER_ID
+        # ~54 posts/min across all categories, under chat.postMessage's tier-3 limit
+        self.post_bucket = AsyncTokenBucket(capacity=5, rate=0.9)
         
+    @property
+    def openai(self):
+        """AsyncOpenAI client, imported and created the first time it's needed"""
+        if self._openai is None:
+            from openai import AsyncOpenAI
+            self._openai = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        return self._openai
+    
     async def generate_messages_for_category(self, category, count=10):
         """Generate realistic messages for a specific priority category"""
         
@@ -77,7 +89,7 @@ Examples of critical messages:
 - Stakeholder escalations
 
 Make them realistic for an AI PM role. Include @mentions to the user, urgent keywords, and specific product context.
-Format as JSON array of message objects with 'text' and 'sender_role' fields.
+Return ONLY a JSON object with a 'messages' array of message objects with 'text' and 'sender_role' fields.
 """,
             
             "high_priority": f"""
@@ -92,7 +104,7 @@ Examples:
 - Technical discussions about product decisions
 
 Make them realistic and specific to the AI PM role. Include relevant keywords and context.
-Format as JSON array of message objects with 'text' and 'sender_role' fields.
+Return ONLY a JSON object with a 'messages' array of message objects with 'text' and 'sender_role' fields.
 """,
             
             "medium_priority": f"""
@@ -106,7 +118,7 @@ Examples:
 - Process announcements
 - General project status
 
-Make them realistic for an AI PM role. Format as JSON array of message objects with 'text' and 'sender_role' fields.
+Make them realistic for an AI PM role. Return ONLY a JSON object with a 'messages' array of message objects with 'text' and 'sender_role' fields.
 """,
             
             "low_priority": f"""
@@ -120,26 +132,27 @@ Examples:
 - Social updates
 - Non-work related content
 
-Make them realistic. Format as JSON array of message objects with 'text' and 'sender_role' fields.
+Make them realistic. Return ONLY a JSON object with a 'messages' array of message objects with 'text' and 'sender_role' fields.
 """
         }
         
         prompt = category_prompts[category]
         
         try:
-            response = self.openai.chat.completions.create(
+            response = await self.openai.chat.completions.create(
                 model="gpt-4o-mini",
                 messages=[
                     {"role": "system", "content": SIMULATION_CONTEXT},
                     {"role": "user", "content": prompt}
                 ],
                 temperature=0.8,
-                max_tokens=2000
+                max_tokens=2000,
+                response_format={"type": "json_object"}
             )
             
-            # Parse JSON response
+            # JSON mode guarantees a parseable object
             content = response.choices[0].message.content
-            messages = json.loads(content)
+            messages = json.loads(content).get("messages", [])
             
             return messages
             
@@ -159,30 +172,30 @@ Make them realistic. Format as JSON array of message objects with 'text' and 'se
             "automated": self.bots["metrics"]
         }
         
-        posted_count = 0
+        # The token bucket paces posts; this just bounds how many are in flight
+        semaphore = asyncio.Semaphore(4)
         
-        for i, msg in enumerate(messages):
+        async def post_one(msg):
             try:
                 # Select bot based on sender role
                 sender_role = msg.get("sender_role", "engineer")
                 bot = bot_mapping.get(sender_role, self.bots["coworker"])
                 
-                # Post message
-                result = bot.chat_postMessage(
-                    channel=channel_id,
-                    text=msg["text"]
-                )
+                async with semaphore:
+                    # Post message
+                    await post_message_with_backoff(
+                        bot, self.post_bucket, channel=channel_id, text=msg["text"]
+                    )
                 
                 print(f"✅ {category} - {sender_role}: {msg['text'][:50]}...")
-                posted_count += 1
-                
-                # Small delay between messages
-                time.sleep(0.5)
+                return True
                 
             except Exception as e:
                 print(f"❌ Error posting message: {e}")
+                return False
         
-        return posted_count
+        results = await asyncio.gather(*(post_one(msg) for msg in messages))
+        return sum(results)
     
     async def run_simulation(self, channel_id, messages_per_category=10):
         """Run the full simulation"""
@@ -196,12 +209,15 @@ Make them realistic. Format as JSON array of message objects with 'text' and 'se
         categories = ["critical", "high_priority", "medium_priority", "low_priority"]
         total_messages = 0
         
-        for category in categories:
-            print(f"🎯 Generating {category} messages...")
-            
-            # Generate messages
-            messages = await self.generate_messages_for_category(category, messages_per_category)
-            
+        # Categories are independent, so generate them all at once
+        print(f"🎯 Generating {', '.join(categories)} messages...")
+        generated = await asyncio.gather(*(
+            self.generate_messages_for_category(category, messages_per_category)
+            for category in categories
+        ))
+        
+        # Post one category at a time so each category's messages stay together
+        for category, messages in zip(categories, generated):
             if not messages:
                 print(f"❌ Failed to generate messages for {category}")
                 continue
@@ -212,9 +228,6 @@ Make them realistic. Format as JSON array of message objects with 'text' and 'se
             
             print(f"✅ Posted {posted} {category} messages")
             print()
-            
-            # Delay between categories
-            time.sleep(2)
         
         print(f"🎉 Simulation complete! Generated {total_messages} total messages")
         print()
@@ -5,8 +5,9 @@ Shows current status and recent activity.
 """
 
 import os
-import requests
 import json
+import asyncio
+import httpx
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
 
@@ -17,10 +18,10 @@ load_dotenv()
 API_PORT = int(os.getenv("API_PORT", "8000"))
 API_BASE = f"http://localhost:{API_PORT}"
 
-def get_stats():
+async def get_stats(client):
     """Get current system statistics"""
     try:
-        response = requests.get(f"{API_BASE}/api/slack/stats")
+        response = await client.get("/api/slack/stats")
         if response.status_code == 200:
             return response.json()
         else:
@@ -28,14 +29,19 @@ def get_stats():
     except:
         return None
 
-def get_inbox_summary():
+async def get_inbox_summary(client):
     """Get inbox summary by category"""
     try:
         views = ['needs_response', 'high_priority', 'fyi', 'low_priority']
         summary = {}
         
-        for view in views:
-            response = requests.get(f"{API_BASE}/api/slack/inbox?view={view}&limit=10")
+        # Fetch all views at once over the shared client
+        responses = await asyncio.gather(*(
+            client.get("/api/slack/inbox", params={'view': view, 'limit': 10})
+            for view in views
+        ))
+        
+        for view, response in zip(views, responses):
             if response.status_code == 200:
                 data = response.json()
                 summary[view] = len(data.get('messages', []))
@@ -46,44 +52,48 @@ def get_inbox_summary():
     except:
         return None
 
-def check_recent_syncs():
-    """Check if recent syncs are working"""
+def last_sync_age(stats):
+    """(seconds since the latest logged sync, its status), or None if none are logged"""
+    latest = (stats or {}).get('latest_sync') or {}
+    if not latest.get('last_sync'):
+        return None
+    # Sync logs are stored in naive UTC
+    started_at = datetime.fromisoformat(latest['last_sync'])
+    return (datetime.utcnow() - started_at).total_seconds(), latest.get('status')
+
+async def _health(client):
+    """Server health response, or None if it can't be reached"""
     try:
-        # Try a small sync to test connectivity
-        response = requests.post(f"{API_BASE}/api/slack/sync?hours_ago=1", timeout=10)
-        if response.status_code == 200:
-            data = response.json()
-            return {
-                'status': 'success',
-                'new_messages': data['fetch']['new_messages'],
-                'duration': data['duration_seconds']
-            }
-        else:
-            return {'status': 'failed', 'error': f"HTTP {response.status_code}"}
-    except Exception as e:
-        return {'status': 'failed', 'error': str(e)}
+        return await client.get("/health")
+    except httpx.HTTPError:
+        return None
 
-def main():
+async def main():
     """Show production monitoring dashboard"""
     print("📊 Slack Intelligence Production Monitor")
     print("=" * 60)
     print(f"🕐 {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print()
     
+    # Every check runs at once over one client; results are rendered below
+    async with httpx.AsyncClient(base_url=API_BASE, timeout=5) as client:
+        health_response, stats, inbox = await asyncio.gather(
+            _health(client),
+            get_stats(client),
+            get_inbox_summary(client)
+        )
+    
     # Check server health
-    try:
-        health_response = requests.get(f"{API_BASE}/health", timeout=5)
-        if health_response.status_code == 200:
-            print("🟢 Server Status: RUNNING")
-        else:
-            print("🔴 Server Status: ERROR")
-            return
-    except:
+    if health_response is None:
         print("🔴 Server Status: OFFLINE")
         return
+    if health_response.status_code == 200:
+        print("🟢 Server Status: RUNNING")
+    else:
+        print("🔴 Server Status: ERROR")
+        return
     
     # Get statistics
-    stats = get_stats()
     if stats:
         print(f"📈 Total Messages: {stats.get('total_messages', 0)}")
         print(f"📅 Last Sync: {stats.get('last_sync', 'Unknown')}")
@@ -94,7 +104,6 @@ def main():
     print()
     
     # Get inbox summary
-    inbox = get_inbox_summary()
     if inbox:
         print("📬 Inbox Summary:")
         print(f"   🚨 Needs Response: {inbox.get('needs_response', 0)}")
@@ -106,20 +115,24 @@ def main():
     
     print()
     
-    # Test recent sync
-    print("🔄 Testing Recent Sync...")
-    sync_result = check_recent_syncs()
-    if sync_result['status'] == 'success':
-        print(f"   ✅ Sync successful: {sync_result['new_messages']} new messages in {sync_result['duration']:.1f}s")
+    # Report how fresh the data is (syncs are pushed by Slack events or the
+    # scheduler; the monitor doesn't trigger one itself)
+    print("🔄 Recent Sync Activity...")
+    sync_age = last_sync_age(stats)
+    if sync_age is None:
+        print("   ⚠️  No syncs logged yet")
     else:
-        print(f"   ❌ Sync failed: {sync_result['error']}")
+        age, status = sync_age
+        icon = "✅" if status == "success" else "⚠️ "
+        print(f"   {icon} Last sync {age / 60:.0f} min ago ({status})")
     
     print()
     print("=" * 60)
     print("💡 Commands:")
     print("   Check inbox: python scripts/check_inbox.py")
     print(f"   Manual sync: curl -X POST 'http://localhost:{API_PORT}/api/slack/sync?hours_ago=2'")
+    print("   Push events: python scripts/socket_mode_bridge.py")
     print("   View logs: tail -f logs/slack_intelligence.log")
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
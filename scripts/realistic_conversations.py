@@ -12,10 +12,31 @@ Uses the new persona bot tokens:
 """
 
 import os
+import sys
+import json
 import time
-from slack_sdk import WebClient
+import asyncio
+import aiohttp
+from collections import defaultdict
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from slack_sdk.web.async_client import AsyncWebClient
+from slack_sdk.errors import SlackApiError
 from dotenv import load_dotenv
 
+# Add parent to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.rate_limiter import AsyncTokenBucket, post_message_with_backoff
+
+# orjson parses the conversation file faster; stdlib json works too
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 load_dotenv()
 
 # Get API port from environment (default 8000)
@@ -23,100 +44,119 @@ API_PORT = int(os.getenv("API_PORT", "8000"))
 
 # Bot clients representing different team members
 bots = {
-    "sarah": WebClient(token=os.getenv("BOT_SARAH_TOKEN")),      # CTO (VIP)
-    "jordan": WebClient(token=os.getenv("BOT_JORDAN_TOKEN")),    # Eng Manager (VIP)
-    "marcus": WebClient(token=os.getenv("BOT_MARCUS_TOKEN")),    # Senior Engineer
-    "alex": WebClient(token=os.getenv("BOT_ALEX_TOKEN")),        # DevOps Engineer
-    "metrics": WebClient(token=os.getenv("BOT_METRICS_TOKEN")),  # Monitoring Bot
+    "sarah": AsyncWebClient(token=os.getenv("BOT_SARAH_TOKEN")),      # CTO (VIP)
+    "jordan": AsyncWebClient(token=os.getenv("BOT_JORDAN_TOKEN")),    # Eng Manager (VIP)
+    "marcus": AsyncWebClient(token=os.getenv("BOT_MARCUS_TOKEN")),    # Senior Engineer
+    "alex": AsyncWebClient(token=os.getenv("BOT_ALEX_TOKEN")),        # DevOps Engineer
+    "metrics": AsyncWebClient(token=os.getenv("BOT_METRICS_TOKEN")),  # Monitoring Bot
 }
 
 # Your Slack user ID for @mentions
 YOUR_USER_ID = os.getenv("YOUR_USER_ID", "U09NR3RQZQU")
 
-# Channel IDs - set these in your .env
-CHANNELS = {
+# Channel IDs - set these in your .env (read once, read-only afterwards)
+CHANNELS = MappingProxyType({
     "incidents": os.getenv("CHANNEL_TEST_INCIDENTS"),
     "engineering": os.getenv("CHANNEL_TEST_ENGINEERING"),
     "product": os.getenv("CHANNEL_TEST_PRODUCT"),
     "watercooler": os.getenv("CHANNEL_TEST_WATERCOOLER"),
     "general": os.getenv("CHANNEL_GENERAL"),
+})
+
+# Channels missing from .env are looked up by name via conversations.list
+# (Tier 2), cached for 10 minutes: Slack name -> (channel ID, fetched at)
+CHANNEL_CACHE_TTL = 600
+_channel_cache = {}
+
+PRIORITY_EMOJI = {
+    "critical": "🔴",
+    "high": "🟡",
+    "medium": "🟢",
+    "low": "⚪"
 }
 
-# Realistic conversation scenarios
-CONVERSATION_THREADS = [
-    {
-        "title": "Production Outage - API Down",
-        "priority": "critical",
-        "channel": "incidents",
-        "messages": [
-            {"bot": "metrics", "text": "🚨 ALERT: API response time > 10s. Error rate spiking to 45%. Affected: /api/v1/conversations endpoint", "delay": 1},
-            {"bot": "alex", "text": "On it - checking the logs now. Seeing connection pool exhaustion on the primary DB", "delay": 3},
-            {"bot": "marcus", "text": "I pushed a change to the query optimizer yesterday. Could be related?", "delay": 2},
-            {"bot": "jordan", "text": f"<@{YOUR_USER_ID}> This is affecting 3 enterprise customers right now. What's our ETA on a fix? Should we rollback Marcus's change?", "delay": 2},
-        ]
-    },
-    {
-        "title": "Customer Escalation - Pricing Bug",
-        "priority": "critical", 
-        "channel": "incidents",
-        "messages": [
-            {"bot": "sarah", "text": "Just got off a call with Acme Corp's CEO. They're saying our system quoted wrong pricing on 5 deals this week. This is a P0.", "delay": 1},
-            {"bot": "marcus", "text": "Looking at logs... found it. Edge case in the discount calculation when multiple promo codes are stacked", "delay": 3},
-            {"bot": "sarah", "text": f"<@{YOUR_USER_ID}> I need you on a call with their CTO at 3pm to walk through the fix. Can you prepare a post-mortem doc?", "delay": 2},
-        ]
-    },
-    {
-        "title": "A/B Test Results Review",
-        "priority": "high",
-        "channel": "product",
-        "messages": [
-            {"bot": "metrics", "text": "📊 A/B Test Results: New onboarding flow\n• Variant B: +23% completion rate\n• Sample: 4,200 users\n• Statistical significance: 98%", "delay": 1},
-            {"bot": "marcus", "text": "Nice! The simplified form really helped. Should we ship it?", "delay": 2},
-            {"bot": "jordan", "text": "Before we ship - did we check mobile vs desktop breakdown? Last time mobile lagged behind", "delay": 2},
-            {"bot": "sarah", "text": f"<@{YOUR_USER_ID}> Good results. Can you write up the go/no-go recommendation for tomorrow's product review?", "delay": 2},
-        ]
-    },
-    {
-        "title": "Architecture Discussion - Vector DB",
-        "priority": "high",
-        "channel": "engineering",
-        "messages": [
-            {"bot": "marcus", "text": "Been researching vector databases for the semantic search feature. Pinecone vs Weaviate vs pgvector - thoughts?", "delay": 1},
-            {"bot": "alex", "text": "pgvector would be simplest since we're already on Postgres. But Pinecone has better performance at scale", "delay": 3},
-            {"bot": "marcus", "text": "True. We're looking at ~10M vectors initially. Pinecone's free tier won't cut it", "delay": 2},
-            {"bot": "jordan", "text": f"<@{YOUR_USER_ID}> This affects our Q4 roadmap and budget. Can you put together a comparison doc with cost projections?", "delay": 2},
-        ]
-    },
-    {
-        "title": "Sprint Planning",
-        "priority": "medium",
-        "channel": "engineering",
-        "messages": [
-            {"bot": "jordan", "text": "Morning team! Quick async standup - what's everyone working on this week?", "delay": 1},
-            {"bot": "marcus", "text": "Finishing the conversation context persistence. Should be ready for QA by Wednesday", "delay": 3},
-            {"bot": "alex", "text": "Setting up the new staging environment. Hit some IAM issues but should be resolved today", "delay": 2},
-            {"bot": "jordan", "text": "Great progress. Reminder: stakeholder demo Friday at 2pm. Make sure staging is stable by then", "delay": 3},
-        ]
-    },
-    {
-        "title": "Casual Team Chat",
-        "priority": "low",
-        "channel": "watercooler",
-        "messages": [
-            {"bot": "marcus", "text": "Anyone tried that new ramen place on 5th? Thinking about lunch", "delay": 1},
-            {"bot": "alex", "text": "The one with the spicy miso? It's 🔥 - get the extra chashu", "delay": 2},
-            {"bot": "marcus", "text": "Also found a great article on LLM fine-tuning if anyone's interested. Will share in #engineering later", "delay": 3},
-        ]
-    },
-]
-
-
-def check_bot_tokens():
-    """Verify all bot tokens are configured."""
-    missing = []
-    for name, client in bots.items():
-        if not client.token:
-            missing.append(name)
+# Realistic conversation scenarios, kept in data/realistic_conversations.json.
+# "{YOUR_USER_ID}" in message text is filled in at load time.
+CONVERSATIONS_PATH = Path(__file__).parent / "data" / "realistic_conversations.json"
+
+
+@lru_cache(maxsize=1)
+def load_conversation_threads():
+    """Load the conversation threads once (treat the result as read-only)."""
+    raw = CONVERSATIONS_PATH.read_text(encoding="utf-8").replace("{YOUR_USER_ID}", YOUR_USER_ID)
+    return _json_loads(raw)
+
+
+class ChannelRateLimiter:
+    """
+    Pacing for chat.postMessage: one post per second per channel, and at
+    most `max_concurrent` requests in flight across the workspace.
+    """
+    
+    def __init__(self, max_concurrent: int = 3, per_channel_rate: float = 1.0):
+        self._buckets = defaultdict(lambda: AsyncTokenBucket(capacity=1, rate=per_channel_rate))
+        self._in_flight = asyncio.Semaphore(max_concurrent)
+    
+    async def post(self, bot, channel_id, text):
+        """Post a message, waiting out Slack's Retry-After if we still get rate limited."""
+        return await post_message_with_backoff(
+            bot, self._buckets[channel_id], in_flight=self._in_flight,
+            channel=channel_id, text=text
+        )
+
+
+async def _refresh_channel_cache():
+    """Fill the name -> ID cache from one paginated conversations.list."""
+    client = next((bot for bot in bots.values() if bot.token), None)
+    if client is None:
+        return
+    
+    now = time.monotonic()
+    cursor = None
+    while True:
+        result = await client.conversations_list(
+            types="public_channel,private_channel",
+            exclude_archived=True,
+            limit=1000,
+            cursor=cursor
+        )
+        for channel in result.get("channels", []):
+            _channel_cache[channel["name"]] = (channel["id"], now)
+        cursor = result.get("response_metadata", {}).get("next_cursor")
+        if not cursor:
+            break
+
+
+async def resolve_channel(channel_name):
+    """Channel ID for a CHANNELS key: .env first, then a cached name lookup."""
+    channel_id = CHANNELS.get(channel_name)
+    if channel_id:
+        return channel_id
+    
+    # Test channels are named test-<name> in Slack (matching CHANNEL_TEST_*)
+    candidates = (f"test-{channel_name}", channel_name)
+    now = time.monotonic()
+    for name in candidates:
+        cached = _channel_cache.get(name)
+        if cached and now - cached[1] < CHANNEL_CACHE_TTL:
+            return cached[0]
+    
+    # Populate on the first miss rather than waiting for a scheduled refresh
+    try:
+        await _refresh_channel_cache()
+    except SlackApiError as e:
+        print(f"  ⚠️  Could not look up channels: {e.response.get('error')}")
+        return None
+    
+    for name in candidates:
+        if name in _channel_cache:
+            return _channel_cache[name][0]
+    return None
+
+
+async def check_bot_tokens():
+    """Verify every bot token is set and accepted by Slack (auth.test, all at once)."""
+    missing = [name for name, client in bots.items() if not client.token]
     
     if missing:
         print(f"❌ Missing bot tokens: {', '.join(missing)}")
@@ -125,6 +165,23 @@ def check_bot_tokens():
             env_var = f"BOT_{name.upper()}_TOKEN"
             print(f"   {env_var}=xoxb-...")
         return False
+    
+    # Catch revoked/invalid tokens now rather than mid-conversation
+    results = await asyncio.gather(
+        *(client.auth_test() for client in bots.values()),
+        return_exceptions=True
+    )
+    rejected = {
+        name: result.response.get("error") if isinstance(result, SlackApiError) else str(result)
+        for name, result in zip(bots, results)
+        if isinstance(result, Exception)
+    }
+    
+    if rejected:
+        print("❌ Slack rejected bot tokens:")
+        for name, error in rejected.items():
+            print(f"   BOT_{name.upper()}_TOKEN: {error}")
+        return False
     return True
 
 
@@ -145,7 +202,7 @@ def check_channels():
     return True
 
 
-def post_conversation_thread(thread_data):
+async def post_conversation_thread(thread_data, limiter):
     """Post a realistic conversation thread."""
     
     title = thread_data["title"]
@@ -153,22 +210,18 @@ def post_conversation_thread(thread_data):
     channel_name = thread_data["channel"]
     messages = thread_data["messages"]
     
-    channel_id = CHANNELS.get(channel_name)
+    channel_id = await resolve_channel(channel_name)
     if not channel_id:
         print(f"  ⚠️  Skipping - no channel ID for #{channel_name}")
         return False
     
-    priority_emoji = {
-        "critical": "🔴",
-        "high": "🟡",
-        "medium": "🟢",
-        "low": "⚪"
-    }[priority]
+    priority_emoji = PRIORITY_EMOJI[priority]
     
     print(f"\n{priority_emoji} {title} (#{channel_name})")
     print("-" * 60)
     
-    for msg in messages:
+    last = len(messages) - 1
+    for i, msg in enumerate(messages):
         bot_name = msg["bot"]
         text = msg["text"]
         delay = msg["delay"]
@@ -179,13 +232,11 @@ def post_conversation_thread(thread_data):
                 print(f"  ⚠️  Bot '{bot_name}' not configured, skipping")
                 continue
                 
-            result = bot.chat_postMessage(
-                channel=channel_id,
-                text=text
-            )
+            result = await limiter.post(bot, channel_id, text)
             
             print(f"  {bot_name}: {text[:70]}...")
-            time.sleep(delay)
+            if i < last:  # Only pause between messages, not after the last one
+                await asyncio.sleep(delay)
             
         except Exception as e:
             print(f"  ❌ Error ({bot_name}): {e}")
@@ -193,26 +244,48 @@ def post_conversation_thread(thread_data):
     return True
 
 
-def main():
+async def post_channel_threads(threads, limiter):
+    """Post one channel's threads in order, so its conversations don't interleave."""
+    posted = 0
+    for thread in threads:
+        if await post_conversation_thread(thread, limiter):
+            posted += 1
+        await asyncio.sleep(2)  # Pause between conversation threads
+    return posted
+
+
+async def main():
     print("🎭 Realistic AI PM Conversation Generator")
     print("=" * 60)
     print("Team: Sarah (CTO), Jordan (Manager), Marcus (Engineer), Alex (DevOps)")
     print()
     
-    # Check configuration
-    if not check_bot_tokens():
-        print("\n❌ Cannot proceed without bot tokens")
-        return
-    
-    check_channels()  # Warning only, continue anyway
-    
-    print("\nGenerating natural conversation threads...")
-    
-    posted = 0
-    for thread in CONVERSATION_THREADS:
-        if post_conversation_thread(thread):
-            posted += 1
-        time.sleep(2)  # Pause between conversation threads
+    # One keep-alive connection pool for every bot, instead of a session per request
+    async with aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=10, keepalive_timeout=60)
+    ) as session:
+        for bot in bots.values():
+            bot.session = session
+        
+        # Check configuration
+        if not await check_bot_tokens():
+            print("\n❌ Cannot proceed without bot tokens")
+            return
+        
+        check_channels()  # Warning only; missing channels are looked up by name
+        
+        print("\nGenerating natural conversation threads...")
+        
+        # Different channels post concurrently; each channel's threads stay sequential
+        by_channel = {}
+        for thread in load_conversation_threads():
+            by_channel.setdefault(thread["channel"], []).append(thread)
+        
+        limiter = ChannelRateLimiter()
+        results = await asyncio.gather(*(
+            post_channel_threads(threads, limiter) for threads in by_channel.values()
+        ))
+    posted = sum(results)
     
     print("\n" + "=" * 60)
     print(f"🎉 Posted {posted} conversation threads!")
@@ -231,4 +304,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
@@ -2,13 +2,20 @@
 """
 Comprehensive simulation runner for AI PM role.
 Generates realistic messages, syncs, and validates prioritization.
+
+Usage:
+    python scripts/run_comprehensive_simulation.py                     # Prompts for settings
+    python scripts/run_comprehensive_simulation.py --channel-id C123 -n 5
 """
 
 import os
+import sys
+import argparse
 import asyncio
-import subprocess
 import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
 from llm_simulation_generator import LLMSimulationGenerator
 
@@ -19,10 +26,18 @@ load_dotenv()
 API_PORT = int(os.getenv("API_PORT", "8000"))
 API_BASE = f"http://localhost:{API_PORT}"
 
+# One keep-alive session for every API call, retrying transient gateway errors
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=4,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+))
+
 def check_server():
     """Check if the server is running"""
     try:
-        response = requests.get(f"{API_BASE}/health", timeout=5)
+        response = SESSION.get(f"{API_BASE}/health", timeout=5)
         return response.status_code == 200
     except:
         return False
@@ -31,7 +46,7 @@ def sync_messages():
     """Sync messages from Slack"""
     print("🔄 Syncing messages...")
     try:
-        response = requests.post(f"{API_BASE}/api/slack/sync?hours_ago=1")
+        response = SESSION.post(f"{API_BASE}/api/slack/sync?hours_ago=1")
         if response.status_code == 200:
             data = response.json()
             print(f"✅ Synced {data['fetch']['new_messages']} new messages")
@@ -44,17 +59,13 @@ def sync_messages():
         return False
 
 def validate_results():
-    """Run the validation script"""
+    """Run the validator in-process (no second interpreter or re-imports)"""
     print("🔍 Validating prioritization...")
     try:
-        result = subprocess.run([
-            "python", "scripts/validate_prioritization.py"
-        ], capture_output=True, text=True, cwd=".")
+        # scripts/ is on sys.path when this runs as a script, like llm_simulation_generator
+        from archive import validate_prioritization
+        validate_prioritization.main()
         
-        print(result.stdout)
-        if result.stderr:
-            print("Errors:", result.stderr)
-            
     except Exception as e:
         print(f"❌ Validation error: {e}")
 
@@ -99,6 +110,15 @@ async def run_simulation_cycle(channel_id, messages_per_category=8):
 
 async def main():
     """Main simulation runner"""
+    parser = argparse.ArgumentParser(description="Comprehensive AI PM simulation")
+    parser.add_argument("--channel-id", default=os.getenv("SIM_CHANNEL_ID"),
+                        help="Channel to post messages to (default: $SIM_CHANNEL_ID)")
+    parser.add_argument("-n", "--messages-per-category", type=int, default=None,
+                        help="Messages per category (default 8)")
+    args = parser.parse_args()
+    
+    # Only prompt when a person is at the terminal and didn't pass the settings
+    interactive = sys.stdin.isatty() and args.channel_id is None
     
     print("🤖 AI PM Comprehensive Simulation")
     print("=" * 50)
@@ -117,7 +137,10 @@ async def main():
     print()
     
     # Get channel ID
-    channel_id = input("Enter channel ID to post messages to: ").strip()
+    channel_id = args.channel_id
+    if interactive:
+        channel_id = input("Enter channel ID to post messages to: ").strip()
+    channel_id = (channel_id or "").strip()
     
     if not channel_id:
         print("❌ Channel ID required")
@@ -128,10 +151,14 @@ async def main():
         return
     
     # Get message count
-    try:
-        messages_per_category = int(input("Messages per category (default 8): ") or "8")
-    except ValueError:
+    messages_per_category = args.messages_per_category
+    if messages_per_category is None:
         messages_per_category = 8
+        if interactive:
+            try:
+                messages_per_category = int(input("Messages per category (default 8): ") or "8")
+            except ValueError:
+                messages_per_category = 8
     
     # Run simulation
     success = await run_simulation_cycle(channel_id, messages_per_category)
@@ -9,6 +9,9 @@ Usage:
     python scripts/simulation_runner.py                    # Run with 5 messages (quick test)
     python scripts/simulation_runner.py --messages 20      # Run with more messages
     python scripts/simulation_runner.py --replay <file>    # Replay saved run
+    python scripts/simulation_runner.py --to-json <file>   # Convert a saved .ndjson run to one JSON document
+    python scripts/simulation_runner.py --no-cache         # Don't reuse cached LLM conversations
+    python scripts/simulation_runner.py --batch            # Generate via OpenAI Batch API (cheaper, slower)
 """
 
 import os
@@ -16,15 +19,37 @@ import sys
 import json
 import asyncio
 import argparse
+import hashlib
 import random
-from datetime import datetime, timedelta
+from bisect import bisect_right
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, NamedTuple, Optional, Tuple
 
 import requests
-from openai import OpenAI
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from openai import AsyncOpenAI, APIConnectionError, InternalServerError, RateLimitError
 from dotenv import load_dotenv
 
+# orjson parses/serializes faster; stdlib json works too
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+    
+    def _json_dumps_pretty(data) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _json_loads = json.loads
+    
+    def _json_dumps(data) -> bytes:
+        return json.dumps(data).encode()
+    
+    def _json_dumps_pretty(data) -> bytes:
+        return json.dumps(data, indent=2).encode()
+
 # Add parent to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -34,36 +59,25 @@ load_dotenv()
 API_PORT = int(os.getenv("API_PORT", "8000"))
 API_BASE = f"http://localhost:{API_PORT}"
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+OPENAI_CONCURRENCY = int(os.getenv("OPENAI_CONCURRENCY", "8"))
+OPENAI_MAX_ATTEMPTS = 5
 
 # Paths
 BASE_DIR = Path(__file__).parent.parent
 CONFIG_DIR = BASE_DIR / "simulations" / "config"
 RUNS_DIR = BASE_DIR / "simulations" / "runs"
+LLM_CACHE_DIR = BASE_DIR / "simulations" / "llm_cache"  # Shared with live_simulation.py
 
 # Ensure directories exist
 RUNS_DIR.mkdir(parents=True, exist_ok=True)
 
 
-class ConversationSimulator:
-    """Generates realistic conversational Slack scenarios."""
-    
-    def __init__(self):
-        self.client = OpenAI(api_key=OPENAI_API_KEY)
-        self.personas = self._load_config("personas.json")["personas"]
-        self.channels = self._load_config("channels.json")["channels"]
-        self.generated_messages: List[Dict] = []
-        self.results: List[Dict] = []
-        
-    def _load_config(self, filename: str) -> Dict:
-        with open(CONFIG_DIR / filename) as f:
-            return json.load(f)
-    
-    async def generate_scenario(self, scenario_type: str, num_messages: int = 3) -> List[Dict]:
-        """Generate a realistic conversation scenario."""
-        
-        scenarios = {
-            "incident": {
-                "prompt": """Generate a realistic Slack conversation about a production incident.
+# Static scenario instructions. The persona catalog and output format are appended
+# once in __init__, so every request for a scenario shares an identical prefix
+# that OpenAI's automatic prompt caching can reuse.
+SCENARIOS = {
+    "incident": {
+        "prompt": """Generate a realistic Slack conversation about a production incident.
 The conversation should flow naturally with different people reacting and investigating.
 
 Include:
@@ -72,99 +86,345 @@ Include:
 - Updates on findings
 - Resolution or escalation
 
-Personas available: {personas}
 Use #engineering-alerts or #incidents channel.""",
-                "channel": "incidents",
-            },
-            "feature_discussion": {
-                "prompt": """Generate a realistic Slack conversation about a feature or technical decision.
+        "channel": "incidents",
+    },
+    "feature_discussion": {
+        "prompt": """Generate a realistic Slack conversation about a feature or technical decision.
 
 Include:
 - Someone asking a question or proposing something
 - Technical discussion or clarification
 - Decision or next steps
 
-Personas available: {personas}
 Use #product or #general channel.""",
-                "channel": "product",
-            },
-            "casual": {
-                "prompt": """Generate a casual/social Slack conversation.
+        "channel": "product",
+    },
+    "casual": {
+        "prompt": """Generate a casual/social Slack conversation.
 
 Include:
 - Social chat, coffee runs, weekend plans, etc.
 - Keep it light and friendly
 
-Personas available: {personas}
 Use #random or #watercooler channel.""",
-                "channel": "watercooler",
-            }
-        }
-        
-        scenario = scenarios.get(scenario_type, scenarios["incident"])
-        persona_names = [p["name"] + f" ({p['role']})" for p in self.personas]
-        
-        prompt = f"""{scenario['prompt'].format(personas=', '.join(persona_names))}
+        "channel": "watercooler",
+    }
+}
 
-Generate exactly {num_messages} messages as a natural conversation.
-Each message should be under 200 characters.
+# Score bucket boundaries: <50 low, 50-69 medium, 70-89 high, 90+ critical
+SCORE_THRESHOLDS = (50, 70, 90)
+SCORE_BUCKET_NAMES = ("low", "medium", "high", "critical")
+
+OUTPUT_FORMAT = """Each message should be under 200 characters.
 Format as JSON array:
 [
-  {{"persona": "Name", "text": "message text", "is_thread_reply": false}},
-  {{"persona": "Name", "text": "response", "is_thread_reply": true}},
+  {"persona": "Name", "text": "message text", "is_thread_reply": false},
+  {"persona": "Name", "text": "response", "is_thread_reply": true},
   ...
 ]
 
 Make it feel like a real workplace Slack - casual language, occasional typos, emojis where natural."""
 
+
+class SimMessage(NamedTuple):
+    """One generated message (converted to a dict only when a run is saved)"""
+    id: str
+    persona: str
+    persona_role: str
+    channel: str
+    text: str
+    timestamp: float
+    thread_ts: Optional[str]
+    is_reply: bool
+    scenario_type: str
+    is_vip: bool
+    is_noise: bool
+
+
+@lru_cache(maxsize=None)
+def _sim_channel_id(channel: str) -> str:
+    """Fake Slack channel ID for a simulated channel (few distinct values, so memoized)."""
+    return f"C_SIM_{channel.upper().replace('-', '_')}"
+
+
+@lru_cache(maxsize=None)
+def _sim_user_id(persona: str) -> str:
+    """Fake Slack user ID for a persona."""
+    return f"U_SIM_{persona.upper()}"
+
+
+def _sim_message_ids(base_time: datetime, count: int) -> List[str]:
+    """Message IDs for one scenario: a shared timestamp prefix plus distinct random suffixes."""
+    prefix = f"sim_{base_time.strftime('%Y%m%d%H%M%S')}_"
+    return [f"{prefix}{n}" for n in random.sample(range(1000, 10000), count)]
+
+
+def load_run(path) -> Dict:
+    """
+    Read a saved run into one dict (timestamp, messages, results, analysis).
+    
+    Handles both the NDJSON files written as a run progresses (one record per
+    line, tagged with "type") and older single-document .json runs.
+    """
+    path = Path(path)
+    if path.suffix != ".ndjson":
+        return _json_loads(path.read_bytes())
+    
+    run = {"messages": [], "results": []}
+    with open(path, "rb") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = _json_loads(line)
+            kind = record.pop("type")
+            if kind == "message":
+                run["messages"].append(record)
+            elif kind == "result":
+                run["results"].append(record)
+            else:
+                run.update(record)  # "run" header and "summary" (holds "analysis")
+    run["message_count"] = len(run["messages"])
+    return run
+
+
+class ConversationSimulator:
+    """Generates realistic conversational Slack scenarios."""
+    
+    def __init__(self, use_cache: bool = True):
+        self.use_cache = use_cache
+        self.client = AsyncOpenAI(api_key=OPENAI_API_KEY)
+        # Chat calls retry 429s, connection errors and 5xx in _create_completion
+        # instead, so 429s honor Retry-After
+        self._chat_client = self.client.with_options(max_retries=0)
+        self._openai_semaphore = asyncio.Semaphore(OPENAI_CONCURRENCY)
+        
+        # One keep-alive session for every local API call
+        self.http = requests.Session()
+        self.http.mount("http://", HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+        ))
+        self.personas = self._load_config("personas.json")["personas"]
+        self.channels = self._load_config("channels.json")["channels"]
+        self._personas_by_name = {p["name"]: p for p in self.personas}
+        self._default_persona = self.personas[0]
+        
+        # Rendered once so only the short user message varies between calls
+        self._persona_block = ", ".join(f"{p['name']} ({p['role']})" for p in self.personas)
+        self._system_prompts = {
+            scenario_type: f"{scenario['prompt']}\n\nPersonas available: {self._persona_block}\n\n{OUTPUT_FORMAT}"
+            for scenario_type, scenario in SCENARIOS.items()
+        }
+        self.generated_messages: List[SimMessage] = []
+        self.results: List[Dict] = []
+        self.run_file: Optional[Path] = None  # NDJSON log for the current run
+        
+    def _load_config(self, filename: str) -> Dict:
+        with open(CONFIG_DIR / filename) as f:
+            return json.load(f)
+    
+    def _completion_body(self, scenario_type: str, num_messages: int) -> Dict[str, Any]:
+        """Chat completion parameters for one scenario (shared by online and batch requests)."""
+        system_prompt = self._system_prompts.get(scenario_type, self._system_prompts["incident"])
+        return {
+            "model": "gpt-4o-mini",
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": f"Generate exactly {num_messages} messages as a natural conversation, as a JSON array."},
+            ],
+            "temperature": 0.9,
+            "max_tokens": 800,
+        }
+    
+    def _parse_scenario(self, scenario_type: str, content: str) -> Optional[List[SimMessage]]:
+        """Turn the LLM's JSON array into simulation messages, or None if it isn't usable."""
         try:
-            response = self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.9,
-                max_tokens=800,
-            )
+            return self._build_scenario(scenario_type, content)
+        except (ValueError, TypeError, AttributeError) as e:
+            print(f"  ⚠️ Could not parse LLM response ({e})")
+            return None
+    
+    def _build_scenario(self, scenario_type: str, content: str) -> List[SimMessage]:
+        """Like _parse_scenario, but raises ValueError/TypeError on a bad reply."""
+        scenario = SCENARIOS.get(scenario_type, SCENARIOS["incident"])
+        
+        # Extract JSON from response (a reply cut off at max_tokens has no closing ])
+        start = content.find('[')
+        end = content.rfind(']') + 1
+        if start < 0 or end <= start:
+            raise ValueError("no JSON array in reply")
+        messages_data = _json_loads(content[start:end])
+        if not isinstance(messages_data, list) or not messages_data:
+            raise ValueError("reply is not a non-empty JSON array")
+        
+        # Add metadata
+        channel = scenario["channel"]
+        base_time = datetime.now()
+        base_ts = base_time.timestamp()
+        thread_ts = f"{base_ts:.6f}"
+        ids = _sim_message_ids(base_time, len(messages_data))
+        
+        messages = []
+        for i, msg in enumerate(messages_data):
+            persona = self._personas_by_name.get(msg.get("persona"), self._default_persona)
             
-            content = response.choices[0].message.content
-            # Extract JSON from response
-            start = content.find('[')
-            end = content.rfind(']') + 1
-            if start >= 0 and end > start:
-                messages_data = json.loads(content[start:end])
-            else:
-                print(f"  ⚠️ Could not parse LLM response, using fallback")
+            messages.append(SimMessage(
+                id=ids[i],
+                persona=persona["name"],
+                persona_role=persona["role"],
+                channel=channel,
+                text=msg.get("text", "")[:200],
+                timestamp=base_ts + i * 120,  # 2 minutes apart
+                thread_ts=thread_ts if msg.get("is_thread_reply") else None,
+                is_reply=msg.get("is_thread_reply", False),
+                scenario_type=scenario_type,
+                is_vip=persona.get("is_vip", False),
+                is_noise=persona.get("is_noise", False),
+            ))
+        
+        return messages
+    
+    async def _create_completion(self, body: Dict[str, Any]) -> str:
+        """
+        Streamed chat completion text, with at most OPENAI_CONCURRENCY in flight
+        and rate limits, connection errors and 5xx retried.
+        """
+        async with self._openai_semaphore:
+            for attempt in range(OPENAI_MAX_ATTEMPTS):
+                try:
+                    stream = await self._chat_client.chat.completions.create(**body, stream=True)
+                    # Collect deltas and join once (no quadratic str +=)
+                    chunks = [chunk.choices[0].delta.content or "" async for chunk in stream if chunk.choices]
+                    return "".join(chunks)
+                except (RateLimitError, APIConnectionError, InternalServerError) as e:
+                    if attempt == OPENAI_MAX_ATTEMPTS - 1:
+                        raise
+                    # Connection errors have no response to take Retry-After from
+                    response = getattr(e, "response", None)
+                    retry_after = response.headers.get("retry-after") if response is not None else None
+                    delay = float(retry_after) if retry_after else 2 ** attempt
+                    reason = "rate limited" if isinstance(e, RateLimitError) else "unavailable"
+                    print(f"  ⏳ OpenAI {reason}, retrying in {delay:.0f}s...")
+                    await asyncio.sleep(delay)
+    
+    def _cache_file(self, body: Dict[str, Any]) -> Path:
+        """Disk cache entry for a completion request (model, prompts, temperature, ...)."""
+        key = hashlib.sha1(json.dumps(body, sort_keys=True).encode()).hexdigest()
+        return LLM_CACHE_DIR / f"{key}.txt"
+    
+    def _cached_scenario(self, scenario_type: str, body: Dict[str, Any]) -> Optional[List[SimMessage]]:
+        """Messages from a previously cached reply for this exact request, if caching is on."""
+        if not self.use_cache:
+            return None
+        cache_file = self._cache_file(body)
+        if not cache_file.exists():
+            return None
+        
+        messages = self._parse_scenario(scenario_type, cache_file.read_text())
+        if messages is None:
+            cache_file.unlink(missing_ok=True)  # Bad entry - regenerate instead of failing every run
+        return messages
+    
+    def _store_completion(self, body: Dict[str, Any], content: str):
+        """Cache a reply (only call this once it has parsed successfully)."""
+        LLM_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        self._cache_file(body).write_text(content)
+    
+    async def generate_scenario(self, scenario_type: str, num_messages: int = 3) -> List[SimMessage]:
+        """Generate a realistic conversation scenario (reusing a cached reply when there is one)."""
+        body = self._completion_body(scenario_type, num_messages)
+        messages = self._cached_scenario(scenario_type, body)
+        if messages is not None:
+            print(f"  💾 Using cached {scenario_type} conversation (--no-cache for a new one)")
+            return messages
+        
+        try:
+            content = await self._create_completion(body)
+            messages = self._parse_scenario(scenario_type, content)
+            if messages is None:
+                print(f"  ⚠️ Using fallback for {scenario_type}")
                 return self._fallback_scenario(scenario_type, num_messages)
             
-            # Add metadata
-            channel = scenario["channel"]
-            thread_ts = f"{datetime.now().timestamp():.6f}"
-            base_time = datetime.now()
-            
-            messages = []
-            for i, msg in enumerate(messages_data):
-                persona = next((p for p in self.personas if p["name"] == msg.get("persona")), self.personas[0])
-                
-                messages.append({
-                    "id": f"sim_{datetime.now().strftime('%Y%m%d%H%M%S')}_{random.randint(1000, 9999)}",
-                    "persona": persona["name"],
-                    "persona_role": persona["role"],
-                    "channel": channel,
-                    "text": msg.get("text", "")[:200],
-                    "timestamp": (base_time + timedelta(minutes=i*2)).timestamp(),
-                    "thread_ts": thread_ts if msg.get("is_thread_reply") else None,
-                    "is_reply": msg.get("is_thread_reply", False),
-                    "scenario_type": scenario_type,
-                    "is_vip": persona.get("is_vip", False),
-                    "is_noise": persona.get("is_noise", False),
-                })
-            
+            self._store_completion(body, content)
             return messages
             
         except Exception as e:
             print(f"  ❌ Error generating scenario: {e}")
             return self._fallback_scenario(scenario_type, num_messages)
     
-    def _fallback_scenario(self, scenario_type: str, num_messages: int) -> List[Dict]:
+    async def generate_scenarios_batch(self, scenarios: List[Tuple[str, int]]) -> List[List[SimMessage]]:
+        """
+        Generate scenarios through the OpenAI Batch API (half price, no interactive rate limits).
+        
+        Uploads one request per uncached scenario, polls until the batch
+        finishes, then parses each result. Scenarios whose request failed get
+        fallback messages.
+        """
+        bodies = [self._completion_body(scenario_type, count) for scenario_type, count in scenarios]
+        generated = {}
+        for i, body in enumerate(bodies):
+            cached = self._cached_scenario(scenarios[i][0], body)
+            if cached is not None:
+                generated[i] = cached
+        
+        lines = [
+            json.dumps({
+                "custom_id": f"{i}_{scenarios[i][0]}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": body,
+            })
+            for i, body in enumerate(bodies) if i not in generated
+        ]
+        
+        if lines:
+            try:
+                batch_file = await self.client.files.create(
+                    file=("scenarios.jsonl", "\n".join(lines).encode()),
+                    purpose="batch"
+                )
+                batch = await self.client.batches.create(
+                    input_file_id=batch_file.id,
+                    endpoint="/v1/chat/completions",
+                    completion_window="24h"
+                )
+                print(f"  📦 Submitted batch {batch.id}, waiting for results...")
+                
+                # Batches usually take minutes, so back off to one poll a minute
+                delay = 5
+                while batch.status not in ("completed", "failed", "expired", "cancelled"):
+                    await asyncio.sleep(delay)
+                    delay = min(delay * 2, 60)
+                    batch = await self.client.batches.retrieve(batch.id)
+                    print(f"    ⏳ {batch.status} ({batch.request_counts.completed}/{batch.request_counts.total})")
+                
+                if batch.output_file_id:
+                    output = await self.client.files.content(batch.output_file_id)
+                    for line in output.text.splitlines():
+                        row = _json_loads(line)
+                        body = (row.get("response") or {}).get("body") or {}
+                        if body.get("choices"):
+                            i = int(row["custom_id"].split("_", 1)[0])
+                            content = body["choices"][0]["message"]["content"] or ""
+                            messages = self._parse_scenario(scenarios[i][0], content)
+                            if messages is not None:
+                                generated[i] = messages
+                                self._store_completion(bodies[i], content)
+                
+                if batch.status != "completed":
+                    print(f"  ⚠️ Batch {batch.status}, using fallback for missing scenarios")
+                
+            except Exception as e:
+                print(f"  ❌ Batch generation failed: {e}")
+        
+        return [
+            generated[i] if i in generated else self._fallback_scenario(scenario_type, count)
+            for i, (scenario_type, count) in enumerate(scenarios)
+        ]
+    
+    def _fallback_scenario(self, scenario_type: str, num_messages: int) -> List[SimMessage]:
         """Fallback if LLM generation fails."""
         fallbacks = {
             "incident": [
@@ -184,30 +444,37 @@ Make it feel like a real workplace Slack - casual language, occasional typos, em
         
         base_messages = fallbacks.get(scenario_type, fallbacks["incident"])[:num_messages]
         channel = "incidents" if scenario_type == "incident" else "general"
-        thread_ts = f"{datetime.now().timestamp():.6f}"
         base_time = datetime.now()
+        base_ts = base_time.timestamp()
+        thread_ts = f"{base_ts:.6f}"
+        ids = _sim_message_ids(base_time, len(base_messages))
         
         messages = []
         for i, msg in enumerate(base_messages):
-            persona = next((p for p in self.personas if p["name"] == msg["persona"]), self.personas[0])
-            messages.append({
-                "id": f"sim_{datetime.now().strftime('%Y%m%d%H%M%S')}_{random.randint(1000, 9999)}",
-                "persona": persona["name"],
-                "persona_role": persona.get("role", "Unknown"),
-                "channel": channel,
-                "text": msg["text"],
-                "timestamp": (base_time + timedelta(minutes=i*2)).timestamp(),
-                "thread_ts": thread_ts if i > 0 else None,
-                "is_reply": i > 0,
-                "scenario_type": scenario_type,
-                "is_vip": persona.get("is_vip", False),
-                "is_noise": persona.get("is_noise", False),
-            })
+            persona = self._personas_by_name.get(msg["persona"], self._default_persona)
+            messages.append(SimMessage(
+                id=ids[i],
+                persona=persona["name"],
+                persona_role=persona.get("role", "Unknown"),
+                channel=channel,
+                text=msg["text"],
+                timestamp=base_ts + i * 120,  # 2 minutes apart
+                thread_ts=thread_ts if i > 0 else None,
+                is_reply=i > 0,
+                scenario_type=scenario_type,
+                is_vip=persona.get("is_vip", False),
+                is_noise=persona.get("is_noise", False),
+            ))
         
         return messages
 
-    async def generate_all_messages(self, total_messages: int = 5) -> List[Dict]:
-        """Generate conversational scenarios totaling approximately the target message count."""
+    async def generate_all_messages(self, total_messages: int = 5, batch: bool = False) -> List[SimMessage]:
+        """
+        Generate conversational scenarios totaling approximately the target message count.
+        
+        With batch=True the scenarios go through the OpenAI Batch API instead
+        of concurrent chat completions (cheaper, but can take minutes).
+        """
         print(f"\n🎲 Generating ~{total_messages} messages across scenarios...")
         
         all_messages = []
@@ -235,19 +502,55 @@ Make it feel like a real workplace Slack - casual language, occasional typos, em
             ]
         
         for scenario_type, count in scenarios:
-            print(f"\n  📝 Generating {scenario_type} scenario ({count} messages)...")
-            messages = await self.generate_scenario(scenario_type, count)
+            print(f"  📝 Generating {scenario_type} scenario ({count} messages)...")
+        
+        if batch:
+            results = await self.generate_scenarios_batch(scenarios)
+        else:
+            # Scenarios are independent, so request them all at once
+            results = await asyncio.gather(
+                *[self.generate_scenario(t, c) for t, c in scenarios],
+                return_exceptions=True
+            )
+        
+        for (scenario_type, count), messages in zip(scenarios, results):
+            if isinstance(messages, Exception):
+                print(f"  ❌ Error generating {scenario_type} scenario: {messages}")
+                messages = self._fallback_scenario(scenario_type, count)
             
+            print(f"\n  ✅ {scenario_type}:")
             for msg in messages:
-                print(f"    ✓ [{msg['persona']}] #{msg['channel']}: {msg['text'][:50]}...")
+                print(f"    ✓ [{msg.persona}] #{msg.channel}: {msg.text[:50]}...")
             
             all_messages.extend(messages)
+            self._append_records("message", [msg._asdict() for msg in messages])
         
         self.generated_messages = all_messages
         print(f"\n✅ Generated {len(all_messages)} messages in {len(scenarios)} scenario(s)")
         return all_messages
 
-    def insert_messages_to_db(self) -> bool:
+    def _message_rows(self) -> List[Dict]:
+        """Generated messages as slack_messages column values."""
+        return [
+            {
+                "message_id": msg.id,
+                "channel_id": _sim_channel_id(msg.channel),
+                "channel_name": msg.channel,
+                "user_id": _sim_user_id(msg.persona),
+                "user_name": msg.persona,
+                "text": msg.text,
+                "timestamp": datetime.fromtimestamp(msg.timestamp),
+                "thread_ts": msg.thread_ts,
+                "is_thread_parent": not msg.is_reply,
+            }
+            for msg in self.generated_messages
+        ]
+
+    async def insert_messages_to_db(self) -> bool:
+        """Insert generated messages directly to database without blocking the event loop."""
+        return await asyncio.to_thread(self._insert_messages_to_db_sync)
+
+    def _insert_messages_to_db_sync(self) -> bool:
         """Insert generated messages directly to database."""
         print("\n📥 Inserting messages to database...")
         
@@ -255,24 +558,13 @@ Make it feel like a real workplace Slack - casual language, occasional typos, em
         from backend.database.models import SlackMessage
         
         db = SessionLocal()
-        inserted = 0
         
         try:
-            for msg in self.generated_messages:
-                slack_msg = SlackMessage(
-                    message_id=msg["id"],
-                    channel_id=f"C_SIM_{msg['channel'].upper().replace('-', '_')}",
-                    channel_name=msg["channel"],
-                    user_id=f"U_SIM_{msg['persona'].upper()}",
-                    user_name=msg["persona"],
-                    text=msg["text"],
-                    timestamp=datetime.fromtimestamp(msg["timestamp"]),
-                    thread_ts=msg.get("thread_ts"),
-                    is_thread_parent=not msg.get("is_reply", False),
-                )
-                db.add(slack_msg)
-                inserted += 1
-                
+            # One executemany INSERT instead of building an ORM object per row
+            rows = self._message_rows()
+            db.bulk_insert_mappings(SlackMessage, rows)
+            inserted = len(rows)
+            
             db.commit()
             print(f"✅ Inserted {inserted}/{len(self.generated_messages)} messages")
             return True
@@ -289,7 +581,7 @@ Make it feel like a real workplace Slack - casual language, occasional typos, em
         print("\n🧠 Triggering prioritization...")
         
         try:
-            response = requests.post(
+            response = self.http.post(
                 f"{API_BASE}/api/slack/sync",
                 params={"hours_ago": 1},
                 timeout=60
@@ -307,12 +599,58 @@ Make it feel like a real workplace Slack - casual language, occasional typos, em
             print(f"❌ Error during prioritization: {e}")
             return False
 
+    def prioritize_batch(self) -> Optional[bool]:
+        """
+        Send the generated messages to the server to save and prioritize in one call.
+        
+        The server returns the scored messages, which become self.results.
+        Returns None if the server has no batch endpoint (caller should fall
+        back to insert_messages_to_db + trigger_prioritization).
+        """
+        print("\n🧠 Sending messages for batch prioritization...")
+        
+        rows = [{**row, "timestamp": row["timestamp"].isoformat()} for row in self._message_rows()]
+        
+        try:
+            response = self.http.post(
+                f"{API_BASE}/api/slack/prioritize_batch",
+                json={"messages": rows},
+                timeout=120
+            )
+            
+            if response.status_code == 404:
+                print("  ℹ️  Server has no batch endpoint, using insert + sync")
+                return None
+            if response.status_code == 200:
+                data = response.json()
+                print(f"✅ Saved {data.get('saved', 0)}, prioritized {data.get('prioritization', {}).get('prioritized', 0)} messages")
+                self.results = data.get("messages", [])
+                return True
+            print(f"❌ Batch prioritization failed: {response.text}")
+            return False
+            
+        except Exception as e:
+            print(f"❌ Error during batch prioritization: {e}")
+            return False
+
+    async def insert_and_prioritize(self) -> bool:
+        """Get the generated messages into the DB and prioritized, with their scores in self.results."""
+        fused = self.prioritize_batch()
+        if fused is not None:
+            return fused
+        
+        if not await self.insert_messages_to_db():
+            return False
+        self.trigger_prioritization()
+        self.results = self.fetch_results()
+        return True
+
     def fetch_results(self) -> List[Dict]:
         """Fetch prioritized results from inbox."""
         print("\n📊 Fetching results...")
         
         try:
-            response = requests.get(
+            response = self.http.get(
                 f"{API_BASE}/api/slack/inbox",
                 params={"view": "all", "limit": 50},
                 timeout=30
@@ -353,17 +691,10 @@ Make it feel like a real workplace Slack - casual language, occasional typos, em
             "by_scenario": {},
         }
         
+        # bisect picks the bucket in one C-level search per message
+        buckets = [analysis["by_score"][name] for name in SCORE_BUCKET_NAMES]
         for msg in results:
-            score = msg.get("priority_score", 0)
-            
-            if score >= 90:
-                analysis["by_score"]["critical"].append(msg)
-            elif score >= 70:
-                analysis["by_score"]["high"].append(msg)
-            elif score >= 50:
-                analysis["by_score"]["medium"].append(msg)
-            else:
-                analysis["by_score"]["low"].append(msg)
+            buckets[bisect_right(SCORE_THRESHOLDS, msg.get("priority_score") or 0)].append(msg)
         
         # Print summary
         print(f"\n  Score Distribution:")
@@ -380,17 +711,16 @@ Make it feel like a real workplace Slack - casual language, occasional typos, em
         
         return analysis
 
+    def _append_records(self, kind: str, records: List[Dict]):
+        """Append records to the current run's NDJSON file (no-op outside run_simulation)."""
+        if self.run_file is None or not records:
+            return
+        with open(self.run_file, "ab") as f:
+            f.writelines(_json_dumps({"type": kind, **record}) + b"\n" for record in records)
+
     def save_run(self, analysis: Dict) -> str:
-        """Save the full simulation run to JSON."""
-        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-        filename = f"{timestamp}.json"
-        filepath = RUNS_DIR / filename
-        
-        run_data = {
-            "timestamp": datetime.now().isoformat(),
-            "message_count": len(self.generated_messages),
-            "messages": self.generated_messages,
-            "results": self.results,
+        """Finish the run file with the analysis summary (messages/results are already in it)."""
+        self._append_records("summary", [{
             "analysis": {
                 "total": analysis.get("total", 0),
                 "critical": len(analysis.get("by_score", {}).get("critical", [])),
@@ -398,15 +728,12 @@ Make it feel like a real workplace Slack - casual language, occasional typos, em
                 "medium": len(analysis.get("by_score", {}).get("medium", [])),
                 "low": len(analysis.get("by_score", {}).get("low", [])),
             },
-        }
+        }])
         
-        with open(filepath, "w") as f:
-            json.dump(run_data, f, indent=2)
-        
-        print(f"\n💾 Saved run to: {filepath}")
-        return str(filepath)
+        print(f"\n💾 Saved run to: {self.run_file}")
+        return str(self.run_file)
 
-    async def run_simulation(self, num_messages: int = 5):
+    async def run_simulation(self, num_messages: int = 5, batch: bool = False):
         """Run full simulation."""
         print("=" * 60)
         print("🚀 CONVERSATION SIMULATION RUNNER")
@@ -415,7 +742,7 @@ Make it feel like a real workplace Slack - casual language, occasional typos, em
         
         # Check server
         try:
-            response = requests.get(f"{API_BASE}/health", timeout=5)
+            response = self.http.get(f"{API_BASE}/health", timeout=5)
             if response.status_code != 200:
                 print(f"❌ Server not healthy. Start it first.")
                 return
@@ -426,19 +753,21 @@ Make it feel like a real workplace Slack - casual language, occasional typos, em
         
         print("✅ Server is running")
         
+        # Each stage appends to the run file as it finishes, so a crashed run keeps what it had
+        now = datetime.now()
+        self.run_file = RUNS_DIR / f"{now.strftime('%Y-%m-%d_%H-%M-%S')}.ndjson"
+        self._append_records("run", [{"timestamp": now.isoformat(), "target_messages": num_messages}])
+        
         # Generate conversational messages
-        await self.generate_all_messages(num_messages)
+        await self.generate_all_messages(num_messages, batch=batch)
         
-        # Insert to DB
-        if not self.insert_messages_to_db():
+        # Insert to DB, prioritize and collect the scored messages
+        if not await self.insert_and_prioritize():
             print("❌ Failed to insert messages")
             return
+        self._append_records("result", self.results)
         
-        # Trigger prioritization
-        self.trigger_prioritization()
-        
-        # Fetch and analyze results
-        self.results = self.fetch_results()
+        # Analyze results
         analysis = self.analyze_results(self.results)
         
         # Save run
@@ -455,16 +784,13 @@ Make it feel like a real workplace Slack - casual language, occasional typos, em
         """Replay a saved simulation run."""
         print(f"🔄 Replaying simulation from: {run_file}")
         
-        with open(run_file) as f:
-            run_data = json.load(f)
+        run_data = load_run(run_file)
         
-        self.generated_messages = run_data["messages"]
+        self.generated_messages = [SimMessage(**msg) for msg in run_data["messages"]]
         print(f"  Loaded {len(self.generated_messages)} messages from saved run")
         
         # Re-insert and re-prioritize
-        self.insert_messages_to_db()
-        self.trigger_prioritization()
-        self.results = self.fetch_results()
+        await self.insert_and_prioritize()
         
         analysis = self.analyze_results(self.results)
         
@@ -475,15 +801,27 @@ Make it feel like a real workplace Slack - casual language, occasional typos, em
 async def main():
     parser = argparse.ArgumentParser(description="Conversation Simulation Runner")
     parser.add_argument("--messages", "-m", type=int, default=5, help="Target number of messages (default: 5)")
-    parser.add_argument("--replay", type=str, help="Path to a saved run JSON file to replay")
+    parser.add_argument("--replay", type=str, help="Path to a saved run (.ndjson or .json) to replay")
+    parser.add_argument("--to-json", type=str, metavar="RUN", help="Convert a saved .ndjson run to a single indented .json file and exit")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore cached LLM conversations and generate new ones")
+    parser.add_argument("--batch", action="store_true", help="Generate via the OpenAI Batch API (50%% cheaper, can take minutes)")
     args = parser.parse_args()
     
-    simulator = ConversationSimulator()
+    if args.to_json:
+        out = Path(args.to_json).with_suffix(".json")
+        out.write_bytes(_json_dumps_pretty(load_run(args.to_json)))
+        print(f"💾 Wrote {out}")
+        return
+    
+    simulator = ConversationSimulator(use_cache=not args.no_cache)
     
-    if args.replay:
-        await simulator.replay_run(args.replay)
-    else:
-        await simulator.run_simulation(args.messages)
+    try:
+        if args.replay:
+            await simulator.replay_run(args.replay)
+        else:
+            await simulator.run_simulation(args.messages, batch=args.batch)
+    finally:
+        simulator.http.close()
 
 
 if __name__ == "__main__":
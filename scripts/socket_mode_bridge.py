@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Socket Mode bridge - pushes Slack events to the local API.
+
+Holds a Socket Mode WebSocket open and forwards message / app_mention events
+to the API's Events endpoint (/api/slack/events), which syncs just the
+affected channel. Use this instead of scheduled syncs when the API isn't
+reachable from Slack (no public URL for the Events API).
+
+Requires an app-level token (xapp-..., connections:write) in SLACK_APP_TOKEN
+and the app subscribed to message.channels and app_mention.
+
+Run only one Socket Mode consumer per app token - Slack spreads events across
+all open connections, so two consumers would each see only some of them. If
+hybrid_notification_monitor.py runs alongside this bridge, start it with
+MONITOR_SOCKET_MODE=0; it then gets the bridged messages from the API's inbox
+stream.
+
+Usage:
+    python scripts/socket_mode_bridge.py
+"""
+
+import os
+import asyncio
+import httpx
+from datetime import datetime
+from dotenv import load_dotenv
+from slack_sdk.socket_mode.aiohttp import SocketModeClient
+from slack_sdk.socket_mode.request import SocketModeRequest
+from slack_sdk.socket_mode.response import SocketModeResponse
+
+# Load environment variables
+load_dotenv()
+
+# Get API port from environment (default 8000)
+API_PORT = int(os.getenv("API_PORT", "8000"))
+API_BASE = f"http://localhost:{API_PORT}"
+SLACK_APP_TOKEN = os.getenv("SLACK_APP_TOKEN")
+
+FORWARDED_EVENTS = {"message", "app_mention"}
+
+
+async def main():
+    """Forward Socket Mode events to the local API until interrupted"""
+    if not SLACK_APP_TOKEN:
+        print("❌ SLACK_APP_TOKEN not set (needs an xapp-... app-level token)")
+        return
+    
+    async with httpx.AsyncClient(base_url=API_BASE, timeout=10.0) as http:
+        socket_client = SocketModeClient(app_token=SLACK_APP_TOKEN)
+        
+        async def handle(client: SocketModeClient, req: SocketModeRequest):
+            # Ack first so Slack doesn't redeliver
+            await client.send_socket_mode_response(SocketModeResponse(envelope_id=req.envelope_id))
+            if req.type != "events_api":
+                return
+            
+            event = req.payload.get("event", {})
+            if event.get("type") not in FORWARDED_EVENTS:
+                return
+            
+            # The payload is the same event_callback body the Events API would POST
+            try:
+                response = await http.post("/api/slack/events", json=req.payload)
+                status = "✅" if response.status_code == 200 else f"⚠️  HTTP {response.status_code}"
+            except httpx.HTTPError as e:
+                status = f"❌ {e}"
+            
+            timestamp = datetime.now().strftime("%H:%M:%S")
+            print(f"[{timestamp}] {event.get('type')} in {event.get('channel')} {status}")
+        
+        socket_client.socket_mode_request_listeners.append(handle)
+        await socket_client.connect()
+        
+        print("🔌 Socket Mode connected - forwarding events to", API_BASE)
+        print("Press Ctrl+C to stop")
+        
+        try:
+            await asyncio.Event().wait()
+        finally:
+            await socket_client.close()
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        print("\n👋 Bridge stopped")
@@ -7,6 +7,7 @@ Tests all services before Railway deployment.
 import sys
 import os
 import asyncio
+import httpx
 from pathlib import Path
 
 # Add backend to path
@@ -21,20 +22,42 @@ from backend.config import settings
 
 console = Console()
 
+# Results table order (probes finish in any order when run concurrently)
+RESULT_ORDER = [
+    "Database (SQLite)",
+    "Slack Bot Token",
+    "Slack User Token",
+    "Slack Connection",
+    "OpenAI API",
+    "AI Prioritization",
+    "Exa API",
+    "Jira API",
+    "Notion API",
+]
+
 class IntegrationTester:
     def __init__(self):
         self.results = {}
+        # One connection pool for the HTTP probes (Jira, Notion)
+        self.http = httpx.AsyncClient(
+            timeout=10.0,
+            limits=httpx.Limits(max_connections=10, max_keepalive_connections=10)
+        )
+    
+    async def aclose(self):
+        """Close the shared HTTP client"""
+        await self.http.aclose()
         
     async def test_slack_connection(self):
         """Test Slack API connection"""
         try:
-            from slack_sdk import WebClient
+            from slack_sdk.web.async_client import AsyncWebClient
             
             console.print("\n[cyan]Testing Slack connection...[/cyan]")
-            bot_client = WebClient(token=settings.SLACK_BOT_TOKEN)
+            bot_client = AsyncWebClient(token=settings.SLACK_BOT_TOKEN)
             
             # Test bot token
-            response = bot_client.auth_test()
+            response = await bot_client.auth_test()
             bot_user = response.get("user", "Unknown")
             
             self.results["Slack Bot Token"] = {
@@ -45,8 +68,8 @@ class IntegrationTester:
             
             # Test user token (if available)
             if settings.SLACK_USER_TOKEN:
-                user_client = WebClient(token=settings.SLACK_USER_TOKEN)
-                user_response = user_client.auth_test()
+                user_client = AsyncWebClient(token=settings.SLACK_USER_TOKEN)
+                user_response = await user_client.auth_test()
                 user_name = user_response.get("user", "Unknown")
                 self.results["Slack User Token"] = {
                     "status": "✅ PASS",
@@ -113,8 +136,8 @@ class IntegrationTester:
             console.print("[cyan]Testing Exa API connection...[/cyan]")
             exa = Exa(api_key=settings.EXA_API_KEY)
             
-            # Simple search test
-            results = exa.search("Python FastAPI", num_results=2)
+            # Simple search test (exa_py is blocking, so keep it off the event loop)
+            results = await asyncio.to_thread(exa.search, "Python FastAPI", num_results=2)
             
             self.results["Exa API"] = {
                 "status": "✅ PASS",
@@ -154,28 +177,26 @@ class IntegrationTester:
                 return
             
             # Test connection by making a simple API call
-            import httpx
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(
-                    f"{jira_service.base_url}/rest/api/3/myself",
-                    headers={
-                        "Authorization": jira_service.auth_header,
-                        "Accept": "application/json"
-                    }
-                )
-                if response.status_code == 200:
-                    user_info = response.json()
-                    self.results["Jira API"] = {
-                        "status": "✅ PASS",
-                        "detail": f"Connected as {user_info.get('displayName', 'user')} to {settings.JIRA_PROJECT_KEY}",
-                        "error": None
-                    }
-                else:
-                    self.results["Jira API"] = {
-                        "status": "❌ FAIL",
-                        "detail": f"API returned {response.status_code}",
-                        "error": response.text[:100]
-                    }
+            response = await self.http.get(
+                f"{jira_service.base_url}/rest/api/3/myself",
+                headers={
+                    "Authorization": jira_service.auth_header,
+                    "Accept": "application/json"
+                }
+            )
+            if response.status_code == 200:
+                user_info = response.json()
+                self.results["Jira API"] = {
+                    "status": "✅ PASS",
+                    "detail": f"Connected as {user_info.get('displayName', 'user')} to {settings.JIRA_PROJECT_KEY}",
+                    "error": None
+                }
+            else:
+                self.results["Jira API"] = {
+                    "status": "❌ FAIL",
+                    "detail": f"API returned {response.status_code}",
+                    "error": response.text[:100]
+                }
             
         except Exception as e:
             self.results["Jira API"] = {
@@ -195,32 +216,29 @@ class IntegrationTester:
                 }
                 return
                 
-            import httpx
-            
             console.print("[cyan]Testing Notion connection...[/cyan]")
             
             # Simple API test
-            async with httpx.AsyncClient() as client:
-                headers = {
-                    "Authorization": f"Bearer {settings.NOTION_API_KEY}",
-                    "Notion-Version": "2022-06-28"
-                }
-                response = await client.get(
-                    f"https://api.notion.com/v1/databases/{settings.NOTION_DATABASE_ID}",
-                    headers=headers
-                )
+            headers = {
+                "Authorization": f"Bearer {settings.NOTION_API_KEY}",
+                "Notion-Version": "2022-06-28"
+            }
+            response = await self.http.get(
+                f"https://api.notion.com/v1/databases/{settings.NOTION_DATABASE_ID}",
+                headers=headers
+            )
+            
+            if response.status_code == 200:
+                data = response.json()
+                db_name = data.get("title", [{}])[0].get("plain_text", "Unknown")
                 
-                if response.status_code == 200:
-                    data = response.json()
-                    db_name = data.get("title", [{}])[0].get("plain_text", "Unknown")
-                    
-                    self.results["Notion API"] = {
-                        "status": "✅ PASS",
-                        "detail": f"Connected to database: {db_name}",
-                        "error": None
-                    }
-                else:
-                    raise Exception(f"HTTP {response.status_code}: {response.text}")
+                self.results["Notion API"] = {
+                    "status": "✅ PASS",
+                    "detail": f"Connected to database: {db_name}",
+                    "error": None
+                }
+            else:
+                raise Exception(f"HTTP {response.status_code}: {response.text}")
             
         except Exception as e:
             self.results["Notion API"] = {
@@ -316,7 +334,11 @@ class IntegrationTester:
         table.add_column("Status", width=12)
         table.add_column("Details", width=40)
         
-        for name, result in self.results.items():
+        ordered = sorted(
+            self.results.items(),
+            key=lambda item: RESULT_ORDER.index(item[0]) if item[0] in RESULT_ORDER else len(RESULT_ORDER)
+        )
+        for name, result in ordered:
             status_color = {
                 "✅ PASS": "green",
                 "❌ FAIL": "red",
@@ -372,13 +394,36 @@ async def main():
         
         task = progress.add_task("Running integration tests...", total=None)
         
+        # Database first: init_db creates the tables the prioritizer reads preferences from
         await tester.test_database_connection()
-        await tester.test_slack_connection()
-        await tester.test_openai_connection()
-        await tester.test_ai_prioritization()
-        await tester.test_exa_connection()
-        await tester.test_jira_connection()
-        await tester.test_notion_connection()
+        
+        # The rest are independent network probes - run them side by side.
+        # Each writes its own results key; return_exceptions keeps one
+        # crashing probe from cancelling the others.
+        probes = {
+            "Slack Connection": tester.test_slack_connection,
+            "OpenAI API": tester.test_openai_connection,
+            "AI Prioritization": tester.test_ai_prioritization,
+            "Exa API": tester.test_exa_connection,
+            "Jira API": tester.test_jira_connection,
+            "Notion API": tester.test_notion_connection,
+        }
+        try:
+            outcomes = await asyncio.gather(
+                *(probe() for probe in probes.values()),
+                return_exceptions=True
+            )
+        finally:
+            await tester.aclose()
+        
+        # A probe that raised past its own handler still counts as a failure
+        for name, outcome in zip(probes, outcomes):
+            if isinstance(outcome, BaseException):
+                tester.results[name] = {
+                    "status": "❌ FAIL",
+                    "detail": "Test crashed",
+                    "error": str(outcome) or type(outcome).__name__
+                }
         
         progress.update(task, completed=True)
     